@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Asynchronous HTTP engine for the LinkedIn guest job endpoints
+Walks the paginated listing API and the job detail pages concurrently over a
+keep-alive connection pool, under a token-bucket rate limit and a max-in-flight cap
+"""
+
+import asyncio
+import importlib.util
+import time
+from urllib.parse import urlencode
+
+import httpx
+
+from fetch_policy import CircuitOpenError, FetchError, FetchPolicy
+from scrape_metrics import METRICS
+
+GUEST_LISTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?{query}&start={start}"
+GUEST_DETAIL_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+class TokenBucket:
+    """Token-bucket rate limiter: `rate` tokens per second with bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class FetchStats:
+    """Request counters, latency samples and transfer volume for one crawl"""
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.bytes = 0
+        self.latencies = []
+        # Listing pages that still failed after a retry; the crawl is partial when there are any
+        self.failed_pages = []
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, latency, nbytes, ok=True):
+        self.requests += 1
+        self.failures += 0 if ok else 1
+        self.bytes += nbytes
+        self.latencies.append(latency)
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def report(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'seconds': round(elapsed, 3),
+            'requests_per_second': round(self.requests / elapsed, 2) if elapsed else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 1),
+            'p99_ms': round(self.percentile(99) * 1000, 1),
+            'bytes': self.bytes,
+            'failed_pages': len(self.failed_pages),
+            'complete': not self.failed_pages,
+        }
+
+    def print_report(self):
+        report = self.report()
+        print(f"Requests: {report['requests']} ({report['failures']} failed) in {report['seconds']}s "
+              f"= {report['requests_per_second']} req/s")
+        print(f"Latency: p50 {report['p50_ms']} ms, p99 {report['p99_ms']} ms")
+        print(f"Transferred: {report['bytes']:,} bytes")
+        if self.failed_pages:
+            print(f"⚠️  Partial listing: {len(self.failed_pages)} listing page(s) failed after a retry: "
+                  f"{', '.join(self.failed_pages)}")
+
+class AsyncJobFetcher:
+    """Concurrent crawler for the paginated guest listing endpoint and its detail pages"""
+
+    def __init__(self, listing_url=GUEST_LISTING_URL, detail_url=GUEST_DETAIL_URL, company_id=None, keywords=None,
+                 rate=5.0, burst=None, max_in_flight=8, page_size=25, max_pages=40, headers=None,
+                 http2=True, timeout=20.0, cache=None, recorder=None, policy=None):
+        self.listing_url = listing_url
+        self.detail_url = detail_url
+        if not (company_id or keywords):
+            raise ValueError("AsyncJobFetcher needs a company_id or keywords to search for")
+        self.company_id = company_id
+        self.keywords = keywords
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # Connection management belongs to the pool (and is illegal over HTTP/2)
+        self.headers = {name: value for name, value in dict(headers or {}).items()
+                        if name.lower() not in ('connection', 'keep-alive')}
+        # HTTP/2 needs the optional h2 package; fall back to keep-alive HTTP/1.1 without it
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.timeout = timeout
+        self.cache = cache
+        self.recorder = recorder
+        self.policy = policy or FetchPolicy()
+        self.stats = FetchStats()
+
+    def listing_query(self):
+        """Search parameters: the f_C company filter when the company ID is known, else free-text keywords"""
+        params = {'f_C': self.company_id} if self.company_id else {'keywords': self.keywords}
+        return urlencode(params)
+
+    def make_client(self):
+        limits = httpx.Limits(max_connections=self.max_in_flight,
+                              max_keepalive_connections=self.max_in_flight)
+        return httpx.AsyncClient(headers=self.headers, http2=self.http2, limits=limits,
+                                 timeout=self.timeout, follow_redirects=True)
+
+    async def request(self, client, url, headers=None):
+        """One policy-wrapped GET with stats recorded; returns the response, or None if it failed"""
+        start = time.perf_counter()
+        try:
+            response = await self.policy.aget(client, url, throttle=self.bucket.acquire, headers=headers)
+        except FetchError as e:
+            self.stats.record(time.perf_counter() - start, 0, ok=False)
+            METRICS.count('async.fetch_errors')
+            if not isinstance(e, CircuitOpenError):
+                print(f"Error fetching {e}")
+            return None
+        elapsed = time.perf_counter() - start
+        self.stats.record(elapsed, response.num_bytes_downloaded, ok=response.status_code in (200, 304))
+        METRICS.observe('async.fetch', elapsed)
+        METRICS.count('async.bytes', response.num_bytes_downloaded)
+        return response
+
+    async def fetch(self, client, url):
+        """GET one URL under the rate limit and in-flight cap; returns the body text or None"""
+        await self.bucket.acquire()
+        async with self.in_flight:
+            entry = self.cache.lookup(url) if self.cache else None
+            response = await self.request(client, url, self.cache.validators(entry) if entry else None)
+            if response is None:
+                return None
+
+            if response.status_code == 304 and entry:
+                body = self.cache.load(entry)
+                if body is not None:
+                    self.cache.refresh(entry)
+                    if self.recorder:
+                        self.recorder.add(url, body, 200, entry.get('headers', {}).get('Content-Type', 'text/html'))
+                    return body.decode(response.encoding or 'utf-8', errors='replace')
+                # Body vanished from disk or failed to load: retry unconditionally
+                METRICS.count('async.cache_refetches')
+                await self.bucket.acquire()
+                response = await self.request(client, url)
+                if response is None:
+                    return None
+            if self.cache:
+                self.cache.record_miss()
+            if response.status_code != 200:
+                print(f"Failed to fetch {url}. Status code: {response.status_code}")
+                return None
+            if self.cache:
+                self.cache.store(url, response.headers, response.content)
+            if self.recorder:
+                self.recorder.add(url, response.content, 200, response.headers.get('Content-Type', 'text/html'))
+            return response.text
+
+    async def crawl(self, parse_listing, parse_detail, on_job=None):
+        """Fetch every listing page and every job's detail page
+
+        parse_listing(html) returns the job dicts on one listing page, and
+        parse_detail(html, job) fills a job dict from its detail page.
+        on_job(job) is called as soon as each job is complete.
+        Listing pages are requested in doubling windows (up to max_in_flight)
+        until a page comes back empty or short. A page that fails is retried
+        once and then recorded in stats.failed_pages rather than taken as the
+        end of the listing; a window in which every page failed stops the crawl.
+        """
+        self.bucket = TokenBucket(self.rate, self.burst)
+        self.in_flight = asyncio.Semaphore(self.max_in_flight)
+        self.stats = FetchStats()
+        jobs = []
+        seen = set()
+
+        async with self.make_client() as client:
+            detail_tasks = []
+            page = 0
+            window_size = 1
+            exhausted = False
+            while not exhausted and page < self.max_pages:
+                # Grow the window while pages keep coming back full, so small boards
+                # don't pay for max_in_flight speculative requests past the last page
+                window = range(page, min(page + window_size, self.max_pages))
+                window_size = min(window_size * 2, self.max_in_flight)
+                urls = [self.listing_url.format(query=self.listing_query(), start=n * self.page_size) for n in window]
+                bodies = await asyncio.gather(*(self.fetch(client, url) for url in urls))
+                failed = [i for i, body in enumerate(bodies) if body is None]
+                if failed:
+                    # A failed page isn't a short page: give each one more try before judging the window
+                    retried = await asyncio.gather(*(self.fetch(client, urls[i]) for i in failed))
+                    for i, body in zip(failed, retried):
+                        bodies[i] = body
+                page = window.stop
+                if all(body is None for body in bodies):
+                    # Nothing came back for a whole window; don't probe every remaining page
+                    self.stats.failed_pages.extend(urls)
+                    break
+
+                for url, body in zip(urls, bodies):
+                    if body is None:
+                        self.stats.failed_pages.append(url)
+                        continue
+                    page_jobs = parse_listing(body) if body else []
+                    for job in page_jobs:
+                        key = job.get('job_id') or job.get('job_url') or job.get('title')
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        jobs.append(job)
+                        if job.get('job_id'):
+                            detail_tasks.append(asyncio.create_task(
+                                self.fetch_detail(client, job, parse_detail, on_job)))
+                        elif on_job:
+                            on_job(job)
+                    if len(page_jobs) < self.page_size:
+                        exhausted = True
+                        break
+
+            await asyncio.gather(*detail_tasks)
+
+        self.stats.finished = time.perf_counter()
+        return jobs
+
+    async def fetch_detail(self, client, job, parse_detail, on_job=None):
+        body = await self.fetch(client, self.detail_url.format(job_id=job['job_id']))
+        if body:
+            parse_detail(body, job)
+        if on_job:
+            on_job(job)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Batch scraper for many companies
+Schedules company slugs across a process pool. Each worker keeps one Chrome driver (or
+requests session) alive for every company it scrapes; a priority queue runs recently
+changed companies first and per-domain limits keep the crawl polite
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.util import Finalize
+from urllib.parse import urlparse
+
+from job_sink import StreamingJobSink
+from job_state import COMPANY_JOBS_URL, card_fingerprint
+
+# Long-lived per-process resources, created on a worker's first company and reused after that
+_worker = {}
+
+def worker_driver(options):
+    """This worker's warm Chrome driver, relaunched by its provider if the previous one died"""
+    if 'provider' not in _worker:
+        from driver_provision import DriverProvider
+        provider = DriverProvider(offline=options.get('offline', False))
+        _worker['provider'] = provider
+        Finalize(provider, provider.close, exitpriority=10)
+    return _worker['provider'].shared()
+
+def worker_session():
+    """This worker's requests session; its connection pool is shared by all of its companies"""
+    from simple_linkedin_scraper import SimpleLinkedInScraper
+    if 'session' not in _worker:
+        _worker['session'] = SimpleLinkedInScraper.create_session()
+    return _worker['session']
+
+def worker_policy(options):
+    """This worker's fetch policy, so retry budgets and open circuits carry over between its companies"""
+    if 'policy' not in _worker:
+        from fetch_policy import FetchPolicy, RetryPolicy
+        _worker['policy'] = FetchPolicy(RetryPolicy(max_attempts=options.get('max_attempts', 4)))
+    return _worker['policy']
+
+def jobs_digest(jobs):
+    """Order-independent hash of a company's postings, used to spot companies whose jobs changed"""
+    return card_fingerprint({'fingerprints': ','.join(sorted(card_fingerprint(job) for job in jobs))})
+
+def scrape_company(slug, mode, output_dir, options):
+    """Scrape one company in a worker process and write its outputs under output_dir/slug"""
+    started = time.time()
+    company_dir = os.path.join(output_dir, slug)
+    os.makedirs(company_dir, exist_ok=True)
+    json_path = os.path.join(company_dir, 'jobs.json')
+    result = {'slug': slug, 'pid': os.getpid(), 'started': started, 'status': 'ok', 'jobs': 0}
+    policy = worker_policy(options)
+
+    try:
+        if mode == 'selenium':
+            from linkedin_job_scraper import CSV_COLUMNS, LinkedInJobScraper
+            from scrape_checkpoint import CheckpointJournal
+            previous = json_path if options.get('incremental') and os.path.exists(json_path) else None
+            sink = StreamingJobSink(json_path, os.path.join(company_dir, 'jobs.csv'), CSV_COLUMNS)
+            driver = worker_driver(options)
+            scraper = LinkedInJobScraper(detail_workers=options.get('detail_workers', 1), previous_output=previous,
+                                         sink=sink, company=slug, driver=driver, provider=_worker['provider'],
+                                         policy=policy,
+                                         checkpoint=CheckpointJournal(os.path.join(company_dir, 'checkpoint.jsonl')))
+            try:
+                scraper.scrape_jobs(resume=True)
+                # Keep the previous jobs.json when LinkedIn walled us off mid-run; the checkpoint resumes it
+                if not policy.backoff():
+                    sink.finalize()
+            finally:
+                sink.close()
+            if scraper.failed_details:
+                result['status'] = 'partial'
+        else:
+            from simple_linkedin_scraper import CSV_COLUMNS, SimpleLinkedInScraper
+            cache_root = options.get('cache_dir')
+            sink = StreamingJobSink(json_path, os.path.join(company_dir, 'jobs.csv'), CSV_COLUMNS)
+            scraper = SimpleLinkedInScraper(cache_dir=os.path.join(cache_root, slug) if cache_root else None,
+                                            sink=sink, company=slug, session=worker_session(), policy=policy)
+            try:
+                scraper.scrape_jobs()
+                if not policy.backoff():
+                    sink.finalize()
+            finally:
+                sink.close()
+                if scraper.cache:
+                    scraper.cache.close()
+        result['jobs'] = len(scraper.jobs_data)
+        result['digest'] = jobs_digest(scraper.jobs_data)
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+
+    # A login wall or repeated throttling opened a circuit: hand the company back to be retried later
+    retry_in = policy.backoff()
+    if retry_in:
+        result['status'] = 'blocked'
+        result['retry_in'] = retry_in
+        result.setdefault('error', 'login wall or repeated failures opened the circuit')
+    result['counters'] = policy.report()
+    result['finished'] = time.time()
+    return result
+
+class DomainLimiter:
+    """Caps how many companies on one domain run at once and spaces out their start times"""
+
+    def __init__(self, max_active=2, interval=2.0):
+        self.max_active = max(1, max_active)
+        self.interval = interval
+        self.active = {}
+        self.next_start = {}
+
+    def delay(self, domain, now):
+        """Seconds until a company on this domain may start; None while the domain is at capacity"""
+        if self.active.get(domain, 0) >= self.max_active:
+            return None
+        return max(0.0, self.next_start.get(domain, 0.0) - now)
+
+    def start(self, domain, now):
+        self.active[domain] = self.active.get(domain, 0) + 1
+        self.next_start[domain] = now + self.interval
+
+    def finish(self, domain):
+        self.active[domain] -= 1
+
+    def pause(self, domain, until):
+        """Hold back every company on a domain until `until` (after a login wall or open circuit)"""
+        self.next_start[domain] = max(self.next_start.get(domain, 0.0), until)
+
+def load_state(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(path, state):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+def priority(slug, state):
+    """Never-scraped companies first, then the most recently changed"""
+    entry = state.get(slug)
+    if not entry:
+        return (0, 0.0)
+    return (1, -entry.get('changed_at', 0.0))
+
+class BatchScheduler:
+    """Runs company scrapes on a process pool in priority order under per-domain limits"""
+
+    def __init__(self, slugs, mode='simple', workers=None, output_dir='company_jobs', per_domain=2,
+                 domain_interval=2.0, state_path=None, max_requeues=2, **options):
+        self.mode = mode
+        # Every company lives on one domain, so workers beyond the per-domain limit would sit idle
+        self.workers = max(1, workers or per_domain)
+        self.output_dir = output_dir
+        self.options = options
+        self.limiter = DomainLimiter(per_domain, domain_interval)
+        self.state_path = state_path or os.path.join(output_dir, 'batch_state.json')
+        self.state = load_state(self.state_path)
+        self.queue = [(priority(slug, self.state), order, slug) for order, slug in enumerate(dict.fromkeys(slugs))]
+        heapq.heapify(self.queue)
+        self.order = itertools.count(len(self.queue))
+        self.results = []
+        self.requeues = {}
+        self.max_requeues = max_requeues
+        self.elapsed = 0.0
+
+    @staticmethod
+    def domain(slug):
+        return urlparse(COMPANY_JOBS_URL.format(slug=slug)).netloc
+
+    def submit_ready(self, pool, running):
+        """Start queued companies while workers are free; returns seconds until the next deferred one may start"""
+        deferred = []
+        next_delay = None
+        now = time.monotonic()
+        while self.queue and len(running) < self.workers:
+            item = heapq.heappop(self.queue)
+            domain = self.domain(item[2])
+            delay = self.limiter.delay(domain, now)
+            if delay == 0.0:
+                self.limiter.start(domain, now)
+                future = pool.submit(scrape_company, item[2], self.mode, self.output_dir, self.options)
+                running[future] = domain
+                continue
+            deferred.append(item)
+            if delay is not None:
+                next_delay = delay if next_delay is None else min(next_delay, delay)
+        for item in deferred:
+            heapq.heappush(self.queue, item)
+        return next_delay
+
+    def record(self, result):
+        if result['status'] == 'blocked' and self.requeue(result):
+            return
+        self.results.append(result)
+        if result['status'] in ('error', 'blocked'):
+            print(f"✗ {result['slug']}: {result.get('error')}")
+            return
+        entry = self.state.setdefault(result['slug'], {})
+        if entry.get('digest') != result['digest']:
+            entry['digest'] = result['digest']
+            entry['changed_at'] = result['finished']
+        entry['scraped_at'] = result['finished']
+        entry['jobs'] = result['jobs']
+        print(f"✓ {result['slug']}: {result['jobs']} jobs in {result['finished'] - result['started']:.1f}s")
+
+    def requeue(self, result):
+        """Pause the company's domain for as long as the worker's circuit is open and queue it again"""
+        slug = result['slug']
+        if self.requeues.get(slug, 0) >= self.max_requeues:
+            return False
+        self.requeues[slug] = self.requeues.get(slug, 0) + 1
+        self.limiter.pause(self.domain(slug), time.monotonic() + result['retry_in'])
+        heapq.heappush(self.queue, (priority(slug, self.state), next(self.order), slug))
+        print(f"⏸ {slug}: {result['error']}; retrying in {result['retry_in']:.0f}s")
+        return True
+
+    def run(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        start = time.monotonic()
+        running = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while self.queue or running:
+                next_delay = self.submit_ready(pool, running)
+                if not running:
+                    time.sleep(next_delay or 0.05)
+                    continue
+                done, _ = wait(running, timeout=next_delay, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.limiter.finish(running.pop(future))
+                    self.record(future.result())
+                save_state(self.state_path, self.state)
+        self.elapsed = time.monotonic() - start
+        return self.results
+
+    def report(self):
+        """Throughput and how busy the workers were over the whole batch"""
+        finished = [r for r in self.results if r['status'] not in ('error', 'blocked')]
+        busy = {}
+        for result in self.results:
+            busy[result['pid']] = busy.get(result['pid'], 0.0) + result['finished'] - result['started']
+        wall = max(self.elapsed, 1e-9)
+        return {
+            'companies': len(self.results),
+            'succeeded': len(finished),
+            'failed': len(self.results) - len(finished),
+            'jobs': sum(r['jobs'] for r in finished),
+            'requeued': sum(self.requeues.values()),
+            'seconds': self.elapsed,
+            'companies_per_hour': len(self.results) / wall * 3600,
+            'utilization': sum(busy.values()) / (wall * self.workers),
+            'per_worker': {pid: seconds / wall for pid, seconds in busy.items()},
+        }
+
+    def print_report(self):
+        report = self.report()
+        print(f"\n=== BATCH SUMMARY ===")
+        print(f"Companies: {report['companies']} ({report['succeeded']} ok, {report['failed']} failed), "
+              f"{report['jobs']} jobs in {report['seconds']:.1f}s")
+        print(f"Throughput: {report['companies_per_hour']:.0f} companies/hour on {self.workers} workers")
+        if report['requeued']:
+            print(f"Requeued after login walls or open circuits: {report['requeued']}")
+        print(f"Worker utilization: {report['utilization']:.0%}")
+        for pid, share in sorted(report['per_worker'].items()):
+            print(f"  worker {pid}: {share:.0%} busy")
+
+def read_slugs(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape the jobs pages of many LinkedIn companies")
+    parser.add_argument("companies", nargs="*", help="company slugs, e.g. poweredbymrp")
+    parser.add_argument("--companies-file", metavar="FILE", help="company slugs, one per line")
+    parser.add_argument("--mode", choices=["simple", "selenium"], default="simple",
+                        help="plain HTTP requests or a headless Chrome per worker")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes (default: --per-domain; all companies share linkedin.com, "
+                             "so more workers than that stay idle)")
+    parser.add_argument("--per-domain", type=int, default=2, help="max companies scraped at once per domain")
+    parser.add_argument("--domain-interval", type=float, default=2.0,
+                        help="min seconds between company starts on one domain")
+    parser.add_argument("--output-dir", default="company_jobs", help="per-company outputs go in OUTPUT_DIR/<slug>/")
+    parser.add_argument("--detail-workers", type=int, default=1, help="Chrome drivers per company in selenium mode")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse details from each company's previous output (selenium mode)")
+    parser.add_argument("--offline", action="store_true", help="never download chromedriver (selenium mode)")
+    parser.add_argument("--cache-dir", default=".http_cache/companies", help="conditional-GET cache root (simple mode)")
+    parser.add_argument("--max-attempts", type=int, default=4,
+                        help="tries per URL before giving up on 429/999/5xx answers and network errors")
+    args = parser.parse_args()
+
+    slugs = list(args.companies)
+    if args.companies_file:
+        slugs.extend(read_slugs(args.companies_file))
+    if not slugs:
+        parser.error("no companies given")
+    if args.workers and args.workers > args.per_domain:
+        print(f"Note: only {args.per_domain} of {args.workers} workers can run at once (--per-domain)")
+
+    scheduler = BatchScheduler(slugs, mode=args.mode, workers=args.workers, output_dir=args.output_dir,
+                               per_domain=args.per_domain, domain_interval=args.domain_interval,
+                               detail_workers=args.detail_workers, incremental=args.incremental,
+                               offline=args.offline, cache_dir=args.cache_dir, max_attempts=args.max_attempts)
+    scheduler.run()
+    scheduler.print_report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SimpleLinkedInScraper async engine against a local guest-API stub server
+Reports requests/sec, p50/p99 latency and bytes transferred, next to a sequential
+requests.Session walk of the same pages
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import FixtureServer, guest_fixture_handler
+from simple_linkedin_scraper import SimpleLinkedInScraper
+
+def sequential_walk(server, total_jobs, page_size):
+    """Baseline: one blocking request at a time over the scraper's session"""
+    scraper = SimpleLinkedInScraper()
+    start = time.perf_counter()
+    requests_made = 0
+    for offset in range(0, total_jobs + 1, page_size):
+        scraper.session.get(server.url(f"/jobs-guest/jobs/api/seeMoreJobPostings/search?start={offset}"))
+        requests_made += 1
+    for i in range(total_jobs):
+        scraper.session.get(server.url(f"/jobs-guest/jobs/api/jobPosting/{3900000000 + i}"))
+        requests_made += 1
+    elapsed = time.perf_counter() - start
+    return requests_made, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated server latency in seconds")
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    args = parser.parse_args()
+
+    with FixtureServer(guest_fixture_handler(args.jobs), latency=args.latency) as server:
+        requests_made, sequential_seconds = sequential_walk(server, args.jobs, 25)
+
+        scraper = SimpleLinkedInScraper()
+        report = scraper.scrape_jobs_async(
+            listing_url=server.url("/jobs-guest/jobs/api/seeMoreJobPostings/search?{query}&start={start}"),
+            company_id="1",
+            detail_url=server.url("/jobs-guest/jobs/api/jobPosting/{job_id}"),
+            rate=args.rate, burst=args.max_in_flight, max_in_flight=args.max_in_flight,
+        )
+        described = sum(1 for job in scraper.jobs_data if job.get('description'))
+
+    print(f"\n=== ASYNC ENGINE BENCHMARK ({args.jobs} jobs, {args.latency * 1000:.0f} ms latency) ===")
+    print(f"sequential: {requests_made} requests in {sequential_seconds:.2f}s "
+          f"= {requests_made / sequential_seconds:.1f} req/s")
+    print(f"async:      {report['requests']} requests in {report['seconds']:.2f}s "
+          f"= {report['requests_per_second']} req/s, p50 {report['p50_ms']} ms, p99 {report['p99_ms']} ms, "
+          f"{report['bytes']:,} bytes")
+    print(f"jobs: {len(scraper.jobs_data)} listed, {described} with details")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: company_info on every job versus a shared company table
+A multi-company batch of synthetic jobs is written both ways; reports file size,
+write time, load time and the time to touch every job's company record
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from company_table import NormalizedJobs, write_normalized
+from extract_jobs_from_content import add_company_info
+from fixture_server import synthetic_job
+from job_sink import write_json_array
+
+def company_blobs(count):
+    """Company records shaped like the one add_company_info attaches"""
+    template = add_company_info([{}])[0]['company_info']
+    blobs = []
+    for n in range(count):
+        blob = json.loads(json.dumps(template))
+        blob['company_name'] = f"Company {n}"
+        blobs.append(blob)
+    return blobs
+
+def batch(jobs, companies):
+    blobs = company_blobs(companies)
+    records = []
+    for i in range(jobs):
+        job = synthetic_job(i)
+        job['company_info'] = blobs[i % companies]
+        records.append(job)
+    return records
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+def touch_companies(jobs):
+    return sum(len(job['company_info']['specialties']) for job in jobs)
+
+def load_denormalized(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--companies", type=int, default=200)
+    args = parser.parse_args()
+
+    jobs = batch(args.jobs, args.companies)
+    with tempfile.TemporaryDirectory() as directory:
+        flat_path = os.path.join(directory, 'jobs.json')
+        normalized_path = os.path.join(directory, 'jobs_normalized.json')
+
+        flat_write, _ = timed(write_json_array, flat_path, jobs)
+        normalized_write, _ = timed(write_normalized, normalized_path, jobs)
+        flat_load, flat_jobs = timed(load_denormalized, flat_path)
+        normalized_load, normalized_jobs = timed(NormalizedJobs.load, normalized_path)
+        flat_touch, flat_total = timed(touch_companies, flat_jobs)
+        normalized_touch, normalized_total = timed(touch_companies, normalized_jobs)
+        flat_size = os.path.getsize(flat_path)
+        normalized_size = os.path.getsize(normalized_path)
+
+    print(f"\n=== COMPANY TABLE BENCHMARK ({args.jobs:,} jobs, {args.companies} companies) ===")
+    print(f"{'output':<14} {'MB':>8} {'write s':>9} {'load s':>8} {'access s':>9}")
+    print(f"{'per-job blob':<14} {flat_size / 1024 / 1024:>8.1f} {flat_write:>9.2f} {flat_load:>8.2f} {flat_touch:>9.3f}")
+    print(f"{'normalized':<14} {normalized_size / 1024 / 1024:>8.1f} {normalized_write:>9.2f} "
+          f"{normalized_load:>8.2f} {normalized_touch:>9.3f}")
+    print(f"{flat_size / normalized_size:.1f}x smaller, {flat_write / normalized_write:.1f}x faster to write, "
+          f"same company data: {flat_total == normalized_total}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fingerprint + MinHash/LSH deduplication against all-pairs comparison
+Synthetic postings from several companies. Every eighth one is a copy of an earlier
+posting whose title is reworded or whose location is dropped, so the exact fingerprint
+misses it and only the LSH path can merge it. Every eighth is also another company's
+clone of an earlier posting, which must stay separate. Reports time per record (which
+should stay flat as the corpus grows) and the recall and precision of the merges, then
+checks that normalize -> dedupe in job_pipeline keeps same-title jobs at two companies apart
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_dedupe import JobDeduplicator, shingle_hashes
+from job_pipeline import dedupe_stage, normalize_stage
+
+ROLES = ['Manager', 'Specialist', 'Coordinator', 'Analyst', 'Engineer', 'Consultant', 'Director', 'Trainer']
+AREAS = ['Finance', 'Supply Chain', 'E-Commerce', 'Sales', 'Clinical', 'Marketing', 'Procurement', 'Service']
+CITIES = ['Orem, UT', 'Park City, Utah', 'Austin, TX', 'Denver, CO', 'Remote', 'Boston, MA']
+COMPANIES = ['Powered By MRP', 'Acme Inc', 'Globex', 'Initech LLC', 'Umbrella Corp']
+
+def synthetic_postings(count, seed=11):
+    """(postings, {copy id: original id}) with reworded copies and cross-company clones"""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    postings, originals, duplicate_of, posted_by = [], [], {}, {}
+    for i in range(count):
+        if i % 8 in (3, 7) and originals:
+            original, (senior, area, role, number) = originals[rng.randrange(len(originals))]
+            if i % 8 == 3:
+                # Another company posting the same boilerplate: a different job (once per company,
+                # or the clones would themselves be true duplicates)
+                companies = posted_by.setdefault(original['id'], {original['company']})
+                company = rng.choice([name for name in COMPANIES if name not in companies] or [None])
+                if company:
+                    companies.add(company)
+                    postings.append(dict(original, id=f"clone-{i}", company=company, _source='linkedin'))
+                    continue
+            else:
+                words = original['description'].split()
+                for _ in range(3):
+                    words[rng.randrange(len(words))] = rng.choice(vocabulary)
+                copy = dict(original, id=f"copy-{i}", description=' '.join(words), _source='mirror')
+                variant = rng.randrange(3)
+                if variant == 0:
+                    copy['title'] = f"{role} {number}, {senior}{area}"
+                elif variant == 1:
+                    copy['title'] = original['title'] + ' - Now Hiring'
+                else:
+                    copy['location'] = 'Not specified'
+                duplicate_of[copy['id']] = original['id']
+                postings.append(copy)
+                continue
+        parts = (rng.choice(['', 'Senior ']), rng.choice(AREAS), rng.choice(ROLES), str(i))
+        job = {'id': f"job-{i}", 'title': f"{parts[0]}{parts[1]} {parts[2]} {parts[3]}",
+               'company': rng.choice(COMPANIES), 'location': rng.choice(CITIES),
+               'description': ' '.join(rng.choices(vocabulary, k=120)), '_source': 'adp'}
+        originals.append((job, parts))
+        postings.append(job)
+    return postings, duplicate_of
+
+def merge_quality(canonical, duplicate_of):
+    """Recall over the planted copies and precision over every merge made"""
+    correct = merges = 0
+    for record in canonical:
+        ids = [source['id'] for source in record['sources']]
+        for other in ids[1:]:
+            merges += 1
+            correct += duplicate_of.get(other) == ids[0]
+    return correct / max(1, len(duplicate_of)), correct / merges if merges else 1.0
+
+def pairwise_estimate(postings, sample):
+    """Seconds the all-pairs approach would need: sampled shingle-set Jaccard scaled to n^2/2"""
+    sets = [set(shingle_hashes(job['description']).tolist()) for job in postings[:sample]]
+    start = time.perf_counter()
+    for i in range(1, len(sets)):
+        for j in range(i):
+            len(sets[i] & sets[j]) / len(sets[i] | sets[j])
+    elapsed = time.perf_counter() - start
+    pairs = sample * (sample - 1) / 2
+    return elapsed / pairs * len(postings) * (len(postings) - 1) / 2
+
+def pipeline_check():
+    """(records out, sources of the first) for one title at two companies, the first also seen twice"""
+    description = "Own a territory of medical aesthetics practices and grow recurring revenue. " * 3
+    postings = [
+        {'title': 'Account Executive', 'company': 'Acme Inc', 'location': 'Austin, TX',
+         'description': description, '_source': 'linkedin'},
+        {'title': 'Account Executive', 'company': 'Globex', 'location': 'Austin, TX',
+         'description': description, '_source': 'linkedin'},
+        # Normalizes to the same id, source and (missing) URL as the first: identical provenance
+        {'title': 'Account Executive', 'company': 'Acme Inc', 'location': 'Austin, Texas',
+         'description': description, '_source': 'linkedin'},
+    ]
+    records = list(dedupe_stage(normalize_stage(postings)))
+    return len(records), len(records[0]['sources'])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="12500,25000,50000,100000")
+    parser.add_argument("--pair-sample", type=int, default=400)
+    args = parser.parse_args()
+
+    print("\n=== DEDUPE BENCHMARK ===")
+    print(f"{'records':>8} {'seconds':>9} {'us/record':>10} {'exact':>6} {'near':>7} {'expected':>9} "
+          f"{'cand/rec':>9} {'recall':>7} {'precision':>10} {'all-pairs (est.)':>17}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        postings, duplicate_of = synthetic_postings(size)
+        dedupe = JobDeduplicator()
+        start = time.perf_counter()
+        for job in postings:
+            dedupe.add(job)
+        canonical = list(dedupe.canonical_records())
+        elapsed = time.perf_counter() - start
+        recall, precision = merge_quality(canonical, duplicate_of)
+        stats = dedupe.stats
+        print(f"{size:>8,} {elapsed:>9.2f} {elapsed / size * 1e6:>10.1f} {stats['exact']:>6,} {stats['near']:>7,} "
+              f"{len(duplicate_of):>9,} {stats['candidates'] / size:>9.2f} {recall:>7.3f} {precision:>10.3f} "
+              f"{pairwise_estimate(postings, args.pair_sample):>16.0f}s")
+
+    records, sources = pipeline_check()
+    print("\n=== PIPELINE CHECK (normalize -> dedupe) ===")
+    print(f"Same title at Acme and Globex, Acme seen twice: {records} records (expected 2), "
+          f"{sources} sources on the Acme record (expected 2): {'ok' if (records, sources) == (2, 2) else 'FAILED'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark: job detail throughput of LinkedInJobScraper.get_job_details by driver pool size
+Serves synthetic job pages from a local fixture server with simulated network latency
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import FixtureServer, linkedin_fixture_handler, synthetic_job
+from linkedin_job_scraper import LinkedInJobScraper
+
+def run(server, pool_size, job_count):
+    """Time the detail stage for job_count jobs on a pool of pool_size drivers"""
+    scraper = LinkedInJobScraper(detail_workers=pool_size)
+    try:
+        scraper.jobs_data = [
+            dict(synthetic_job(i), job_url=server.url(f"/jobs/view/{synthetic_job(i)['job_id']}/"))
+            for i in range(job_count)
+        ]
+        start = time.perf_counter()
+        scraper.get_job_details()
+        elapsed = time.perf_counter() - start
+    finally:
+        scraper.driver.quit()
+
+    described = sum(1 for job in scraper.jobs_data if job.get('description', '').startswith('Paragraph'))
+    return elapsed, described
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=24)
+    parser.add_argument("--pool-sizes", default="1,2,4,8")
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated server latency in seconds")
+    args = parser.parse_args()
+
+    results = []
+    with FixtureServer(linkedin_fixture_handler(), latency=args.latency) as server:
+        for size in [int(s) for s in args.pool_sizes.split(",")]:
+            elapsed, described = run(server, size, args.jobs)
+            results.append((size, elapsed, described))
+
+    baseline = results[0][1]
+    print(f"\n=== DETAIL POOL BENCHMARK ({args.jobs} jobs, {args.latency * 1000:.0f} ms latency) ===")
+    print(f"{'pool':>5} {'seconds':>9} {'jobs/s':>8} {'speedup':>8} {'extracted':>10}")
+    for size, elapsed, described in results:
+        print(f"{size:>5} {elapsed:>9.2f} {args.jobs / elapsed:>8.2f} {baseline / elapsed:>7.2f}x {described:>10}")
+
+if __name__ == "__main__":
+    main()
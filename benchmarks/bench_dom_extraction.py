@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: WebDriver round-trips and wall time for job card and job detail extraction
+Compares the single execute_script mode against one find_element call per field,
+on saved HTML fixtures loaded from disk
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import render_job_page, render_listing_page
+from linkedin_job_scraper import LinkedInJobScraper
+
+def count_round_trips(driver):
+    """Wrap driver.execute so every WebDriver command is counted"""
+    counter = {'commands': 0}
+    original = driver.execute
+
+    def execute(*args, **kwargs):
+        counter['commands'] += 1
+        return original(*args, **kwargs)
+
+    driver.execute = execute
+    return counter
+
+def measure(scraper, counter, mode, action):
+    scraper.extraction_mode = mode
+    counter['commands'] = 0
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, counter['commands'], result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        listing_path = Path(tmp) / "listing.html"
+        detail_path = Path(tmp) / "detail.html"
+        listing_path.write_text(render_listing_page(args.cards), encoding="utf-8")
+        detail_path.write_text(render_job_page(1, paragraphs=20), encoding="utf-8")
+
+        scraper = LinkedInJobScraper()
+        counter = count_round_trips(scraper.driver)
+        rows = []
+        try:
+            scraper.driver.get(listing_path.as_uri())
+            for mode in ("elements", "script"):
+                def listings():
+                    scraper.jobs_data = []
+                    scraper.extract_job_listings()
+                    return len(scraper.jobs_data)
+                rows.append((f"{args.cards} cards", mode) + measure(scraper, counter, mode, listings))
+
+            scraper.driver.get(detail_path.as_uri())
+            for mode in ("elements", "script"):
+                def details():
+                    job = {}
+                    scraper.extract_job_details(job)
+                    return len(job.get('requirements', []))
+                rows.append(("1 detail page", mode) + measure(scraper, counter, mode, details))
+        finally:
+            scraper.driver.quit()
+
+    print(f"\n=== DOM EXTRACTION BENCHMARK ===")
+    print(f"{'page':<14} {'mode':<9} {'seconds':>9} {'round-trips':>12} {'records':>8}")
+    for page, mode, elapsed, commands, records in rows:
+        print(f"{page:<14} {mode:<9} {elapsed:>9.3f} {commands:>12} {records:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: driver-ready latency and page weight before and after driver provisioning
+Compares ChromeDriverManager().install() on every launch against the cached chromedriver
+path and a warm reused browser, then loads an asset-heavy fixture page with request
+blocking off and on
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from driver_provision import DriverProvider, PageWeightMeter
+from fixture_server import FixtureResponse, FixtureServer, render_job_page
+
+ASSETS = {
+    '.png': ('image/png', 60 * 1024),
+    '.woff2': ('font/woff2', 90 * 1024),
+    '.css': ('text/css', 40 * 1024),
+}
+
+def asset_heavy_handler(images=12):
+    """A job page that also pulls images, web fonts and a stylesheet"""
+
+    def handle(request):
+        path = request.path.split("?", 1)[0]
+        for suffix, (content_type, size) in ASSETS.items():
+            if path.endswith(suffix):
+                return FixtureResponse(b"x" * size, headers={'Content-Type': content_type})
+        page = render_job_page(1)
+        extras = ''.join(f'<img src="/img/{i}.png">' for i in range(images))
+        extras += '<link rel="stylesheet" href="/site.css"><link rel="preload" as="font" href="/font.woff2" crossorigin>'
+        return FixtureResponse(page.replace('</body>', extras + '</body>'))
+
+    return handle
+
+def time_launches(launch, count):
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        driver = launch()
+        timings.append(time.perf_counter() - start)
+        driver.quit()
+    return sum(timings) / len(timings)
+
+def page_bytes(provider, url, loads):
+    meter = PageWeightMeter()
+    driver = provider.launch()
+    try:
+        for _ in range(loads):
+            driver.get(url)
+            meter.record(driver, url)
+    finally:
+        driver.quit()
+    return meter.summary()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--launches", type=int, default=3)
+    parser.add_argument("--loads", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        provider = DriverProvider(cache_path=f"{cache_dir}/chromedriver.json")
+        options = provider.options()
+
+        def uncached():
+            from webdriver_manager.chrome import ChromeDriverManager
+            return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+        def cached():
+            fresh = DriverProvider(cache_path=provider.cache_path)
+            return fresh.launch()
+
+        provider.driver_path()
+        before = time_launches(uncached, args.launches)
+        after = time_launches(cached, args.launches)
+
+        provider.shared()
+        start = time.perf_counter()
+        for _ in range(args.launches):
+            provider.shared()
+        warm = (time.perf_counter() - start) / args.launches
+        provider.close()
+
+    with FixtureServer(asset_heavy_handler()) as server:
+        url = server.url("/jobs/view/3900000001/")
+        full = page_bytes(DriverProvider(block_assets=False), url, args.loads)
+        blocked = page_bytes(DriverProvider(block_assets=True), url, args.loads)
+
+    print(f"\n=== DRIVER PROVISIONING BENCHMARK ===")
+    print(f"driver ready, install every run:  {before:7.3f}s")
+    print(f"driver ready, cached path:        {after:7.3f}s")
+    print(f"driver ready, warm reuse:         {warm:7.4f}s")
+    print(f"{'':>14} {'KB/page':>9} {'requests/page':>14}")
+    for label, summary in (('assets loaded', full), ('assets blocked', blocked)):
+        print(f"{label:>14} {summary['bytes_per_page'] / 1024:>9.1f} {summary['resources_per_page']:>14.1f}")
+
+if __name__ == "__main__":
+    main()
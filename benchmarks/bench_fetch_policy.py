@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fetch policy against a fault-injecting stub server
+Runs the sync and async simple scrapers while the stub throttles (429 + Retry-After, 999),
+fails (5xx), shows login walls or goes down, and compares retries and circuit breaking
+with a single-attempt policy: jobs recovered, requests sent and the policy's counters
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import FixtureServer, guest_fixture_handler, linkedin_fixture_handler, with_faults
+from fetch_policy import CircuitBreaker, FetchPolicy, RetryPolicy
+from simple_linkedin_scraper import SimpleLinkedInScraper
+
+SCENARIOS = {
+    'flaky': {'rate': 0.3},
+    'authwall': {'rate': 0.0, 'authwall_rate': 0.02},
+    'outage': {'rate': 0.0, 'outage': (60, 10 ** 9)},
+}
+
+def make_policy(retries, args):
+    if not retries:
+        return FetchPolicy(RetryPolicy(max_attempts=1), CircuitBreaker(threshold=10 ** 9),
+                           sleep=lambda seconds: None)
+    return FetchPolicy(RetryPolicy(max_attempts=args.max_attempts, base_delay=args.base_delay, seed=0),
+                       CircuitBreaker(threshold=args.threshold))
+
+def run_async(scenario, retries, args):
+    handler = with_faults(guest_fixture_handler(args.jobs), seed=args.seed, **SCENARIOS[scenario])
+    with FixtureServer(handler, latency=args.latency) as server:
+        scraper = SimpleLinkedInScraper(policy=make_policy(retries, args))
+        scraper.scrape_jobs_async(
+            listing_url=server.url("/jobs-guest/jobs/api/seeMoreJobPostings/search?{query}&start={start}"),
+            company_id="1",
+            detail_url=server.url("/jobs-guest/jobs/api/jobPosting/{job_id}"),
+            rate=args.rate, burst=args.max_in_flight, max_in_flight=args.max_in_flight, http2=False,
+        )
+        sent = server.requests
+    described = sum(1 for job in scraper.jobs_data if job.get('description'))
+    return {'listed': len(scraper.jobs_data), 'described': described, 'sent': sent,
+            'faults': dict(handler.faults), 'counters': scraper.policy.report()}
+
+def run_sync(retries, args):
+    """The listing-page scrape repeated args.runs times on one flaky server; counts runs that got jobs"""
+    handler = with_faults(linkedin_fixture_handler(25), seed=args.seed, rate=0.5)
+    policy = make_policy(retries, args)
+    succeeded = 0
+    with FixtureServer(handler, latency=args.latency) as server:
+        for _ in range(args.runs):
+            scraper = SimpleLinkedInScraper(policy=policy)
+            scraper.base_url = server.url("/")
+            scraper.scrape_jobs()
+            succeeded += bool(scraper.jobs_data)
+        sent = server.requests
+    return {'succeeded': succeeded, 'sent': sent, 'counters': policy.report()}
+
+def print_row(label, result, args):
+    counters = result['counters']
+    print(f"{label:<24} listed {result['listed']:>4}, detailed {result['described']:>4}/{args.jobs}, "
+          f"{result['sent']:>5} requests sent, {counters.get('retries', 0):>4} retries, "
+          f"{counters.get('failures', 0):>4} failures, {counters.get('blocked', 0)} walls, "
+          f"{counters.get('short_circuited', 0):>4} held back")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated server latency in seconds")
+    parser.add_argument("--rate", type=float, default=500.0)
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--base-delay", type=float, default=0.02, help="back-off base (seconds) for the benchmark")
+    parser.add_argument("--threshold", type=int, default=8, help="consecutive failures that open a circuit")
+    parser.add_argument("--runs", type=int, default=20, help="listing scrapes in the sync comparison")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # The scrapers print a line per failed request; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = [(scenario, retries, run_async(scenario, retries, args))
+                for scenario in SCENARIOS for retries in (False, True)]
+        sync = {retries: run_sync(retries, args) for retries in (False, True)}
+
+    print(f"\n=== FETCH POLICY BENCHMARK ({args.jobs} jobs, async, {args.max_in_flight} in flight) ===")
+    for scenario, retries, result in rows:
+        print_row(f"{scenario} / {'policy' if retries else 'single attempt'}", result, args)
+    print(f"\n=== SYNC LISTING SCRAPES ({args.runs} runs, 50% of responses 429/503/999) ===")
+    for retries, result in sync.items():
+        print(f"{'policy' if retries else 'single attempt':<24} {result['succeeded']:>3}/{args.runs} runs got jobs, "
+              f"{result['sent']} requests, {result['counters'].get('retry_after_honoured', 0)} Retry-After waits")
+
+if __name__ == "__main__":
+    main()
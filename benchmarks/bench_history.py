@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a year of daily job snapshots as CSV files versus the Parquet history store
+Writes the same snapshots both ways, then loads them in fresh subprocesses: every CSV
+into pandas, the whole store, and the store with a column list and a company predicate.
+Reports load time, peak RSS growth and on-disk size
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fixture_server import LOCATIONS, TITLES
+
+COMPANIES = [f"Company {n}" for n in range(40)]
+EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Contract"]
+CSV_COLUMNS = ['job_id', 'title', 'company', 'location', 'employment_type', 'posted_time', 'job_url',
+               'description', 'requirements', 'source', 'status', 'fingerprint']
+QUERY_COLUMNS = ['scrape_date', 'job_id', 'title', 'location']
+
+def snapshot(day, jobs_per_day):
+    """Jobs visible on a given day; postings live for about a month so consecutive days overlap"""
+    jobs = []
+    for n in range(jobs_per_day):
+        i = day * jobs_per_day // 30 + n
+        jobs.append({
+            'job_id': str(3900000000 + i),
+            'title': TITLES[i % len(TITLES)],
+            'company': COMPANIES[i % len(COMPANIES)],
+            'location': LOCATIONS[i % len(LOCATIONS)],
+            'employment_type': EMPLOYMENT_TYPES[i % len(EMPLOYMENT_TYPES)],
+            'posted_time': f"{1 + i % 28} days ago",
+            'job_url': f"https://www.linkedin.com/jobs/view/{3900000000 + i}/",
+            'description': f"Role {i} description. " * 30,
+            'requirements': [f"Requirement {r}" for r in range(5)],
+            'source': 'linkedin',
+            'status': 'open',
+            'fingerprint': f"{i:016x}",
+        })
+    return jobs
+
+def build(directory, days, jobs_per_day):
+    from job_history import JobHistoryStore
+    from job_sink import write_csv
+    csv_dir = Path(directory) / 'csv'
+    csv_dir.mkdir()
+    store = JobHistoryStore(str(Path(directory) / 'history'))
+    first = date(2025, 1, 1)
+    for day in range(days):
+        jobs = snapshot(day, jobs_per_day)
+        scrape_date = first + timedelta(days=day)
+        write_csv(str(csv_dir / f"mrp_jobs_{scrape_date.isoformat()}.csv"), jobs, CSV_COLUMNS)
+        store.append(jobs, scrape_date)
+
+def load(path, directory):
+    if path == 'csv':
+        import pandas as pd
+        frames = []
+        for csv_path in sorted((Path(directory) / 'csv').glob('*.csv')):
+            frame = pd.read_csv(csv_path)
+            frame['scrape_date'] = csv_path.stem.rsplit('_', 1)[-1]
+            frames.append(frame)
+        frame = pd.concat(frames, ignore_index=True)
+        return len(frame[frame['company'] == COMPANIES[3]][QUERY_COLUMNS])
+    from job_history import JobHistoryStore
+    store = JobHistoryStore(str(Path(directory) / 'history'))
+    if path == 'parquet-full':
+        frame = store.query()
+        return len(frame[frame['company'] == COMPANIES[3]][QUERY_COLUMNS])
+    return len(store.query(QUERY_COLUMNS, where={'company': COMPANIES[3]}))
+
+def child(path, directory):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    rows = load(path, directory)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'seconds': elapsed, 'growth_kb': peak - baseline, 'rows': rows}))
+
+def directory_size(path):
+    return sum(p.stat().st_size for p in Path(path).rglob('*') if p.is_file())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--jobs-per-day", type=int, default=300)
+    parser.add_argument("--child", choices=["csv", "parquet-full", "parquet-query"], help=argparse.SUPPRESS)
+    parser.add_argument("--dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.dir)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        build(directory, args.days, args.jobs_per_day)
+        print(f"\n=== JOB HISTORY BENCHMARK ({args.days} daily snapshots x {args.jobs_per_day} jobs, "
+              f"built in {time.perf_counter() - start:.1f}s) ===")
+        print(f"on disk: CSV {directory_size(Path(directory) / 'csv') / 1024 / 1024:.1f} MB, "
+              f"Parquet {directory_size(Path(directory) / 'history') / 1024 / 1024:.1f} MB")
+        print(f"{'load path':<16} {'seconds':>9} {'RSS growth MB':>14} {'rows':>8}")
+        for path in ("csv", "parquet-full", "parquet-query"):
+            result = subprocess.run([sys.executable, __file__, "--child", path, "--dir", directory],
+                                    capture_output=True, text=True, check=True)
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            print(f"{path:<16} {stats['seconds']:>9.2f} {stats['growth_kb'] / 1024:>14.1f} {stats['rows']:>8}")
+
+if __name__ == "__main__":
+    main()
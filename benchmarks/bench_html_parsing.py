@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parse + extract time and peak memory per HTML backend on a synthetic listings page
+Compares html.parser and lxml tree builders, and the per-selector select_one cascade
+against the precompiled single-pass card extractor
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from fixture_server import render_listing_page
+from simple_linkedin_scraper import CARD_FIELD_CASCADES, SimpleLinkedInScraper, resolve_parser
+
+def cascade_extract(job_element):
+    """The pre-compilation extractor: one select_one per selector until a cascade matches"""
+    job_data = {}
+    for field, selectors in CARD_FIELD_CASCADES.items():
+        for selector in selectors:
+            elem = job_element.select_one(selector)
+            if elem:
+                job_data[field] = elem.get_text(strip=True)
+                break
+    return job_data
+
+def synthetic_page(target_bytes):
+    """A listings page of roughly target_bytes"""
+    card_bytes = len(render_listing_page(10)) / 10
+    return render_listing_page(int(target_bytes / card_bytes))
+
+def run(parser, html, extractor_name):
+    """Parse + extract timings from an untraced pass, peak memory from a traced one"""
+    scraper = SimpleLinkedInScraper(parser=parser)
+    extract = cascade_extract if extractor_name == 'cascade' else scraper.extract_job_data
+
+    start = time.perf_counter()
+    soup = BeautifulSoup(html, scraper.parser)
+    parsed = time.perf_counter()
+    jobs = [extract(card) for card in soup.select('.jobs-search-results__list-item')]
+    extracted = time.perf_counter()
+    del soup
+
+    tracemalloc.start()
+    soup = BeautifulSoup(html, scraper.parser)
+    [extract(card) for card in soup.select('.jobs-search-results__list-item')]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed - start, extracted - parsed, peak, len(jobs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=5.0)
+    args = parser.parse_args()
+
+    html = synthetic_page(args.megabytes * 1024 * 1024)
+    backends = ['html.parser']
+    if resolve_parser('lxml') == 'lxml':
+        backends.append('lxml')
+
+    rows = []
+    for backend in backends:
+        for extractor in ('cascade', 'single-pass'):
+            rows.append((backend, extractor) + run(backend, html, extractor))
+
+    print(f"\n=== HTML PARSING BENCHMARK ({len(html) / 1024 / 1024:.1f} MB page) ===")
+    print(f"{'backend':<12} {'extractor':<12} {'parse s':>8} {'extract s':>10} {'peak MB':>8} {'cards':>6}")
+    for backend, extractor, parse_s, extract_s, peak, cards in rows:
+        print(f"{backend:<12} {extractor:<12} {parse_s:>8.2f} {extract_s:>10.2f} {peak / 1024 / 1024:>8.1f} {cards:>6}")
+
+if __name__ == "__main__":
+    main()
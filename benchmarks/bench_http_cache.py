@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark: conditional-GET cache over two consecutive scrapes of an unchanged board
+The stub server answers revalidations with 304, so the second run should transfer
+almost nothing
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import FixtureServer, guest_fixture_handler, with_validators
+from simple_linkedin_scraper import SimpleLinkedInScraper
+
+def run_once(server, cache_dir, use_async, jobs):
+    """One scrape with a fresh scraper sharing the on-disk cache; returns server bytes and cache stats"""
+    scraper = SimpleLinkedInScraper(cache_dir=cache_dir)
+    before = server.bytes_sent
+    if use_async:
+        scraper.scrape_jobs_async(
+            listing_url=server.url("/jobs-guest/jobs/api/seeMoreJobPostings/search?{query}&start={start}"),
+            company_id="1",
+            detail_url=server.url("/jobs-guest/jobs/api/jobPosting/{job_id}"),
+            rate=500, burst=16, max_in_flight=16,
+        )
+    else:
+        for i in range(jobs):
+            scraper.session.get(server.url(f"/jobs-guest/jobs/api/jobPosting/{3900000000 + i}?trk=public_jobs"))
+    scraper.cache.close()
+    return server.bytes_sent - before, dict(scraper.cache.stats)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"\n=== HTTP CACHE BENCHMARK ({args.jobs} jobs) ===")
+    for use_async in (False, True):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                FixtureServer(with_validators(guest_fixture_handler(args.jobs))) as server:
+            label = "async engine" if use_async else "session"
+            for run in (1, 2):
+                transferred, stats = run_once(server, cache_dir, use_async, args.jobs)
+                print(f"{label:<13} run {run}: {transferred:>10,} bytes from server, "
+                      f"{stats['hits']} hits, {stats['misses']} misses, {stats['bytes_saved']:,} bytes saved")
+
+if __name__ == "__main__":
+    main()
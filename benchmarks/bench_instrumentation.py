@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of the scraper instrumentation when disabled and enabled
+Times a bare loop against the same loop wrapped in METRICS.span, then the simple
+scraper's card extraction on a synthetic listing page with metrics off and on
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from fixture_server import render_listing_page
+from scrape_metrics import METRICS
+from simple_linkedin_scraper import SimpleLinkedInScraper
+
+def span_loop(iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with METRICS.span('bench.span'):
+            pass
+    return time.perf_counter() - start
+
+def bare_loop(iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pass
+    return time.perf_counter() - start
+
+def extraction(html, repeats):
+    """Best-of time for extract_jobs_from_html over an already parsed page"""
+    scraper = SimpleLinkedInScraper()
+    soup = BeautifulSoup(html, scraper.parser)
+    best = float('inf')
+    for _ in range(repeats):
+        scraper.jobs_data = []
+        start = time.perf_counter()
+        scraper.extract_jobs_from_html(soup)
+        best = min(best, time.perf_counter() - start)
+    return best, len(scraper.jobs_data)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    html = render_listing_page(args.cards)
+    bare = bare_loop(args.iterations)
+
+    METRICS.enabled = False
+    disabled = span_loop(args.iterations)
+    extract_off, jobs = extraction(html, args.repeats)
+
+    METRICS.enabled = True
+    enabled = span_loop(args.iterations)
+    extract_on, _ = extraction(html, args.repeats)
+    METRICS.enabled = False
+
+    per_span = lambda seconds: (seconds - bare) / args.iterations * 1e9
+    print(f"\n=== INSTRUMENTATION OVERHEAD ({args.iterations:,} spans, {jobs} cards) ===")
+    print(f"span disabled:              {per_span(disabled):8.1f} ns/span")
+    print(f"span enabled:               {per_span(enabled):8.1f} ns/span")
+    print(f"extract, metrics off:       {extract_off * 1000:8.1f} ms")
+    print(f"extract, metrics on:        {extract_on * 1000:8.1f} ms  ({(extract_on / extract_off - 1) * 100:+.1f}%)")
+    print(f"disabled spans per card cost {per_span(disabled) * jobs / (extract_off * 1e9) * 100:.3f}% of extraction")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of 100k jobs held as dicts versus slotted JobRecords
+Builds jobs the way the scrapers do, with every string freshly produced by the parser,
+and measures the retained heap with tracemalloc; also times the JSON/CSV writers on both
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixture_server import LOCATIONS, TITLES
+from job_record import JobRecord
+from job_sink import write_csv, write_json_array
+from linkedin_job_scraper import CSV_COLUMNS
+
+def fresh(text):
+    """A new string object with the given text, as a parser would return it"""
+    return text.encode('utf-8').decode('utf-8')
+
+def parsed_fields(i):
+    return {
+        'job_id': fresh(str(3900000000 + i)),
+        'title': fresh(TITLES[i % len(TITLES)]),
+        'job_url': fresh(f"https://www.linkedin.com/jobs/view/{3900000000 + i}/"),
+        'company': fresh("Powered By MRP"),
+        'location': fresh(LOCATIONS[i % len(LOCATIONS)]),
+        'posted_time': fresh("Not specified"),
+        'job_type': fresh("Full-time"),
+        'description': fresh(f"Role {i} at Powered By MRP. " * 8),
+        'requirements': [fresh(f"Requirement {n}") for n in range(5)],
+        'benefits': fresh("Not specified"),
+        'salary': fresh("Not specified"),
+        'employment_type': fresh("Full-time"),
+        'fingerprint': fresh(f"{i:016x}"),
+        'status': fresh("open"),
+        'change': fresh("new"),
+    }
+
+def build(kind, count):
+    if kind == 'dict':
+        return [parsed_fields(i) for i in range(count)]
+    return [JobRecord(parsed_fields(i)) for i in range(count)]
+
+def measure(kind, count):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    jobs = build(kind, count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        write_json_array(os.path.join(directory, 'jobs.json'), jobs)
+        write_csv(os.path.join(directory, 'jobs.csv'), jobs, CSV_COLUMNS)
+        write_seconds = time.perf_counter() - start
+    return retained, peak, elapsed, write_seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"\n=== JOB RECORD MEMORY BENCHMARK ({args.jobs:,} jobs) ===")
+    print(f"{'representation':<15} {'retained MB':>12} {'peak MB':>9} {'bytes/job':>10} {'build s':>8} {'write s':>8}")
+    results = {}
+    for kind in ('dict', 'JobRecord'):
+        retained, peak, elapsed, write_seconds = measure(kind, args.jobs)
+        results[kind] = retained
+        print(f"{kind:<15} {retained / 1024 / 1024:>12.1f} {peak / 1024 / 1024:>9.1f} {retained / args.jobs:>10.0f} "
+              f"{elapsed:>8.2f} {write_seconds:>8.2f}")
+    print(f"JobRecord retains {1 - results['JobRecord'] / results['dict']:.0%} less memory")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-pass title matching versus one lowercase-and-search per keyword
+5,000 title patterns over a 2 MB page; also times the cold automaton build against
+loading it from the on-disk cache
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from keyword_matcher import KeywordMatcher
+
+def synthetic_corpus(patterns, page_bytes, seed=7):
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(4000)]
+    titles = [' '.join(rng.sample(words, rng.randint(1, 4))).title() for _ in range(patterns)]
+    chunks = []
+    size = 0
+    while size < page_bytes:
+        chunk = rng.choice(titles) if rng.random() < 0.02 else rng.choice(words)
+        chunks.append(chunk)
+        size += len(chunk) + 1
+    return titles, ' '.join(chunks)
+
+def naive_matches(titles, page_text):
+    """The previous approach: lowercase the page again for every keyword"""
+    return [title for title in titles if title.lower() in page_text.lower()]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--patterns", type=int, default=5000)
+    parser.add_argument("--megabytes", type=float, default=2.0)
+    parser.add_argument("--naive-sample", type=int, default=500,
+                        help="keywords timed for the naive path (extrapolated to all patterns)")
+    args = parser.parse_args()
+
+    titles, page_text = synthetic_corpus(args.patterns, int(args.megabytes * 1024 * 1024))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        KeywordMatcher.cached(titles, cache_dir)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher.cached(titles, cache_dir)
+        warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = matcher.first_matches(page_text)
+    scan = time.perf_counter() - start
+
+    sample = titles[:args.naive_sample]
+    start = time.perf_counter()
+    naive_found = naive_matches(sample, page_text)
+    naive = (time.perf_counter() - start) * len(titles) / len(sample)
+    agrees = set(naive_found) == {title for title in found if title in set(sample)}
+
+    print(f"\n=== KEYWORD MATCHER BENCHMARK ({len(titles)} patterns, {len(page_text) / 1024 / 1024:.1f} MB) ===")
+    print(f"automaton build (cold):     {cold:8.3f}s")
+    print(f"automaton load (cached):    {warm:8.3f}s")
+    print(f"single-pass scan:           {scan:8.3f}s  ({len(found)} titles found)")
+    print(f"per-keyword scan (est.):    {naive:8.3f}s  ({naive / scan:.0f}x slower, results agree: {agrees})")
+
+if __name__ == "__main__":
+    main()
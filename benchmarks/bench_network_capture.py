@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: network-capture listing extraction against the scroll-and-read-the-DOM path
+Loads an infinite-scroll company jobs page (or a recorded fixture archive) in headless
+Chrome and reports time-to-complete-listing, Python CPU seconds and browser main-thread
+CPU seconds (DevTools Performance.getMetrics TaskDuration) for each extraction mode
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from driver_provision import DriverProvider
+from fixture_server import FixtureServer, infinite_scroll_fixture_handler
+from job_state import COMPANY_JOBS_URL
+from linkedin_job_scraper import LinkedInJobScraper
+from replay_archive import FixtureArchive, ReplayServer
+
+MODES = ('script', 'network')
+
+def browser_task_seconds(driver):
+    """Seconds the page's renderer main thread has been busy (scripting, style, layout, paint)"""
+    metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    return next((metric['value'] for metric in metrics if metric['name'] == 'TaskDuration'), 0.0)
+
+def time_listing(driver, url, mode):
+    scraper = LinkedInJobScraper(extraction_mode=mode, driver=driver)
+    scraper.base_url = url
+    driver.get('about:blank')
+    driver.execute_cdp_cmd('Performance.enable', {})
+    browser_before = browser_task_seconds(driver)
+    cpu_before = time.process_time()
+    start = time.perf_counter()
+    scraper.load_listing()
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': elapsed,
+        'python_cpu': time.process_time() - cpu_before,
+        'browser_cpu': browser_task_seconds(driver) - browser_before,
+        'jobs': len(scraper.jobs_data),
+        'ids': sorted(job.get('job_id') or job['job_url'] for job in scraper.jobs_data),
+        'fallbacks': scraper.capture_counts['fallbacks'],
+    }
+
+def median_run(runs):
+    runs = sorted(runs, key=lambda run: run['seconds'])
+    return runs[len(runs) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=110, help="postings on the synthetic page")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--archive", metavar="ZIP", help="replay a recorded fixture archive instead")
+    parser.add_argument("--offline", action="store_true", help="never download chromedriver")
+    args = parser.parse_args()
+
+    if args.archive:
+        server = ReplayServer(FixtureArchive(args.archive)).start()
+        url = server.url_for(COMPANY_JOBS_URL.format(slug='poweredbymrp'))
+    else:
+        server = FixtureServer(infinite_scroll_fixture_handler(args.jobs)).start()
+        url = server.url('/company/poweredbymrp/jobs/')
+
+    # One browser with the performance log on serves both modes; only network mode reads the log
+    provider = DriverProvider(offline=args.offline, capture_network=True)
+    driver = provider.launch()
+    results = {}
+    try:
+        for mode in MODES:
+            results[mode] = median_run([time_listing(driver, url, mode) for _ in range(args.repeats)])
+    finally:
+        driver.quit()
+        server.stop()
+
+    print(f"\n=== NETWORK CAPTURE BENCHMARK ({'archive ' + args.archive if args.archive else f'{args.jobs} jobs'}, "
+          f"median of {args.repeats}) ===")
+    print(f"{'mode':>8} {'jobs':>5} {'listing s':>10} {'python cpu s':>13} {'browser cpu s':>14} {'fallbacks':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>8} {result['jobs']:>5} {result['seconds']:>10.3f} {result['python_cpu']:>13.3f} "
+              f"{result['browser_cpu']:>14.3f} {result['fallbacks']:>10}")
+    base, capture = results['script'], results['network']
+    print(f"speedup: {base['seconds'] / max(capture['seconds'], 1e-9):.1f}x to a complete listing, "
+          f"same postings: {base['ids'] == capture['ids']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: field normalization throughput, row by row and column-wise
+Synthetic scraped postings drawn from a few hundred distinct titles, companies, locations,
+posted times, employment types and salaries, plus per-row URLs, descriptions and
+requirement lists; reports rows/sec for normalize_job without memoization, with a cold and
+a warm cache, and for normalize_frame cold and warm, and checks every output column agrees
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+
+import job_normalize
+from job_normalize import cache_clear, cache_info, gazetteer, normalize_frame, normalize_job
+
+ROLES = ['Manager', 'Specialist', 'Coordinator', 'Analyst', 'Engineer', 'Consultant', 'Director', 'Trainer']
+AREAS = ['Finance', 'Supply Chain', 'Ecommerce', 'Sales', 'Clinical', 'Marketing', 'Procurement', 'Service']
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Contract (1099)', 'Internship', 'Temporary', None]
+STATE_NAMES = {code: name.title() for name, code in job_normalize.STATE_ABBREVIATIONS.items()}
+TODAY = date(2025, 9, 15)
+FREE_TEXT = ('job_url', 'description', 'requirements')
+
+def value_pools(seed):
+    rng = np.random.default_rng(seed)
+    places = sorted((name, state) for states in gazetteer().places.values() for state, name in states.items())
+    locations = ['Remote', 'Not specified', 'United States']
+    for name, state in places:
+        locations += [f"{name}, {STATE_NAMES.get(state, state)}", f"{name}, {state}, United States",
+                      f"Greater {name} Area"]
+    units = ['minute', 'hour', 'day', 'week', 'month']
+    posted = [f"{n} {unit}{'s' if n > 1 else ''} ago" for n in range(1, 31) for unit in units]
+    posted += [f"2025-0{month}-{day:02d}T00:00:00Z" for month in range(6, 10) for day in range(1, 29)]
+    salaries = [None] * 200 + [f"${low}K - ${low + rng.integers(10, 60)}K" for low in range(40, 200, 2)]
+    titles = [f"{senior}{area} {role}" for senior in ('', 'Senior ', 'Sr. ') for area in AREAS for role in ROLES]
+    companies = ['Powered By MRP', 'Acme Inc', 'Globex', 'Not specified']
+    return {'title': titles, 'company': companies, 'location': locations, 'posted_time': posted, 'job_type': JOB_TYPES,
+            'salary': salaries}
+
+def synthetic_frame(rows, seed=7):
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, pool in value_pools(seed).items():
+        # Skewed draws: a few values dominate, like real scrape output
+        weights = 1 / np.arange(1, len(pool) + 1) ** 0.8
+        values = np.empty(len(pool), dtype=object)
+        values[:] = pool
+        columns[name] = values[rng.choice(len(pool), size=rows, p=weights / weights.sum())]
+    # Free-text fields are close to unique per row, so neither path can share work on them
+    columns['job_url'] = [f"https://www.linkedin.com/jobs/view/{4000000000 + i}/" for i in range(rows)]
+    columns['description'] = [f"Posting {i}: join the team." if i % 20 else 'Description not available'
+                              for i in range(rows)]
+    columns['requirements'] = [[f"Requirement {i}", f"{i % 7 + 1} years experience"] for i in range(rows)]
+    return pd.DataFrame(columns)
+
+def uncached():
+    """Swap the memoized normalizers for their undecorated functions; returns a restore callback"""
+    saved = {function.__name__: function for function in job_normalize.MEMOIZED}
+    for name, function in saved.items():
+        setattr(job_normalize, name, function.__wrapped__)
+    return lambda: [setattr(job_normalize, name, function) for name, function in saved.items()]
+
+def time_rows(records):
+    start = time.perf_counter()
+    for record in records:
+        normalize_job(record, TODAY)
+    return time.perf_counter() - start
+
+def time_frame(frame):
+    start = time.perf_counter()
+    normalize_frame(frame, TODAY)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--uncached-rows", type=int, default=100_000,
+                        help="rows for the unmemoized baseline (it is slow)")
+    args = parser.parse_args()
+
+    frame = synthetic_frame(args.rows)
+    # Scrapers hand over None for missing fields, not NaN
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    distinct = {name: frame[name].nunique(dropna=False) for name in frame if name not in FREE_TEXT}
+    print(f"\n=== NORMALIZATION BENCHMARK ({args.rows:,} rows; distinct values: "
+          f"{', '.join(f'{name} {count}' for name, count in distinct.items())}) ===")
+
+    gazetteer()
+    restore = uncached()
+    try:
+        baseline = args.uncached_rows / time_rows(records[:args.uncached_rows])
+    finally:
+        restore()
+
+    cache_clear()
+    rows_cold = args.rows / time_rows(records)
+    rows_warm = args.rows / time_rows(records)
+    info = cache_info()['location_parts']
+    cache_clear()
+    frame_cold = args.rows / time_frame(frame)
+    frame_warm = args.rows / time_frame(frame)
+
+    print(f"{'mode':<28} {'rows/s':>12}")
+    for mode, rate in (('normalize_job, no memo', baseline), ('normalize_job, cold cache', rows_cold),
+                       ('normalize_job, warm cache', rows_warm), ('normalize_frame, cold cache', frame_cold),
+                       ('normalize_frame, warm cache', frame_warm)):
+        print(f"{mode:<28} {rate:>12,.0f}")
+
+    print(f"normalize_job location cache: {info.hits:,} hits, {info.misses:,} misses")
+    sample = frame.sample(min(1000, args.rows), random_state=1)
+    columns = normalize_frame(sample, TODAY).astype(object)
+    columns = columns.where(columns.notna(), None).to_dict('records')
+    records = sample.astype(object).where(sample.notna(), None).to_dict('records')
+    # normalize_job leaves out keys it has no value for; normalize_frame has a missing value there
+    mismatched = sorted({name for record, row in zip(records, columns)
+                         for name, value in row.items() if normalize_job(record, TODAY).get(name) != value})
+    print(f"normalize_frame agrees with normalize_job on all {len(columns[0])} columns of a 1k-row sample: "
+          f"{'yes' if not mismatched else 'no, differs on ' + ', '.join(mismatched)}")
+
+if __name__ == "__main__":
+    main()
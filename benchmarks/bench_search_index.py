@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: search index build time, artifact size and query latency
+Builds the site search index for synthetic site-schema jobs at several corpus sizes and
+times text, facet and combined queries against the linear filter-and-substring scan
+JobListings used to run over the whole jobs array
+"""
+
+import argparse
+import gzip
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search_index import SearchIndex, build_index
+
+ROLES = ['Manager', 'Specialist', 'Coordinator', 'Analyst', 'Engineer', 'Consultant', 'Director', 'Trainer']
+AREAS = ['Finance', 'Supply Chain', 'Ecommerce', 'Sales', 'Clinical', 'Marketing', 'Procurement', 'Service']
+CITIES = ['Park City, UT', 'Orem, UT', 'Austin, TX', 'Denver, CO', 'Boston, MA', 'Remote']
+TYPES = ['Full Time', 'Part Time', 'Contract']
+QUERIES = [
+    ('text', 'supply chain', {}),
+    ('prefix', 'logist', {}),
+    ('facet', '', {'department': 'Finance', 'location': 'Austin, TX'}),
+    ('combined', 'clinical trainer', {'type': 'Full Time', 'remote': True}),
+]
+
+def synthetic_jobs(count, seed=5):
+    rng = random.Random(seed)
+    # Zipf-ish body vocabulary so a few words are everywhere and most are rare
+    vocabulary = [f"term{i}" for i in range(5000)] + ['logistics', 'devices', 'training', 'customers', 'inventory']
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    jobs = []
+    for i in range(count):
+        area, role = rng.choice(AREAS), rng.choice(ROLES)
+        words = rng.choices(vocabulary, weights, k=80)
+        jobs.append({
+            'id': f"job-{i}",
+            'title': f"{rng.choice(['', 'Senior '])}{area} {role}",
+            'department': area,
+            'location': rng.choice(CITIES),
+            'type': rng.choice(TYPES),
+            'remote': rng.random() < 0.2,
+            'description_md': f"Join our {area.lower()} team as a {role.lower()}. " + ' '.join(words),
+            'requirements_md': '- ' + '\n- '.join(' '.join(rng.choices(vocabulary, weights, k=6)) for _ in range(5)),
+        })
+    return jobs
+
+def linear_search(jobs, query, filters):
+    """The scan the site did before the index: chained facet filters, then substring match"""
+    matches = jobs
+    for facet, value in filters.items():
+        matches = [job for job in matches if job.get(facet) == value]
+    needle = query.strip().lower()
+    if needle:
+        matches = [job for job in matches
+                   if any(needle in (job.get(field) or '').lower()
+                          for field in ('title', 'description_md', 'requirements_md'))]
+    return [job['id'] for job in matches]
+
+def latency(function, repeats):
+    """p50 and p99 milliseconds over repeated calls"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,10000,100000")
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    print("\n=== SEARCH INDEX BUILD ===")
+    print(f"{'jobs':>8} {'build s':>9} {'terms':>8} {'jobs.json KB':>13} {'index KB':>9} {'index gz KB':>12} {'load ms':>8}")
+    corpora = []
+    for size in (int(value) for value in args.sizes.split(',')):
+        jobs = synthetic_jobs(size)
+        start = time.perf_counter()
+        artifact = build_index(jobs)
+        build_seconds = time.perf_counter() - start
+        encoded = json.dumps(artifact, separators=(',', ':')).encode('utf-8')
+        jobs_size = len(json.dumps(jobs, separators=(',', ':')).encode('utf-8'))
+        start = time.perf_counter()
+        index = SearchIndex(json.loads(encoded))
+        load_ms = (time.perf_counter() - start) * 1000
+        print(f"{size:>8} {build_seconds:>9.3f} {len(artifact['terms']):>8} {jobs_size / 1024:>13,.0f} "
+              f"{len(encoded) / 1024:>9,.0f} {len(gzip.compress(encoded)) / 1024:>12,.0f} {load_ms:>8.1f}")
+        corpora.append((size, jobs, index))
+
+    print(f"\n=== SEARCH QUERY LATENCY (ms, {args.repeats} runs; first run includes posting decode) ===")
+    print(f"{'jobs':>8} {'query':>9} {'hits':>7} {'index p50':>10} {'index p99':>10} {'scan p50':>9} {'scan p99':>9}")
+    for size, jobs, index in corpora:
+        for name, query, filters in QUERIES:
+            hits = len(index.search(query, filters))
+            index_p50, index_p99 = latency(lambda: index.search(query, filters), args.repeats)
+            scan_p50, scan_p99 = latency(lambda: linear_search(jobs, query, filters), max(3, args.repeats // 10))
+            print(f"{size:>8} {name:>9} {hits:>7} {index_p50:>10.3f} {index_p99:>10.3f} "
+                  f"{scan_p50:>9.3f} {scan_p99:>9.3f}")
+
+if __name__ == "__main__":
+    main()
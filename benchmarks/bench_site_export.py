@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single jobs.json against the sharded, precompressed site export
+Copies of the real job postings at several corpus sizes are exported both ways;
+reports export time, total bytes and first-load bytes per encoding, the time and
+bytes written by an incremental re-export after a few jobs change, and the size of the
+search index the job list fetches on the first search (left out of the first load)
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search_index import write_search_index
+from site_export import ShardedExport, export_single, print_report
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def synthetic_jobs(count, seed=3):
+    """The site's own postings repeated under new ids, padded to scraped-posting length with varied text"""
+    with open(ROOT / 'src' / 'data' / 'jobs.json', encoding='utf-8') as f:
+        templates = json.load(f)
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(3000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    jobs = []
+    for i in range(count):
+        job = dict(templates[i % len(templates)])
+        job['id'] = f"{job['id']}-{i}"
+        job['description_md'] += ' ' + ' '.join(rng.choices(vocabulary, weights, k=250))
+        job['requirements_md'] += ''.join(f"\n- {' '.join(rng.choices(vocabulary, weights, k=10))}" for _ in range(6))
+        jobs.append(job)
+    return jobs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--changed", type=float, default=0.01, help="share of jobs edited before the re-export")
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(',')):
+        jobs = synthetic_jobs(size)
+        directory = tempfile.mkdtemp(prefix='site-export-')
+        try:
+            reports = {'single': export_single(jobs, os.path.join(directory, 'jobs.json'))}
+            exporter = ShardedExport(os.path.join(directory, 'jobs'))
+            reports['sharded'] = exporter.report(exporter.export(jobs))
+            index_path = os.path.join(directory, 'search-index.json')
+            write_search_index(index_path, jobs)
+            index_bytes = os.path.getsize(index_path)
+
+            step = max(1, int(1 / args.changed)) if args.changed else size + 1
+            for job in jobs[::step]:
+                job['title'] += ' (Updated)'
+            exporter = ShardedExport(os.path.join(directory, 'jobs'))
+            reports['sharded incremental'] = exporter.report(exporter.export(jobs))
+            stats = exporter.stats
+        finally:
+            shutil.rmtree(directory)
+
+        print(f"\n{size} jobs")
+        print_report(reports)
+        print(f"incremental re-export: {stats['written']} files written ({stats['bytes_written']:,} bytes), "
+              f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+        print(f"search index: {index_bytes:,} bytes raw, fetched on the first search or filter, not on first load")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak RSS and time-to-first-record for streaming output versus end-of-run dumps
+Each path runs in a fresh subprocess over the same synthetic jobs: the previous path
+collects everything, builds a pandas DataFrame and dumps JSON/CSV at the end; the
+streaming path appends each job to JSONL/CSV as it is produced and finalizes the JSON
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fixture_server import synthetic_job
+
+def synthetic_detailed_job(i):
+    job = synthetic_job(i)
+    job['job_url'] = f"https://www.linkedin.com/jobs/view/{job['job_id']}/"
+    job['description'] = f"Role {i} at Powered By MRP. " * 40
+    job['requirements'] = [f"Requirement {n} for job {i}" for n in range(6)]
+    job['benefits'] = "Medical, dental and 401(k) benefits"
+    job['salary'] = "Not specified"
+    job['employment_type'] = job['job_type']
+    return job
+
+def run_bulk(out_dir, count):
+    import pandas as pd
+    start = time.perf_counter()
+    jobs_data = [synthetic_detailed_job(i) for i in range(count)]
+    with open(Path(out_dir) / "jobs.json", 'w', encoding='utf-8') as f:
+        json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+    first_record = time.perf_counter() - start
+    pd.DataFrame(jobs_data).to_csv(Path(out_dir) / "jobs.csv", index=False, encoding='utf-8')
+    return first_record, time.perf_counter() - start
+
+def run_streaming(out_dir, count):
+    from job_sink import StreamingJobSink
+    from linkedin_job_scraper import CSV_COLUMNS
+    start = time.perf_counter()
+    sink = StreamingJobSink(str(Path(out_dir) / "jobs.json"), str(Path(out_dir) / "jobs.csv"), CSV_COLUMNS)
+    first_record = None
+    for i in range(count):
+        sink.write(synthetic_detailed_job(i))
+        if first_record is None:
+            first_record = time.perf_counter() - start
+    sink.finalize()
+    return first_record, time.perf_counter() - start
+
+def child(path, count):
+    with tempfile.TemporaryDirectory() as out_dir:
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        runner = run_bulk if path == 'bulk' else run_streaming
+        first_record, total = runner(out_dir, count)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        size = sum(p.stat().st_size for p in Path(out_dir).iterdir())
+    print(json.dumps({'first_record': first_record, 'total': total, 'peak_kb': peak,
+                      'growth_kb': peak - baseline, 'bytes': size}))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--child", choices=["bulk", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.jobs)
+        return
+
+    print(f"\n=== STREAMING OUTPUT BENCHMARK ({args.jobs} jobs) ===")
+    print(f"{'path':<10} {'first record s':>15} {'total s':>9} {'peak RSS MB':>12} {'output MB':>10}")
+    for path in ("bulk", "streaming"):
+        result = subprocess.run([sys.executable, __file__, "--jobs", str(args.jobs), "--child", path],
+                                capture_output=True, text=True, check=True)
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{path:<10} {stats['first_record']:>15.3f} {stats['total']:>9.2f} "
+              f"{stats['peak_kb'] / 1024:>12.1f} {stats['bytes'] / 1024 / 1024:>10.1f}")
+
+if __name__ == "__main__":
+    main()
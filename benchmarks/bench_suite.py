@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for parsing, extraction and output at 10 / 1k / 100k jobs
+asv-style: every time_* function takes the job count and its input is built by the
+matching setup_* function outside the timed region. Pages come from synthetic cards or,
+with --archive, from the listing pages in a recorded fixture archive. --save writes the
+results and --compare flags anything slower than a saved baseline.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from fixture_server import TITLES, render_job_card, synthetic_job
+from job_sink import StreamingJobSink, write_csv, write_json_array
+from replay_archive import FixtureArchive
+from simple_linkedin_scraper import CSV_COLUMNS, SimpleLinkedInScraper
+
+CARD_SOURCE = {'cards': None}
+DEVNULL = open(os.devnull, 'w')
+
+def card_html(count):
+    """count listing cards, cycling through the recorded ones when an archive was given"""
+    recorded = CARD_SOURCE['cards']
+    if recorded:
+        return ''.join(recorded[i % len(recorded)] for i in range(count))
+    return ''.join(render_job_card(synthetic_job(i)) for i in range(count))
+
+def listing_page(count):
+    return (f'<!DOCTYPE html><html><body><div class="jobs-search-results-list"><ul>{card_html(count)}'
+            f'</ul></div></body></html>')
+
+def general_content_page(count):
+    """A page without job cards whose text mentions a job title every few sentences"""
+    paragraphs = ''.join(f"<p>We are growing the team. Apply for our {TITLES[i % len(TITLES)]} opening "
+                         f"in office {i}.</p>" for i in range(count))
+    return f"<!DOCTYPE html><html><body><main>{paragraphs}</main></body></html>"
+
+def quiet_scraper():
+    return SimpleLinkedInScraper()
+
+def setup_extract_jobs_from_html(count):
+    scraper = quiet_scraper()
+    return scraper, BeautifulSoup(listing_page(count), scraper.parser)
+
+def time_extract_jobs_from_html(state):
+    scraper, soup = state
+    scraper.jobs_data = []
+    scraper.extract_jobs_from_html(soup)
+
+def setup_extract_job_data(count):
+    scraper, soup = setup_extract_jobs_from_html(count)
+    return scraper, scraper.find_job_elements(soup)
+
+def time_extract_job_data(state):
+    scraper, cards = state
+    for card in cards:
+        scraper.extract_job_data(card)
+
+def setup_extract_from_general_content(count):
+    scraper = quiet_scraper()
+    scraper.title_matcher
+    return scraper, BeautifulSoup(general_content_page(count), scraper.parser)
+
+def time_extract_from_general_content(state):
+    scraper, soup = state
+    scraper.jobs_data = []
+    scraper.extract_from_general_content(soup)
+
+def setup_save(count):
+    scraper, cards = setup_extract_job_data(count)
+    jobs = [scraper.extract_job_data(card) for card in cards]
+    return jobs, tempfile.mkdtemp()
+
+def time_save_json(state):
+    jobs, directory = state
+    write_json_array(os.path.join(directory, 'jobs.json'), jobs)
+
+def time_save_csv(state):
+    jobs, directory = state
+    write_csv(os.path.join(directory, 'jobs.csv'), jobs, CSV_COLUMNS)
+
+def time_stream_sink(state):
+    jobs, directory = state
+    sink = StreamingJobSink(os.path.join(directory, 'stream.json'), os.path.join(directory, 'stream.csv'),
+                            CSV_COLUMNS)
+    for job in jobs:
+        sink.write(job)
+    sink.finalize()
+
+BENCHMARKS = [
+    ('extract_jobs_from_html', setup_extract_jobs_from_html, time_extract_jobs_from_html),
+    ('extract_job_data', setup_extract_job_data, time_extract_job_data),
+    ('extract_from_general_content', setup_extract_from_general_content, time_extract_from_general_content),
+    ('save_json', setup_save, time_save_json),
+    ('save_csv', setup_save, time_save_csv),
+    ('stream_sink', setup_save, time_stream_sink),
+]
+
+def load_archive_cards(path):
+    """Outer HTML of every job card found in the archive's recorded pages"""
+    cards = []
+    scraper = quiet_scraper()
+    with FixtureArchive(path) as archive:
+        for key in archive.index:
+            entry, body = archive.lookup(key)
+            if not entry['content_type'].startswith('text/html'):
+                continue
+            with redirect_stdout(DEVNULL):
+                cards.extend(str(card) for card in scraper.find_job_elements(BeautifulSoup(body, scraper.parser)))
+    return cards
+
+def run(name, setup, timed, count, repeats):
+    with redirect_stdout(DEVNULL):
+        state = setup(count)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            timed(state)
+            timings.append(time.perf_counter() - start)
+    return {'benchmark': name, 'jobs': count, 'min': min(timings), 'median': statistics.median(timings),
+            'repeats': repeats}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="10,1000,100000")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per benchmark (one above 10k jobs)")
+    parser.add_argument("--bench", action="append", help="only run benchmarks whose name contains this")
+    parser.add_argument("--archive", help="take job cards from a recorded fixture archive")
+    parser.add_argument("--save", metavar="JSON", help="write results for later --compare runs")
+    parser.add_argument("--compare", metavar="JSON", help="baseline results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    if args.archive:
+        CARD_SOURCE['cards'] = load_archive_cards(args.archive)
+        if not CARD_SOURCE['cards']:
+            parser.error(f"no job cards found in {args.archive}")
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = {(r['benchmark'], r['jobs']): r for r in json.load(f)}
+
+    results = []
+    regressions = 0
+    print(f"\n=== BENCHMARK SUITE ({'archive cards' if args.archive else 'synthetic cards'}) ===")
+    print(f"{'benchmark':<30} {'jobs':>8} {'min s':>9} {'median s':>9} {'us/job':>9} {'vs base':>8}")
+    for name, setup, timed in BENCHMARKS:
+        if args.bench and not any(part in name for part in args.bench):
+            continue
+        for count in (int(value) for value in args.scales.split(',')):
+            result = run(name, setup, timed, count, args.repeats if count <= 10_000 else 1)
+            results.append(result)
+            change = ''
+            base = baseline.get((name, count))
+            if base:
+                ratio = result['min'] / base['min'] - 1
+                change = f"{ratio:+.0%}"
+                if ratio > args.tolerance:
+                    change += ' !'
+                    regressions += 1
+            print(f"{name:<30} {count:>8,} {result['min']:>9.4f} {result['median']:>9.4f} "
+                  f"{result['min'] / count * 1e6:>9.1f} {change:>8}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.save}")
+    if regressions:
+        print(f"{regressions} benchmarks regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Local fixture HTTP server and synthetic LinkedIn-style pages for the benchmarks
+Lets the scrapers run end to end without hitting linkedin.com
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from html import escape
+
+LOCATIONS = ["Park City, Utah", "Salt Lake City, Utah", "Austin, Texas", "Remote", "Denver, Colorado"]
+TITLES = [
+    "Ecommerce Specialist",
+    "Supply Chain Manager",
+    "Director of Sales and Operations",
+    "Depot Service and Sales Operations Manager",
+    "Ecommerce Manager",
+    "Clinical Trainer",
+    "Field Service Technician",
+    "Account Executive",
+]
+
+class FixtureResponse:
+    """Status, headers and body returned by a fixture handler"""
+
+    def __init__(self, body=b"", status=200, headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = dict(headers or {})
+        self.headers.setdefault("Content-Type", "text/html; charset=utf-8")
+
+class FixtureServer:
+    """Threaded HTTP server on localhost that answers every request from a handler function"""
+
+    def __init__(self, handler, latency=0.0, host="127.0.0.1", port=0):
+        self.handler = handler
+        self.latency = latency
+        self.requests = 0
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                response = server.handler(self)
+                if not isinstance(response, FixtureResponse):
+                    response = FixtureResponse(response)
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+                with server.lock:
+                    server.requests += 1
+                    server.bytes_sent += len(response.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), RequestHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def synthetic_job(i):
+    """Deterministic listing-card fields for job number i"""
+    return {
+        "job_id": str(3900000000 + i),
+        "title": TITLES[i % len(TITLES)],
+        "company": "Powered By MRP",
+        "location": LOCATIONS[i % len(LOCATIONS)],
+        "posted_time": f"2025-09-{1 + i % 28:02d}",
+        "job_type": "Full-time" if i % 5 else "Contract",
+    }
+
+def render_job_card(job, base_url=""):
+    """One listing card using the selectors both scrapers look for"""
+    return f"""
+    <li class="jobs-search-results__list-item" data-job-id="{job['job_id']}">
+      <div class="base-card job-search-card" data-job-id="{job['job_id']}">
+        <h3 class="job-search-card__title"><a href="{base_url}/jobs/view/{job['job_id']}/">{escape(job['title'])}</a></h3>
+        <h4><a class="job-search-card__subtitle-link" href="{base_url}/company/poweredbymrp">{escape(job['company'])}</a></h4>
+        <span class="job-search-card__location">{escape(job['location'])}</span>
+        <time class="job-search-card__listdate" datetime="{job['posted_time']}">{job['posted_time']}</time>
+        <span class="job-search-card__metadata-item">{escape(job['job_type'])}</span>
+      </div>
+    </li>"""
+
+def render_listing_page(count, base_url="", start=0):
+    """A company jobs page with `count` cards"""
+    cards = "".join(render_job_card(synthetic_job(i), base_url) for i in range(start, start + count))
+    return f"""<!DOCTYPE html>
+<html><head><title>Powered By MRP Jobs</title></head>
+<body><div class="jobs-search-results-list"><ul>{cards}
+</ul></div></body></html>"""
+
+def render_job_page(i, paragraphs=6):
+    """A job detail page with description, requirements and top-card insights"""
+    job = synthetic_job(i)
+    body = "".join(
+        f"<p>Paragraph {n} about the {escape(job['title'])} role at Powered By MRP, "
+        f"the medical aesthetics marketplace headquartered in Park City.</p>"
+        for n in range(paragraphs)
+    )
+    requirements = "".join(f"<li>Requirement {n} for {escape(job['title'])}</li>" for n in range(5))
+    return f"""<!DOCTYPE html>
+<html><head><title>{escape(job['title'])}</title></head>
+<body>
+  <div class="jobs-unified-top-card">
+    <h1 class="jobs-unified-top-card__job-title">{escape(job['title'])}</h1>
+    <span class="jobs-unified-top-card__job-insight">Medical, dental and 401(k) benefits</span>
+    <span class="jobs-unified-top-card__job-insight--salary">$80,000/yr - $120,000/yr</span>
+    <span class="jobs-unified-top-card__job-insight--employment-type">{escape(job['job_type'])}</span>
+  </div>
+  <div class="jobs-description-content__text">{body}<ul>{requirements}</ul></div>
+</body></html>"""
+
+def linkedin_fixture_handler(listing_count=25):
+    """Handler serving a listing page at / and detail pages at /jobs/view/<id>/"""
+
+    def handle(request):
+        path = request.path.split("?", 1)[0]
+        if path.startswith("/jobs/view/"):
+            job_id = int(path.strip("/").rsplit("/", 1)[-1])
+            return FixtureResponse(render_job_page(job_id - 3900000000))
+        if path in ("/", "/company/poweredbymrp/jobs/"):
+            return FixtureResponse(render_listing_page(listing_count))
+        return FixtureResponse("not found", status=404)
+
+    return handle
+
+def guest_fixture_handler(total_jobs=100, page_size=25):
+    """Handler mimicking the guest listing API (paged by ?start=) and guest job posting pages"""
+    from urllib.parse import parse_qs, urlparse
+
+    def handle(request):
+        parsed = urlparse(request.path)
+        if parsed.path == "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            start = int(parse_qs(parsed.query).get("start", ["0"])[0])
+            count = max(0, min(page_size, total_jobs - start))
+            cards = "".join(render_job_card(synthetic_job(i)) for i in range(start, start + count))
+            return FixtureResponse(cards)
+        if parsed.path.startswith("/jobs-guest/jobs/api/jobPosting/"):
+            job_id = int(parsed.path.rsplit("/", 1)[-1])
+            return FixtureResponse(render_job_page(job_id - 3900000000))
+        return FixtureResponse("not found", status=404)
+
+    return handle
+
+def with_validators(handler, last_modified="Mon, 01 Sep 2025 00:00:00 GMT"):
+    """Wrap a handler so 200s carry ETag/Last-Modified and matching conditional GETs get 304"""
+    import hashlib
+
+    def handle(request):
+        response = handler(request)
+        if not isinstance(response, FixtureResponse):
+            response = FixtureResponse(response)
+        if response.status != 200:
+            return response
+        etag = '"' + hashlib.sha1(response.body).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return FixtureResponse(b"", status=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = last_modified
+        return response
+
+    return handle
+
+AUTHWALL_PAGE = """<!DOCTYPE html>
+<html><head><title>Sign Up | LinkedIn</title></head>
+<body><script>window.location.href = "/authwall?trk=bf&originalReferer=";</script></body></html>"""
+
+def with_faults(handler, rate=0.3, statuses=(429, 503, 999), retry_after="0", authwall_rate=0.0,
+                outage=None, seed=0):
+    """Wrap a handler so a seeded share of requests fail like an overloaded or suspicious LinkedIn
+
+    `rate` of requests get one of `statuses` (429s carry Retry-After when given), `authwall_rate`
+    get a 200 login-wall page, and requests numbered within the (start, stop) `outage` window all get a 503.
+    handle.faults counts what was injected.
+    """
+    import random
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    faults = {}
+
+    def handle(request):
+        with lock:
+            served = sum(faults.values())
+            roll = rng.random()
+            status = rng.choice(statuses)
+            if outage and outage[0] <= served < outage[1]:
+                kind = 503
+            elif roll < authwall_rate:
+                kind = "authwall"
+            elif roll < authwall_rate + rate:
+                kind = status
+            else:
+                kind = "ok"
+            faults[kind] = faults.get(kind, 0) + 1
+        if kind == "ok":
+            return handler(request)
+        if kind == "authwall":
+            return FixtureResponse(AUTHWALL_PAGE)
+        headers = {"Retry-After": retry_after} if kind == 429 and retry_after is not None else None
+        return FixtureResponse(f"<html><body>Error {kind}</body></html>", status=kind, headers=headers)
+
+    handle.faults = faults
+    return handle
+
+SCROLL_LOADER_SCRIPT = """
+<script>
+let start = %(start)d, loading = false, done = %(done)s;
+window.addEventListener('scroll', async () => {
+  if (done || loading || window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+  loading = true;
+  const response = await fetch('/jobs-guest/jobs/api/seeMoreJobPostings/search?start=' + start);
+  const html = await response.text();
+  const count = (html.match(/jobs-search-results__list-item/g) || []).length;
+  document.querySelector('.jobs-search-results-list ul').insertAdjacentHTML('beforeend', html);
+  start += count;
+  done = count < %(page_size)d;
+  loading = false;
+});
+</script>"""
+
+def infinite_scroll_fixture_handler(total_jobs=100, page_size=25):
+    """Company jobs page that, like LinkedIn's guest page, fetches more cards from the guest API on scroll"""
+    guest = guest_fixture_handler(total_jobs, page_size)
+
+    def handle(request):
+        path = request.path.split("?", 1)[0]
+        if path in ("/", "/company/poweredbymrp/jobs/"):
+            first = min(page_size, total_jobs)
+            loader = SCROLL_LOADER_SCRIPT % {'start': first, 'page_size': page_size,
+                                             'done': 'true' if first < page_size else 'false'}
+            return FixtureResponse(render_listing_page(first).replace("</body>", loader + "</body>"))
+        if path.startswith("/jobs/view/"):
+            job_id = int(path.strip("/").rsplit("/", 1)[-1])
+            return FixtureResponse(render_job_page(job_id - 3900000000))
+        return guest(request)
+
+    return handle
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Normalized job output with a shared company table
+Company records are written once, keyed by ID, and jobs carry only a company_id.
+The loader hands back read-only job views that resolve company_info from the table
+on access, so code written against the denormalized JSON keeps working
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence
+
+from job_normalize import slugify
+from job_sink import json_array_item
+
+def company_key(info):
+    """Stable company ID: a slug of the company name, or of the whole record when unnamed"""
+    name = info.get('company_name') or info.get('name')
+    return slugify(name) if name else slugify(json.dumps(info, sort_keys=True))[:40]
+
+def content_digest(info):
+    return hashlib.sha1(json.dumps(info, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:8]
+
+def split_companies(jobs, field='company_info'):
+    """Yield (companies, job rows) where every row's company blob is replaced by a company_id"""
+    companies = {}
+    seen = {}
+    rows = []
+    for job in jobs:
+        info = job.get(field)
+        row = {key: value for key, value in job.items() if key != field}
+        if info is not None:
+            # Jobs usually share one dict per company, so key by identity before hashing contents;
+            # seen holds each dict too, or a freed dict's id could be reused by a different company
+            cached = seen.get(id(info))
+            company_id = cached[1] if cached else None
+            if company_id is None:
+                company_id = company_key(info)
+                if company_id in companies and companies[company_id] != info:
+                    # Different records whose names slug alike ("Acme" in two cities, "ACME!")
+                    company_id = f"{company_id}-{content_digest(info)}"
+                companies.setdefault(company_id, info)
+                seen[id(info)] = (info, company_id)
+            row['company_id'] = company_id
+        rows.append(row)
+    return companies, rows
+
+def write_normalized(filename, jobs, field='company_info'):
+    """Write {"companies": {...}, "jobs": [...]} via a temp file and atomic rename; returns the job count"""
+    companies, rows = split_companies(jobs, field)
+    tmp_path = filename + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "companies": ')
+        f.write(json.dumps(companies, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+        f.write(',\n  "jobs": ')
+        if rows:
+            f.write('[\n')
+            f.write(',\n'.join('  ' + json_array_item(row).replace('\n', '\n  ') for row in rows))
+            f.write('\n  ]')
+        else:
+            f.write('[]')
+        f.write('\n}')
+    os.replace(tmp_path, filename)
+    return len(rows)
+
+class JobView(Mapping):
+    """Read-only denormalized view of a job row; company_info is looked up when accessed"""
+
+    __slots__ = ('row', 'companies', 'field')
+
+    def __init__(self, row, companies, field='company_info'):
+        self.row = row
+        self.companies = companies
+        self.field = field
+
+    def __getitem__(self, key):
+        if key == self.field and 'company_id' in self.row:
+            return self.companies[self.row['company_id']]
+        return self.row[key]
+
+    def __iter__(self):
+        for key in self.row:
+            if key != 'company_id':
+                yield key
+        if 'company_id' in self.row:
+            yield self.field
+
+    def __len__(self):
+        return len(self.row)
+
+    def __repr__(self):
+        return f"JobView({self.row!r})"
+
+class NormalizedJobs(Sequence):
+    """Jobs loaded from a normalized file, presented as a sequence of denormalized views"""
+
+    def __init__(self, companies, rows, field='company_info'):
+        self.companies = companies
+        self.rows = rows
+        self.field = field
+
+    @classmethod
+    def load(cls, filename, field='company_info'):
+        with open(filename, encoding='utf-8') as f:
+            document = json.load(f)
+        return cls(document.get('companies', {}), document.get('jobs', []), field)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [JobView(row, self.companies, self.field) for row in self.rows[index]]
+        return JobView(self.rows[index], self.companies, self.field)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def denormalized(self):
+        """Plain dicts in the original shape, with the company record shared rather than copied"""
+        return [dict(view) for view in self]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+ChromeDriver provisioning for the Selenium scrapers
+Resolves the chromedriver binary once and caches its path (with an offline mode for
+hosts without internet access), keeps a warm browser for reuse across scrapes and
+blocks images, fonts, stylesheets and trackers to cut page weight
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+DRIVER_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mrp-careers', 'chromedriver.json')
+DRIVER_CACHE_MAX_AGE = 7 * 24 * 3600
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Passed to Network.setBlockedURLs; the job data is all in the HTML and scripts
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*px.ads.linkedin.com*', '*snap.licdn.com*', '*bat.bing.com*', '*hotjar.com*',
+]
+
+# Bytes the page pulled over the network, per the Resource Timing API. Cross-origin
+# responses without Timing-Allow-Origin report 0, so this is a lower bound.
+PAGE_BYTES_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let total = nav ? (nav.transferSize || nav.encodedBodySize || 0) : 0;
+for (const entry of resources) total += entry.transferSize || entry.encodedBodySize || 0;
+return [total, resources.length];
+"""
+
+class DriverProvider:
+    """Launches Chrome drivers from a cached chromedriver path and times how long they take to be ready"""
+
+    def __init__(self, offline=False, block_assets=True, cache_path=DRIVER_CACHE_PATH, debugger_address=None,
+                 headless=True, capture_network=False):
+        self.offline = offline or os.environ.get('MRP_DRIVER_OFFLINE') == '1'
+        self.block_assets = block_assets
+        self.cache_path = cache_path
+        self.debugger_address = debugger_address
+        self.headless = headless
+        self.capture_network = capture_network
+        self.path = None
+        self.path_source = None
+        self.warm_driver = None
+        self.lock = threading.Lock()
+        self.stats = {'resolve_seconds': 0.0, 'launches': [], 'reused': 0}
+
+    def driver_path(self):
+        """chromedriver binary: env override, then the cached path, then a fresh ChromeDriverManager lookup"""
+        if self.path:
+            return self.path
+        start = time.perf_counter()
+        path, source = os.environ.get('CHROMEDRIVER_PATH'), 'env'
+        if not path:
+            path, source = self.cached_path(), 'cache'
+        if not path and self.offline:
+            path, source = shutil.which('chromedriver'), 'PATH'
+        if not path:
+            if self.offline:
+                raise RuntimeError("offline mode: no cached chromedriver; set CHROMEDRIVER_PATH "
+                                   "or put chromedriver on PATH")
+            path, source = self.install(), 'download'
+        self.path, self.path_source = path, source
+        self.stats['resolve_seconds'] += time.perf_counter() - start
+        return path
+
+    def cached_path(self):
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(entry.get('path', '')):
+            return None
+        # Offline hosts keep using whatever was provisioned; online ones re-resolve weekly
+        if not self.offline and time.time() - entry.get('resolved_at', 0) > DRIVER_CACHE_MAX_AGE:
+            return None
+        return entry['path']
+
+    def install(self):
+        """Resolve and download the chromedriver matching the local Chrome, then cache its path"""
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'resolved_at': time.time()}, f)
+        os.replace(tmp_path, self.cache_path)
+        return path
+
+    def options(self):
+        chrome_options = Options()
+        if self.capture_network:
+            # DevTools network events go to the performance log for network_capture to read
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        if self.debugger_address:
+            # Attach to an already running Chrome started with --remote-debugging-port
+            chrome_options.debugger_address = self.debugger_address
+            return chrome_options
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+        if self.block_assets:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        return chrome_options
+
+    def launch(self):
+        """Start a new driver; a stale cached chromedriver that no longer matches Chrome is re-resolved once"""
+        start = time.perf_counter()
+        try:
+            driver = webdriver.Chrome(service=Service(self.driver_path()), options=self.options())
+        except SessionNotCreatedException:
+            if self.path_source != 'cache' or self.offline:
+                raise
+            self.path = None
+            self.path = self.install()
+            self.path_source = 'download'
+            driver = webdriver.Chrome(service=Service(self.path), options=self.options())
+        if self.block_assets:
+            self.block_requests(driver)
+        with self.lock:
+            self.stats['launches'].append(time.perf_counter() - start)
+        return driver
+
+    @staticmethod
+    def block_requests(driver):
+        """Drop asset and tracker requests in the browser before they hit the network"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"Request blocking unavailable: {e}")
+
+    def shared(self):
+        """The warm driver kept for reuse across scrapes, relaunched if it died"""
+        with self.lock:
+            driver = self.warm_driver
+        if driver is not None:
+            try:
+                driver.current_url
+                with self.lock:
+                    self.stats['reused'] += 1
+                return driver
+            except Exception:
+                pass
+        driver = self.launch()
+        with self.lock:
+            self.warm_driver = driver
+        return driver
+
+    def close(self):
+        if self.warm_driver is not None:
+            try:
+                self.warm_driver.quit()
+            except Exception:
+                pass
+            self.warm_driver = None
+
+    def print_summary(self):
+        launches = self.stats['launches']
+        if not launches and not self.path:
+            return
+        print(f"\nDriver ready: chromedriver from {self.path_source} in {self.stats['resolve_seconds']:.3f}s, "
+              f"{len(launches)} launches (avg {sum(launches) / max(1, len(launches)):.2f}s), "
+              f"{self.stats['reused']} warm reuses, asset blocking {'on' if self.block_assets else 'off'}")
+
+class PageWeightMeter:
+    """Per-page transfer sizes read from the browser after each page is extracted"""
+
+    def __init__(self):
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def record(self, driver, page):
+        try:
+            total, resources = driver.execute_script(PAGE_BYTES_SCRIPT)
+        except Exception:
+            return
+        with self.lock:
+            self.pages.append({'page': page, 'bytes': int(total), 'resources': int(resources)})
+
+    def summary(self):
+        count = len(self.pages)
+        total = sum(page['bytes'] for page in self.pages)
+        return {'pages': count, 'bytes': total, 'bytes_per_page': total / count if count else 0.0,
+                'resources_per_page': sum(page['resources'] for page in self.pages) / count if count else 0.0}
+
+    def print_summary(self):
+        summary = self.summary()
+        if summary['pages']:
+            print(f"\nPage weight: {summary['pages']} pages, {summary['bytes_per_page'] / 1024:.1f} KB/page, "
+                  f"{summary['resources_per_page']:.1f} subresources/page")
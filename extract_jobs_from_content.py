@@ -4,10 +4,12 @@ Extract job information from the provided LinkedIn content
 This script processes the already scraped content to extract job listings
 """
 
+import argparse
 import json
-import pandas as pd
 import re
 from datetime import datetime
+from company_table import write_normalized
+from job_sink import write_csv, write_json_array
 
 def extract_jobs_from_linkedin_content():
     """Extract job information from the provided LinkedIn content"""
@@ -171,35 +173,41 @@ def add_company_info(jobs_data):
     
     return jobs_data
 
-def save_jobs_data(jobs_data):
+CSV_COLUMNS = [
+    'title', 'company', 'location', 'posted_time', 'job_type', 'employment_type',
+    'description', 'requirements', 'benefits', 'contact_email', 'contact_phone', 'source'
+]
+
+def flatten_job(job):
+    """Flatten a job into a CSV row for better readability"""
+    return {
+        'title': job.get('title', ''),
+        'company': job.get('company', ''),
+        'location': job.get('location', ''),
+        'posted_time': job.get('posted_time', ''),
+        'job_type': job.get('job_type', ''),
+        'employment_type': job.get('employment_type', ''),
+        'description': job.get('description', ''),
+        'requirements': '; '.join(job.get('requirements', [])),
+        'benefits': '; '.join(job.get('benefits', [])) if isinstance(job.get('benefits'), list) else job.get('benefits', ''),
+        'contact_email': job.get('contact_info', {}).get('email', ''),
+        'contact_phone': job.get('contact_info', {}).get('phone', ''),
+        'source': job.get('source', '')
+    }
+
+def save_jobs_data(jobs_data, history_dir=None, normalized=False):
     """Save the extracted jobs data to various formats"""
     
-    # Save to JSON
-    with open('mrp_jobs_extracted.json', 'w', encoding='utf-8') as f:
-        json.dump(jobs_data, f, indent=2, ensure_ascii=False)
-    print("✅ Data saved to mrp_jobs_extracted.json")
+    # Save to JSON; normalized mode stores each company once and has jobs reference it by ID
+    if normalized:
+        write_normalized('mrp_jobs_normalized.json', jobs_data)
+        print("✅ Data saved to mrp_jobs_normalized.json")
+    else:
+        write_json_array('mrp_jobs_extracted.json', jobs_data)
+        print("✅ Data saved to mrp_jobs_extracted.json")
     
     # Save to CSV (flattened for better readability)
-    csv_data = []
-    for job in jobs_data:
-        csv_row = {
-            'title': job.get('title', ''),
-            'company': job.get('company', ''),
-            'location': job.get('location', ''),
-            'posted_time': job.get('posted_time', ''),
-            'job_type': job.get('job_type', ''),
-            'employment_type': job.get('employment_type', ''),
-            'description': job.get('description', ''),
-            'requirements': '; '.join(job.get('requirements', [])),
-            'benefits': '; '.join(job.get('benefits', [])) if isinstance(job.get('benefits'), list) else job.get('benefits', ''),
-            'contact_email': job.get('contact_info', {}).get('email', ''),
-            'contact_phone': job.get('contact_info', {}).get('phone', ''),
-            'source': job.get('source', '')
-        }
-        csv_data.append(csv_row)
-    
-    df = pd.DataFrame(csv_data)
-    df.to_csv('mrp_jobs_extracted.csv', index=False, encoding='utf-8')
+    write_csv('mrp_jobs_extracted.csv', map(flatten_job, jobs_data), CSV_COLUMNS)
     print("✅ Data saved to mrp_jobs_extracted.csv")
     
     # Save company info separately
@@ -207,6 +215,11 @@ def save_jobs_data(jobs_data):
     with open('mrp_company_info.json', 'w', encoding='utf-8') as f:
         json.dump(company_info, f, indent=2, ensure_ascii=False)
     print("✅ Company info saved to mrp_company_info.json")
+    
+    # Append to the Parquet job history, keeping earlier snapshots
+    if history_dir:
+        from job_history import JobHistoryStore
+        print(f"✅ History snapshot saved to {JobHistoryStore(history_dir).append(jobs_data)}")
 
 def print_summary(jobs_data):
     """Print a summary of the extracted jobs"""
@@ -253,6 +266,14 @@ def print_summary(jobs_data):
 
 def main():
     """Main function to extract and save job information"""
+    parser = argparse.ArgumentParser(description="Extract Powered By MRP jobs from scraped LinkedIn content")
+    parser.add_argument("--history", metavar="DIR",
+                        help="also append the jobs to a Parquet job-history store")
+    parser.add_argument("--normalized", action="store_true",
+                        help="write mrp_jobs_normalized.json with a shared company table instead of "
+                             "company_info on every job")
+    args = parser.parse_args()
+    
     print("🔍 Extracting job information from LinkedIn content...")
     
     # Extract jobs from content
@@ -265,11 +286,11 @@ def main():
     print_summary(jobs_data)
     
     # Save data
-    save_jobs_data(jobs_data)
+    save_jobs_data(jobs_data, args.history, args.normalized)
     
     print(f"\n✅ Job extraction completed successfully!")
     print(f"📁 Files created:")
-    print(f"   • mrp_jobs_extracted.json")
+    print(f"   • {'mrp_jobs_normalized.json' if args.normalized else 'mrp_jobs_extracted.json'}")
     print(f"   • mrp_jobs_extracted.csv") 
     print(f"   • mrp_company_info.json")
 
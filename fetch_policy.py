@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Shared fetch policy for the scrapers
+Classifies every response as ok, retryable, blocked or fatal, retries transient failures
+with jittered exponential back-off that honours Retry-After, and keeps a per-host circuit
+breaker that opens after repeated failures or as soon as LinkedIn shows a login wall
+"""
+
+import asyncio
+import email.utils
+import itertools
+import random
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+import httpx
+import requests
+
+from scrape_metrics import METRICS
+
+OK, RETRY, BLOCKED, FATAL = 'ok', 'retry', 'blocked', 'fatal'
+
+# 999 is LinkedIn's answer to clients it has flagged as bots; it clears up after a pause
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504, 999})
+BLOCKED_STATUSES = frozenset({401, 403})
+TRANSIENT_ERRORS = (requests.RequestException, httpx.HTTPError, OSError)
+
+# Where LinkedIn sends signed-out clients it wants to stop, and how those pages identify themselves
+AUTHWALL_PATHS = ('/authwall', '/login', '/uas/login', '/checkpoint/', '/signup')
+BLOCKED_TITLES = ('sign in', 'sign up', 'log in', 'login', 'security verification', 'security check')
+BLOCKED_MARKERS = ('/authwall?', 'challenge-dialog', 'captcha-internal', 'checkpoint/challenge')
+SNIFF_BYTES = 64 * 1024
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+class FetchError(Exception):
+    """A URL could not be fetched under the policy"""
+
+    def __init__(self, url, reason):
+        super().__init__(f"{url}: {reason}")
+        self.url = url
+        self.reason = reason
+
+class BlockedError(FetchError):
+    """The host is refusing us (login wall, challenge or open circuit); retry_in says when to try again"""
+
+    def __init__(self, url, reason, retry_in):
+        super().__init__(url, f"{reason}; backing off for {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+class CircuitOpenError(BlockedError):
+    """The host's circuit breaker is open, so the request was not sent"""
+
+def challenge_reason(url, text=''):
+    """Why a successful-looking response is really a login wall or bot challenge, or None"""
+    path = urlparse(url or '').path.lower()
+    for prefix in AUTHWALL_PATHS:
+        if path.startswith(prefix):
+            return f"redirected to {prefix.strip('/')}"
+    head = text[:SNIFF_BYTES]
+    match = TITLE_RE.search(head)
+    if match:
+        # Compare whole title segments so a job called "Login Engineer" isn't mistaken for a wall
+        segments = {part.strip() for part in re.split(r'[|,:]', match.group(1).lower())}
+        if segments.intersection(BLOCKED_TITLES):
+            return f"page titled {match.group(1).strip()!r}"
+    for marker in BLOCKED_MARKERS:
+        if marker in head:
+            return f"page contains {marker!r}"
+    return None
+
+def classify(status, url='', text=''):
+    """(kind, reason) for one HTTP response: kind is OK, RETRY, BLOCKED or FATAL"""
+    if status in RETRY_STATUSES or 500 <= status < 600:
+        return RETRY, f"HTTP {status}"
+    if status in BLOCKED_STATUSES:
+        return BLOCKED, f"HTTP {status}"
+    if status >= 400:
+        return FATAL, f"HTTP {status}"
+    reason = challenge_reason(url, text) if status != 304 else None
+    return (BLOCKED, reason) if reason else (OK, None)
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date); None if absent or invalid"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (now if now is not None else time.time()))
+
+def sniff(content):
+    """The start of a response body as text, enough to spot a login wall"""
+    return content[:SNIFF_BYTES].decode('utf-8', errors='replace') if content else ''
+
+class RetryPolicy:
+    """How often and how long to wait between attempts: full-jitter exponential back-off"""
+
+    def __init__(self, max_attempts=4, base_delay=1.0, max_delay=60.0, max_retry_after=300.0, seed=None):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.random = random.Random(seed)
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to sleep after failed attempt number `attempt`; the server's Retry-After wins when given"""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return self.random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+class CircuitBreaker:
+    """Per-host breaker: opens after `threshold` consecutive failures and lets one probe through after a cooldown
+
+    Each time a host trips again without a success in between, its cooldown doubles (up to max_cooldown).
+    """
+
+    def __init__(self, threshold=5, cooldown=30.0, block_cooldown=300.0, max_cooldown=3600.0, clock=time.monotonic):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.block_cooldown = block_cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def entry(self, host):
+        return self.hosts.setdefault(host, {'failures': 0, 'trips': 0, 'open_until': 0.0, 'probing': False})
+
+    def state(self, host):
+        entry = self.hosts.get(host)
+        if not entry or not entry['open_until']:
+            return 'closed'
+        return 'open' if self.clock() < entry['open_until'] else 'half-open'
+
+    def remaining(self, host):
+        """Seconds until the host's circuit lets a request through again"""
+        entry = self.hosts.get(host)
+        return max(0.0, entry['open_until'] - self.clock()) if entry else 0.0
+
+    def acquire(self, host):
+        """0 when a request to the host may go ahead, else the seconds left before it may"""
+        with self.lock:
+            entry = self.entry(host)
+            if not entry['open_until']:
+                return 0.0
+            wait = entry['open_until'] - self.clock()
+            if wait > 0:
+                return wait
+            if entry['probing']:
+                # Half-open: one probe is already out; everyone else waits for its verdict
+                return self.cooldown
+            entry['probing'] = True
+            return 0.0
+
+    def abandon(self, host):
+        """Give back a half-open probe whose request ended without a verdict (cancelled or crashed)"""
+        with self.lock:
+            if host in self.hosts:
+                self.hosts[host]['probing'] = False
+
+    def success(self, host):
+        with self.lock:
+            self.hosts[host] = {'failures': 0, 'trips': 0, 'open_until': 0.0, 'probing': False}
+
+    def failure(self, host):
+        """Count a transient failure; returns True if it opened the circuit"""
+        with self.lock:
+            entry = self.entry(host)
+            entry['failures'] += 1
+            if entry['probing'] or entry['failures'] >= self.threshold:
+                self.open(entry, self.cooldown)
+                return True
+            return False
+
+    def trip(self, host):
+        """Open the circuit straight away, with the longer cooldown used for login walls and challenges"""
+        with self.lock:
+            self.open(self.entry(host), self.block_cooldown)
+
+    def open(self, entry, cooldown):
+        entry['trips'] += 1
+        entry['failures'] = 0
+        entry['probing'] = False
+        entry['open_until'] = self.clock() + min(self.max_cooldown, cooldown * 2 ** (entry['trips'] - 1))
+
+class FetchPolicy:
+    """Retries, circuit breaking and challenge detection around requests, httpx and Selenium page loads"""
+
+    def __init__(self, retry=None, breaker=None, sleep=time.sleep, async_sleep=asyncio.sleep):
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def host(url):
+        return urlparse(url).netloc.lower()
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        METRICS.count('fetch.' + name, value)
+
+    def admit(self, host, url):
+        """Raise CircuitOpenError instead of sending a request to a host that is backing off"""
+        wait = self.breaker.acquire(host)
+        if wait:
+            self.count('short_circuited')
+            raise CircuitOpenError(url, f"circuit open for {host}", wait)
+        self.count('attempts')
+
+    def settle(self, host, url, attempt, kind, reason, retry_after=None):
+        """Book one attempt's outcome; returns seconds to wait before retrying, or None when done"""
+        if kind == OK or kind == FATAL:
+            # A 404 is the page's problem, not the host's
+            self.breaker.success(host)
+            self.count('ok' if kind == OK else 'fatal')
+            return None
+        if kind == BLOCKED:
+            self.breaker.trip(host)
+            self.count('blocked')
+            raise BlockedError(url, reason, self.breaker.remaining(host))
+        self.count('retryable')
+        self.count(f"retryable.{reason.replace(' ', '_').lower()}")
+        if self.breaker.failure(host):
+            self.count('circuit_trips')
+            self.count('failures')
+            raise FetchError(url, f"{reason}; circuit opened for {host}")
+        if attempt >= self.retry.max_attempts:
+            self.count('failures')
+            raise FetchError(url, f"{reason} after {attempt} attempts")
+        if retry_after is not None:
+            self.count('retry_after_honoured')
+        self.count('retries')
+        return self.retry.delay(attempt, retry_after)
+
+    def get(self, session, url, **kwargs):
+        """session.get() under the policy; returns the response (including 4xx) or raises FetchError"""
+        host = self.host(url)
+        for attempt in itertools.count(1):
+            self.admit(host, url)
+            retry_after = None
+            try:
+                response = session.get(url, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                kind, reason = RETRY, type(e).__name__
+            except BaseException:
+                # No verdict on the host; free the half-open probe slot so later requests aren't held forever
+                self.breaker.abandon(host)
+                raise
+            else:
+                kind, reason = classify(response.status_code, response.url, sniff(response.content))
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            delay = self.settle(host, url, attempt, kind, reason, retry_after)
+            if delay is None:
+                return response
+            self.sleep(delay)
+
+    async def aget(self, client, url, throttle=None, **kwargs):
+        """client.get() on an httpx.AsyncClient under the policy; throttle() is awaited before each retry"""
+        host = self.host(url)
+        for attempt in itertools.count(1):
+            self.admit(host, url)
+            retry_after = None
+            try:
+                response = await client.get(url, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                kind, reason = RETRY, type(e).__name__
+            except BaseException:
+                # No verdict on the host; free the half-open probe slot so later requests aren't held forever
+                self.breaker.abandon(host)
+                raise
+            else:
+                kind, reason = classify(response.status_code, str(response.url), sniff(response.content))
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            delay = self.settle(host, url, attempt, kind, reason, retry_after)
+            if delay is None:
+                return response
+            await self.async_sleep(delay)
+            if throttle:
+                await throttle()
+
+    def load_page(self, driver, url):
+        """driver.get() under the policy: WebDriver errors are retried, login walls raise BlockedError"""
+        from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+        host = self.host(url)
+        for attempt in itertools.count(1):
+            self.admit(host, url)
+            try:
+                driver.get(url)
+                # The browser doesn't expose status codes; the landing URL and title give the wall away
+                reason = challenge_reason(driver.current_url, f"<title>{driver.title}</title>")
+                kind = BLOCKED if reason else OK
+            except InvalidSessionIdException:
+                self.breaker.abandon(host)
+                raise
+            except WebDriverException as e:
+                kind, reason = RETRY, type(e).__name__
+            except BaseException:
+                # No verdict on the host; free the half-open probe slot so later requests aren't held forever
+                self.breaker.abandon(host)
+                raise
+            delay = self.settle(host, url, attempt, kind, reason)
+            if delay is None:
+                return
+            self.sleep(delay)
+
+    def backoff(self):
+        """Seconds until every host this policy has opened a circuit for accepts requests again"""
+        return max((self.breaker.remaining(host) for host in list(self.breaker.hosts)), default=0.0)
+
+    def report(self):
+        with self.lock:
+            return dict(sorted(self.counters.items()))
+
+    def print_summary(self):
+        report = self.report()
+        if not report:
+            return
+        print(f"\n=== FETCH POLICY ===")
+        print(f"Attempts: {report.get('attempts', 0)}, retries: {report.get('retries', 0)} "
+              f"({report.get('retry_after_honoured', 0)} honouring Retry-After), "
+              f"failures: {report.get('failures', 0)}")
+        for name, value in report.items():
+            if name.startswith('retryable.'):
+                print(f"  {name[len('retryable.'):]}: {value}")
+        if report.get('blocked') or report.get('short_circuited'):
+            print(f"Login walls/challenges: {report.get('blocked', 0)}, "
+                  f"requests held back by open circuits: {report.get('short_circuited', 0)}")
+        for host, entry in self.breaker.hosts.items():
+            state = self.breaker.state(host)
+            if state != 'closed':
+                print(f"  {host}: circuit {state} for {self.breaker.remaining(host):.0f}s more")
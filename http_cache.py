@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Conditional-GET response cache for repeated scrapes
+Stores response bodies on disk keyed by normalized URL, revalidates them with
+If-None-Match / If-Modified-Since and serves 304 Not Modified answers from disk
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Query parameters LinkedIn appends for tracking; they don't change the page
+IGNORED_QUERY_PARAMS = {'trk', 'trackingId', 'refId', 'position', 'pageNum', 'originalSubdomain'}
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+def normalize_url(url):
+    """Canonical form of a URL for cache keys: lowercase host, sorted query, no fragment or tracking"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k not in IGNORED_QUERY_PARAMS)
+    path = parts.path or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+class ResponseCache:
+    """On-disk response store with size-bounded LRU eviction, a TTL and hit/miss counters"""
+
+    def __init__(self, directory='.http_cache', max_bytes=256 * 1024 * 1024, ttl=7 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'bytes_saved': 0}
+        os.makedirs(directory, exist_ok=True)
+        self.index_path = os.path.join(directory, 'index.json')
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def key(self, url):
+        return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+
+    def body_path(self, key):
+        return os.path.join(self.directory, f"{key}.body")
+
+    def lookup(self, url):
+        """Return the cache entry for a URL, dropping it if it outlived the TTL"""
+        key = self.key(url)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry and time.time() - entry['stored_at'] > self.ttl:
+                self.remove(key)
+                entry = None
+            return entry
+
+    def validators(self, entry):
+        """Conditional request headers for a cached entry"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load(self, entry):
+        """Read a cached body and mark the entry as recently used; None if the file is gone"""
+        try:
+            with open(self.body_path(entry['key']), 'rb') as f:
+                body = f.read()
+        except OSError:
+            with self.lock:
+                self.remove(entry['key'])
+            return None
+        with self.lock:
+            entry['accessed_at'] = time.time()
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(body)
+        return body
+
+    def store(self, url, headers, body):
+        """Save a 200 response that carries a validator, then evict down to max_bytes"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return
+        key = self.key(url)
+        tmp_path = self.body_path(key) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, self.body_path(key))
+        now = time.time()
+        with self.lock:
+            self.index[key] = {
+                'key': key,
+                'url': normalize_url(url),
+                'etag': etag,
+                'last_modified': last_modified,
+                'headers': {name: headers[name] for name in STORED_HEADERS if name in headers},
+                'size': len(body),
+                'stored_at': now,
+                'accessed_at': now,
+            }
+            self.stats['stores'] += 1
+            self.evict()
+
+    def refresh(self, entry):
+        """A 304 confirmed the entry is current; restart its TTL"""
+        with self.lock:
+            entry['stored_at'] = time.time()
+
+    def record_miss(self):
+        with self.lock:
+            self.stats['misses'] += 1
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes (lock held)"""
+        total = sum(entry['size'] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for entry in sorted(self.index.values(), key=lambda e: e['accessed_at']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['size']
+            self.remove(entry['key'])
+            self.stats['evictions'] += 1
+
+    def remove(self, key):
+        """Forget an entry and delete its body (lock held)"""
+        self.index.pop(key, None)
+        try:
+            os.remove(self.body_path(key))
+        except OSError:
+            pass
+
+    def close(self):
+        """Persist the index atomically"""
+        with self.lock:
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+
+    def print_summary(self):
+        stats = self.stats
+        print(f"\nHTTP cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['bytes_saved']:,} bytes saved, {len(self.index)} entries")
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """requests transport adapter that revalidates GETs against a ResponseCache"""
+
+    def __init__(self, cache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        if entry:
+            request.headers.update(self.cache.validators(entry))
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            body = self.cache.load(entry)
+            if body is not None:
+                self.cache.refresh(entry)
+                response.close()
+                return self.cached_response(request, entry, body)
+            # Body vanished from disk: retry unconditionally
+            for name in ('If-None-Match', 'If-Modified-Since'):
+                request.headers.pop(name, None)
+            response = super().send(request, **kwargs)
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.store(request.url, response.headers, response.content)
+        return response
+
+    def cached_response(self, request, entry, body):
+        """Build a 200 response from a cached body"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.from_cache = True
+        return response
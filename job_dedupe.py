@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Cross-source job deduplication
+Exact duplicates are found through a hash index on a normalized company + title +
+location fingerprint; near duplicates through MinHash signatures of the descriptions, bucketed
+with LSH so each posting is only compared with a handful of candidates
+"""
+
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+from job_normalize import normalize_location
+
+TITLE_SYNONYMS = {
+    'sr': 'senior', 'jr': 'junior', 'mgr': 'manager', 'mngr': 'manager', 'asst': 'assistant',
+    'dir': 'director', 'ops': 'operations', 'eng': 'engineer', 'rep': 'representative',
+    'ecom': 'ecommerce', 'vp': 'vice president',
+}
+TITLE_STOPWORDS = {'the', 'of', 'and', 'a', 'an', 'for', 'to', 'in', 'at'}
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'co', 'corp', 'corporation', 'company'}
+PRIME = 4294967291  # largest prime below 2**32, keeps a*h+b inside uint64
+
+def title_tokens(title):
+    """Lowercased title words with abbreviations expanded and stopwords dropped"""
+    text = (title or '').lower().replace('e-commerce', 'ecommerce').replace('&', ' and ')
+    tokens = []
+    for token in re.findall(r'[a-z0-9]+', text):
+        token = TITLE_SYNONYMS.get(token, token)
+        tokens.extend(word for word in token.split() if word not in TITLE_STOPWORDS)
+    return tokens
+
+def location_key(location):
+    display, _, _ = normalize_location(location)
+    return '' if display == 'Not specified' else display.lower()
+
+def company_key(job):
+    """Normalized company name from a scraped (company) or site (company_name/company_info) record, else ''"""
+    info = job.get('company_info') if isinstance(job.get('company_info'), dict) else {}
+    name = job.get('company') or job.get('company_name') or info.get('company_name')
+    if not isinstance(name, str) or name == 'Not specified':
+        return ''
+    return ' '.join(word for word in re.findall(r'[a-z0-9]+', name.lower()) if word not in COMPANY_SUFFIXES)
+
+def fingerprint(job):
+    """Hash of the normalized company, title and location: equal fingerprints are the same posting"""
+    key = '|'.join((company_key(job), ' '.join(title_tokens(job.get('title'))), location_key(job.get('location'))))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def description_of(job):
+    return job.get('description_md') or job.get('description') or ''
+
+def shingle_hashes(text, size=3):
+    """32-bit hashes of the word n-grams of a text"""
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < size:
+        return np.array([zlib.crc32(' '.join(words).encode('utf-8'))], dtype=np.uint64) if words else None
+    grams = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams))
+
+class MinHasher:
+    """MinHash signatures from universal hashes (a*h + b) mod p"""
+
+    def __init__(self, num_perm=64, seed=42):
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self.b = rng.randint(0, PRIME, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, hashes):
+        return ((np.outer(hashes, self.a) + self.b) % PRIME).min(axis=0)
+
+class JobDeduplicator:
+    """Online deduplicator: add() each posting, then read the merged canonical records"""
+
+    def __init__(self, threshold=0.7, title_threshold=0.5, num_perm=64, bands=16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.title_threshold = title_threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.records = []
+        self.signatures = []
+        self.titles = []
+        self.locations = []
+        self.companies = []
+        self.by_fingerprint = {}
+        self.buckets = {}
+        self.stats = {'records': 0, 'exact': 0, 'near': 0, 'candidates': 0}
+
+    def add(self, job, source=None):
+        """Merge a posting into its duplicate if one exists; returns the canonical record index"""
+        self.stats['records'] += 1
+        provenance = {'source': source or job.get('_source') or job.get('source'), 'id': job.get('id'),
+                      'apply_url': job.get('apply_url') or job.get('job_url')}
+
+        key = fingerprint(job)
+        index = self.by_fingerprint.get(key)
+        if index is not None:
+            self.stats['exact'] += 1
+            self.merge(index, job, provenance)
+            return index
+
+        tokens = set(title_tokens(job.get('title')))
+        location = location_key(job.get('location'))
+        company = company_key(job)
+        hashes = shingle_hashes(description_of(job))
+        signature = self.hasher.signature(hashes) if hashes is not None else None
+
+        if signature is not None:
+            index = self.find_near_duplicate(signature, tokens, location, company)
+            if index is not None:
+                self.stats['near'] += 1
+                self.by_fingerprint[key] = index
+                self.merge(index, job, provenance)
+                return index
+
+        index = len(self.records)
+        record = dict(job)
+        record['sources'] = [provenance]
+        self.records.append(record)
+        self.signatures.append(signature)
+        self.titles.append(tokens)
+        self.locations.append(location)
+        self.companies.append(company)
+        self.by_fingerprint[key] = index
+        if signature is not None:
+            for band_key in self.band_keys(signature):
+                self.buckets.setdefault(band_key, []).append(index)
+        return index
+
+    def band_keys(self, signature):
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def find_near_duplicate(self, signature, tokens, location, company=''):
+        """Best LSH candidate whose description, title, location and company all agree"""
+        candidates = set()
+        for band_key in self.band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        self.stats['candidates'] += len(candidates)
+
+        best, best_score = None, self.threshold
+        for index in candidates:
+            if location and self.locations[index] and location != self.locations[index]:
+                continue
+            # Two companies posting the same boilerplate are still two jobs
+            if company and self.companies[index] and company != self.companies[index]:
+                continue
+            other = self.titles[index]
+            union = tokens | other
+            overlap = len(tokens & other) / len(union) if union else 1.0
+            if overlap < self.title_threshold and not (tokens <= other or other <= tokens):
+                continue
+            score = float(np.mean(self.signatures[index] == signature))
+            if score >= best_score:
+                best, best_score = index, score
+        return best
+
+    def merge(self, index, job, provenance):
+        """Fill the canonical record's empty fields from the duplicate and record where it came from"""
+        record = self.records[index]
+        for field, value in job.items():
+            if field.startswith('_') or field == 'sources':
+                continue
+            if value not in (None, '', [], 'Not specified') and record.get(field) in (None, '', [], 'Not specified'):
+                record[field] = value
+        # Two copies can carry identical provenance (same source, no id or URL); both still count
+        record['sources'].append(provenance)
+
+    def canonical_records(self):
+        """Merged records in first-seen order, with ids made unique"""
+        used = set()
+        for record in self.records:
+            if record.get('id') in used:
+                suffix = re.sub(r'[^a-z0-9]+', '-', (record.get('location') or '').lower()).strip('-')
+                record['id'] = f"{record['id']}-{suffix}" if suffix else record['id']
+                n = 2
+                base = record['id']
+                while record['id'] in used:
+                    record['id'] = f"{base}-{n}"
+                    n += 1
+            used.add(record.get('id'))
+            yield record
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Append-only job history in Parquet
+Every run's jobs are appended as a new file under history/scrape_date=YYYY-MM-DD/, with
+the low-cardinality columns dictionary-encoded. query() reads only the requested
+columns and pushes date and column predicates down to the partitions and row groups
+"""
+
+import os
+import time
+import uuid
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DICTIONARY_COLUMNS = ('company', 'location', 'employment_type', 'source', 'status')
+STRING_COLUMNS = ('job_id', 'title', 'posted_time', 'job_url', 'description', 'fingerprint')
+LIST_COLUMNS = ('requirements',)
+
+HISTORY_SCHEMA = pa.schema(
+    [(name, pa.string()) for name in STRING_COLUMNS[:2]]
+    + [(name, pa.dictionary(pa.int32(), pa.string())) for name in DICTIONARY_COLUMNS]
+    + [(name, pa.string()) for name in STRING_COLUMNS[2:]]
+    + [(name, pa.list_(pa.string())) for name in LIST_COLUMNS]
+    + [('scraped_at', pa.timestamp('s'))]
+)
+PARTITIONING = ds.partitioning(pa.schema([('scrape_date', pa.date32())]), flavor='hive')
+
+def column_value(job, name):
+    value = job.get(name)
+    if name in LIST_COLUMNS:
+        if value is None or value == '':
+            return []
+        return [str(item) for item in value] if isinstance(value, (list, tuple)) else [str(value)]
+    return None if value is None or value == '' else str(value)
+
+def jobs_table(jobs, scraped_at):
+    """Arrow table of jobs in the history schema; unknown fields are dropped"""
+    jobs = list(jobs)
+    columns = {}
+    for field in HISTORY_SCHEMA:
+        if field.name == 'scraped_at':
+            columns[field.name] = pa.array([scraped_at] * len(jobs), type=field.type)
+            continue
+        values = [column_value(job, field.name) for job in jobs]
+        if pa.types.is_dictionary(field.type):
+            columns[field.name] = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            columns[field.name] = pa.array(values, type=field.type)
+    return pa.table(columns, schema=HISTORY_SCHEMA)
+
+class JobHistoryStore:
+    """Parquet dataset of job snapshots partitioned by scrape date"""
+
+    def __init__(self, root='job_history', compression='zstd', row_group_size=64 * 1024):
+        self.root = root
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def append(self, jobs, scrape_date=None):
+        """Write one run's jobs as a new file in its date partition; returns the path"""
+        scrape_date = scrape_date or date.today()
+        if isinstance(scrape_date, str):
+            scrape_date = date.fromisoformat(scrape_date)
+        table = jobs_table(jobs, int(time.time()))
+        directory = os.path.join(self.root, f"scrape_date={scrape_date.isoformat()}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{int(time.time())}-{uuid.uuid4().hex[:8]}.parquet")
+        # Dot-prefixed so a crash mid-write never leaves a file the dataset would pick up
+        tmp_path = os.path.join(directory, '.' + os.path.basename(path) + '.tmp')
+        pq.write_table(table, tmp_path, compression=self.compression, use_dictionary=list(DICTIONARY_COLUMNS),
+                       row_group_size=self.row_group_size)
+        os.replace(tmp_path, path)
+        return path
+
+    def dataset(self):
+        return ds.dataset(self.root, format='parquet', partitioning=PARTITIONING, schema=self.schema())
+
+    @staticmethod
+    def schema():
+        return HISTORY_SCHEMA.append(pa.field('scrape_date', pa.date32()))
+
+    def dates(self):
+        """Scrape dates that have at least one snapshot"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(date.fromisoformat(name.split('=', 1)[1]) for name in os.listdir(self.root)
+                      if name.startswith('scrape_date='))
+
+    def query(self, columns=None, start=None, end=None, where=None, as_pandas=True):
+        """Load only the given columns for scrape dates in [start, end] matching where
+
+        where maps column names to a value or a list of accepted values, e.g.
+        {'company': 'Powered By MRP', 'employment_type': ['Full-time', 'Contract']}.
+        """
+        expression = None
+        conditions = []
+        if start is not None:
+            conditions.append(ds.field('scrape_date') >= pa.scalar(as_date(start), pa.date32()))
+        if end is not None:
+            conditions.append(ds.field('scrape_date') <= pa.scalar(as_date(end), pa.date32()))
+        for name, value in (where or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                conditions.append(ds.field(name).isin(list(value)))
+            else:
+                conditions.append(ds.field(name) == value)
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        if not os.path.isdir(self.root):
+            table = self.schema().empty_table()
+            table = table.select(columns) if columns else table
+        else:
+            table = self.dataset().to_table(columns=columns, filter=expression)
+        return table.to_pandas() if as_pandas else table
+
+    def latest(self, columns=None, where=None):
+        """Rows from the most recent scrape date that has any rows"""
+        dataset = self.dataset() if os.path.isdir(self.root) else None
+        for scrape_date in reversed(self.dates()):
+            # A run that found nothing still writes a zero-row file; row counts come from the footers
+            if dataset.count_rows(filter=ds.field('scrape_date') == pa.scalar(scrape_date, pa.date32())):
+                return self.query(columns, start=scrape_date, end=scrape_date, where=where)
+        return self.query(columns, where=where)
+
+    def count_by_date(self, where=None):
+        """Jobs seen per scrape date, computed in Arrow without loading other columns"""
+        table = self.query(['scrape_date'], where=where, as_pandas=False)
+        counts = pc.value_counts(table['scrape_date'])
+        return sorted((item['values'].as_py(), item['counts'].as_py()) for item in counts)
+
+def as_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Field normalization for scraped jobs
+Maps the free-form strings the scrapers emit (posted times, locations, employment
+types, salaries) onto the ADP-style Job schema the careers site consumes. Rules are
+compiled once, places resolve through an offline US gazetteer, and every field
+normalizer is memoized, since the same few hundred strings repeat across postings
+"""
+
+import os
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+CACHE_SIZE = 4096
+GAZETTEER_PATH = os.environ.get('MRP_GAZETTEER') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'us_places.tsv')
+
+STATE_ABBREVIATIONS = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR', 'california': 'CA',
+    'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE', 'district of columbia': 'DC',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID', 'illinois': 'IL',
+    'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS', 'kentucky': 'KY', 'louisiana': 'LA',
+    'maine': 'ME', 'maryland': 'MD', 'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN',
+    'mississippi': 'MS', 'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK', 'oregon': 'OR',
+    'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC', 'south dakota': 'SD',
+    'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT', 'vermont': 'VT', 'virginia': 'VA',
+    'washington': 'WA', 'west virginia': 'WV', 'wisconsin': 'WI', 'wyoming': 'WY',
+}
+
+# (employment type pattern, site label, schema.org enum), first match wins
+EMPLOYMENT_TYPES = [
+    (r'intern', 'Internship', 'INTERN'),
+    (r'part[\s-]?time', 'Part Time', 'PART_TIME'),
+    (r'contract|1099|freelance', 'Contract', 'CONTRACTOR'),
+    (r'temp', 'Temporary', 'TEMPORARY'),
+    (r'full[\s-]?time|permanent', 'Full Time', 'FULL_TIME'),
+]
+
+# (title pattern, department), first match wins
+DEPARTMENTS = [
+    (r'financ|account(ing|ant)|controller|payroll', 'Finance'),
+    (r'procure|purchas|buyer', 'Procurement'),
+    (r'ecommerce|e-commerce|marketing|brand|content', 'Marketing'),
+    (r'supply chain|logistic|depot|operations|warehouse|service', 'Operations'),
+    (r'clinical|trainer|training|educat', 'Training'),
+    (r'sales|account executive|consultant|business development', 'Sales'),
+]
+
+EMPLOYMENT_RULES = [(re.compile(pattern, re.I), label, enum) for pattern, label, enum in EMPLOYMENT_TYPES]
+DEPARTMENT_RULES = [(re.compile(pattern, re.I), department) for pattern, department in DEPARTMENTS]
+
+RELATIVE_TIME = re.compile(r'(\d+|an?|one)\s+(minute|hour|day|week|month|year)s?\s+ago', re.I)
+UNIT_DAYS = {'minute': 0, 'hour': 0, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+SALARY_AMOUNT = re.compile(r'\$\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?')
+SLUG_SEPARATOR = re.compile(r'[^a-z0-9]+')
+REMOTE = re.compile(r'\bremote\b', re.I)
+PLACE_WORD = re.compile(r"[a-z0-9']+")
+# LinkedIn appends the country; Census place names end in their legal type
+COUNTRY_NAMES = {'united states', 'united states of america', 'usa', 'us', 'u.s.', 'u.s.a.'}
+CENSUS_PLACE_TYPE = re.compile(r'\s+(city|town|village|borough|municipality|CDP)$')
+
+class Gazetteer:
+    """US place names and their states, with a word trie for spotting a place inside longer text"""
+
+    def __init__(self, places=()):
+        self.places = {}
+        self.trie = {}
+        for name, state in places:
+            self.add(name, state)
+
+    @classmethod
+    def load(cls, path):
+        """Read a name/state TSV, or a Census Gazetteer places file (USPS and NAME columns)"""
+        gazetteer = cls()
+        with open(path, encoding='utf-8') as f:
+            rows = (line.rstrip('\n').split('\t') for line in f if line.strip() and not line.startswith('#'))
+            header = [column.strip().lower() for column in next(rows, [])]
+            census = 'usps' in header
+            name_column = header.index('name')
+            state_column = header.index('usps' if census else 'state')
+            for row in rows:
+                name = row[name_column].strip()
+                if census:
+                    name = CENSUS_PLACE_TYPE.sub('', name)
+                gazetteer.add(name, row[state_column].strip())
+        return gazetteer
+
+    def add(self, name, state):
+        words = PLACE_WORD.findall(name.lower())
+        if not words:
+            return
+        key = ' '.join(words)
+        self.places.setdefault(key, {})[state.upper()] = name
+        node = self.trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[''] = key
+
+    def resolve(self, key):
+        """(display name, state) when a place name belongs to exactly one state"""
+        states = self.places.get(key)
+        if states and len(states) == 1:
+            state, name = next(iter(states.items()))
+            return name, state
+        return None
+
+    def find(self, text):
+        """The longest unambiguous place name in text, e.g. 'Greater Salt Lake City Area'"""
+        words = PLACE_WORD.findall(text.lower())
+        best = None
+        for start in range(len(words)):
+            node = self.trie
+            for end in range(start, len(words)):
+                node = node.get(words[end])
+                if node is None:
+                    break
+                if '' in node and (best is None or end - start > best[0]):
+                    place = self.resolve(node[''])
+                    if place:
+                        best = (end - start, place)
+        return best[1] if best else None
+
+@lru_cache(maxsize=None)
+def gazetteer():
+    """The place gazetteer, read on first use; empty if the file is missing"""
+    try:
+        return Gazetteer.load(GAZETTEER_PATH)
+    except OSError:
+        return Gazetteer()
+
+def state_code(text):
+    text = text.strip()
+    code = STATE_ABBREVIATIONS.get(text.lower())
+    return code or (text.upper() if len(text) == 2 else None)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def slugify(text):
+    return SLUG_SEPARATOR.sub('-', (text or '').lower()).strip('-')
+
+def company_name(record):
+    """The record's company, or None when the scrape didn't find one"""
+    name = record.get('company') or record.get('company_name')
+    return name if name and name != 'Not specified' else None
+
+def job_slug(title, job_id=None, company=None, location=None):
+    """Id for a normalized job: the title plus the source's job_id, else plus company and location"""
+    parts = (title, job_id) if job_id else (title, company, location)
+    return slugify(' '.join(str(part) for part in parts if part and part != 'Not specified'))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def location_parts(text):
+    """normalize_location's result with an immutable locations tuple, safe to memoize"""
+    text = text.strip()
+    remote = REMOTE.search(text) is not None
+    if not text or text.lower() in ('not specified', 'n/a'):
+        return 'Not specified', (), remote
+    parts = [part.strip() for part in text.split(',')]
+    while len(parts) > 1 and parts[-1].lower() in COUNTRY_NAMES:
+        parts.pop()
+    if len(parts) >= 2:
+        state = state_code(parts[-1])
+        if state:
+            display = f"{parts[0]}, {state}"
+            return display, (display,), remote
+    place = gazetteer().find(parts[0]) if len(parts) == 1 else None
+    if place:
+        display = f"{place[0]}, {place[1]}"
+        return display, (display,), remote
+    text = ', '.join(parts)
+    return text, (text,), remote
+
+def normalize_location(text):
+    """Returns (display location, locations list, remote flag)"""
+    display, locations, remote = location_parts(text or '')
+    return display, list(locations), remote
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_employment_type(text):
+    """Returns (site label, schema.org employment type)"""
+    for pattern, label, enum in EMPLOYMENT_RULES:
+        if pattern.search(text or ''):
+            return label, enum
+    return 'Other', 'OTHER'
+
+@lru_cache(maxsize=CACHE_SIZE)
+def posted_date(text, today):
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).date().isoformat()
+    except ValueError:
+        pass
+    match = RELATIVE_TIME.search(text)
+    if match:
+        amount = 1 if match.group(1).lower() in ('a', 'an', 'one') else int(match.group(1))
+        return (today - timedelta(days=amount * UNIT_DAYS[match.group(2).lower()])).isoformat()
+    return today.isoformat()
+
+def normalize_posted_at(text, today=None):
+    """ISO date from an ISO timestamp or a relative time like '4 days ago'; unknown means today"""
+    return posted_date((text or '').strip(), today or date.today())
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_salary(text):
+    """Returns (salary_min, salary_max) from text like '$80,000/yr - $120,000/yr' or '$80K'"""
+    amounts = []
+    for number, thousands in SALARY_AMOUNT.findall(text or ''):
+        value = float(number.replace(',', ''))
+        amounts.append(int(value * 1000 if thousands else value))
+    if not amounts:
+        return None, None
+    return min(amounts), max(amounts)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def infer_department(title):
+    for pattern, department in DEPARTMENT_RULES:
+        if pattern.search(title or ''):
+            return department
+    return 'General'
+
+MEMOIZED = (slugify, location_parts, normalize_employment_type, posted_date, parse_salary, infer_department)
+
+def cache_info():
+    """Hit/miss counts of every memoized normalizer"""
+    return {function.__name__: function.cache_info() for function in MEMOIZED}
+
+def cache_clear():
+    for function in MEMOIZED:
+        function.cache_clear()
+
+def as_markdown_list(value):
+    if isinstance(value, (list, tuple)):
+        return '\n'.join(f"- {item}" for item in value if item)
+    return value or ''
+
+def as_list(value):
+    if isinstance(value, (list, tuple)):
+        return [item for item in value if item]
+    if not value or value == 'Not specified':
+        return []
+    return [part.strip() for part in str(value).split(';') if part.strip()]
+
+def normalize_job(record, today=None):
+    """Map a scraped job dict of any source onto the ADP-style Job schema"""
+    if 'description_md' in record:
+        # Already in the site schema (ADP export or a previous pipeline run)
+        job = dict(record)
+        job.setdefault('id', slugify(job.get('title')))
+        job.setdefault('locations', [job['location']] if job.get('location') else [])
+        job.setdefault('remote', False)
+        return job
+
+    location, locations, remote = normalize_location(record.get('location'))
+    type_label, employment_enum = normalize_employment_type(
+        record.get('employment_type') or record.get('job_type'))
+    salary_min, salary_max = parse_salary(record.get('salary'))
+
+    company = company_name(record)
+    # Same-title postings at other companies or offices are different jobs and need their own ids
+    job = {
+        'id': job_slug(record.get('title'), record.get('job_id'), company, location),
+        'title': record.get('title', ''),
+    }
+    if company:
+        job['company'] = company
+    job.update({
+        'department': record.get('department') or infer_department(record.get('title')),
+        'location': location,
+        'type': type_label,
+    })
+    if salary_min is not None:
+        job.update(salary_min=salary_min, salary_max=salary_max, currency='USD')
+    description = record.get('description', '')
+    job.update({
+        'description_md': '' if description == 'Description not available' else description,
+        'requirements_md': as_markdown_list(record.get('requirements')),
+        'apply_url': record.get('apply_url') or record.get('job_url', ''),
+        'posted_at': normalize_posted_at(record.get('posted_time'), today),
+        'remote': remote,
+        'locations': locations,
+        'employment_type': employment_enum,
+    })
+    if record.get('nice_to_haves'):
+        job['nice_to_haves_md'] = as_markdown_list(record['nice_to_haves'])
+    benefits = as_list(record.get('benefits'))
+    if benefits:
+        job['benefits'] = benefits
+    if record.get('contact_info'):
+        job['contact_info'] = record['contact_info']
+    return job
+
+def per_distinct(values, function):
+    """(per-row codes, per-code results): function runs once per distinct value of a column"""
+    import pandas as pd
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return codes, [function(None if pd.isna(value) else value) for value in uniques]
+
+def broadcast(codes, results, position=None, dtype=None):
+    """Per-row column from per-distinct results: a Categorical for strings, else an array of dtype"""
+    import numpy as np
+    import pandas as pd
+    if position is not None:
+        results = [result[position] for result in results]
+    if dtype is None:
+        # Distinct inputs can normalize to the same string; categories must be unique
+        categories = {}
+        remap = np.array([categories.setdefault(value, len(categories)) for value in results], dtype=np.intp)
+        return pd.Categorical.from_codes(remap[codes] if len(results) else codes, categories=list(categories))
+    distinct = np.empty(len(results), dtype=object)
+    distinct[:] = results
+    return pd.array(distinct[codes], dtype=dtype) if dtype != object else distinct[codes]
+
+def normalize_frame(frame, today=None):
+    """Column-wise normalize_job for a DataFrame of scraped jobs; each distinct value is normalized once per column
+
+    Returns normalize_job's columns in its order. Keys normalize_job leaves out of a
+    record (no company, no salary, ...) are missing values here, and the optional
+    nice_to_haves_md, benefits and contact_info columns appear only when the input has them.
+    """
+    import pandas as pd
+    today = today or date.today()
+
+    def column(name):
+        return frame[name] if name in frame else pd.Series(None, index=frame.index, dtype=object)
+
+    def cells(name):
+        values = column(name).astype(object)
+        return values.where(values.notna(), None)
+
+    employment = column('employment_type').where(column('employment_type').notna(), column('job_type'))
+    titles = per_distinct(column('title'), lambda title: (title or '', infer_department(title)))
+    locations = per_distinct(column('location'), lambda text: location_parts(text or ''))
+    types = per_distinct(employment, normalize_employment_type)
+    salaries = per_distinct(column('salary'), parse_salary)
+    posted = per_distinct(column('posted_time'), lambda text: posted_date((text or '').strip(), today))
+
+    # String fields come back as Categoricals over the few distinct results
+    out = pd.DataFrame(index=frame.index)
+    out['title'] = broadcast(*titles, 0)
+    out['location'] = broadcast(*locations, 0)
+    companies = cells('company').fillna(cells('company_name'))
+    companies = companies.where(companies != 'Not specified', None)
+    # One separator-joined key per row so the id is built once per distinct combination
+    keys = (out['title'].astype(object) + '\x1f' + cells('job_id').fillna('').astype(str) + '\x1f'
+            + companies.fillna('') + '\x1f' + out['location'].astype(object))
+    out.insert(0, 'id', broadcast(*per_distinct(keys, lambda key: job_slug(*key.split('\x1f')))))
+    out['company'] = companies
+    out['department'] = broadcast(*titles, 1)
+    if 'department' in frame:
+        out['department'] = frame['department'].where(frame['department'].notna(), out['department'].astype(object))
+    out['location'] = out.pop('location')
+    out['type'] = broadcast(*types, 0)
+    out['salary_min'] = broadcast(*salaries, 0, dtype='Int64')
+    out['salary_max'] = broadcast(*salaries, 1, dtype='Int64')
+    out['currency'] = pd.Categorical(out['salary_min'].notna().map({True: 'USD', False: None}), categories=['USD'])
+    description = cells('description')
+    out['description_md'] = description.where(description != 'Description not available', '').fillna('')
+    out['requirements_md'] = [as_markdown_list(value) for value in cells('requirements')]
+    out['apply_url'] = cells('apply_url').fillna(cells('job_url')).fillna('')
+    out['posted_at'] = broadcast(*posted)
+    out['remote'] = broadcast(*locations, 2, dtype=bool)
+    # Each row gets its own list, as normalize_job gives; the cache holds a shared tuple
+    out['locations'] = [list(parts) for parts in broadcast(*locations, 1, dtype=object)]
+    out['employment_type'] = broadcast(*types, 1)
+    if 'nice_to_haves' in frame:
+        out['nice_to_haves_md'] = [as_markdown_list(value) or None for value in cells('nice_to_haves')]
+    if 'benefits' in frame:
+        out['benefits'] = [as_list(value) or None for value in cells('benefits')]
+    if 'contact_info' in frame:
+        out['contact_info'] = cells('contact_info')
+    return out
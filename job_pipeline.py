@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Multi-source job ingestion pipeline
+Streams records from pluggable sources through parse -> normalize -> dedupe -> similar
+-> sink generator stages, producing the ADP-style jobs.json the careers site loads, and
+reports per-stage throughput and latency
+"""
+
+import argparse
+import itertools
+import json
+import time
+
+from job_dedupe import JobDeduplicator
+from job_normalize import normalize_job
+from job_similarity import similar_stage
+from job_sink import write_json_array
+from search_index import SEARCH_INDEX_NAME, default_index_path, write_search_index
+from site_export import DEFAULT_EXPORT_DIR, ShardedExport
+
+SOURCES = {}
+
+def register_source(name):
+    """Class decorator adding a JobSource to the --source registry"""
+    def register(cls):
+        cls.name = name
+        SOURCES[name] = cls
+        return cls
+    return register
+
+class JobSource:
+    """Plug-in interface: records() yields raw records, parse() turns one into a flat job dict"""
+
+    name = 'source'
+
+    def __init__(self, argument=None):
+        self.argument = argument
+
+    def records(self):
+        raise NotImplementedError
+
+    def parse(self, record):
+        return record
+
+@register_source('content')
+class ContentSource(JobSource):
+    """The LinkedIn postings hardcoded in extract_jobs_from_content.py"""
+
+    def records(self):
+        from extract_jobs_from_content import extract_jobs_from_linkedin_content
+        yield from extract_jobs_from_linkedin_content()
+
+@register_source('json')
+class JsonFileSource(JobSource):
+    """A JSON array of jobs: scraper output, an ADP-style export or a previous jobs.json"""
+
+    def records(self):
+        with open(self.argument, encoding='utf-8') as f:
+            data = json.load(f)
+        yield from data if isinstance(data, list) else data.get('jobs', [])
+
+@register_source('adp')
+class AdpSource(JsonFileSource):
+    """ADP exports: either the site schema already, or the raw {activeJobs: [...]} scrape"""
+
+    def records(self):
+        with open(self.argument, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            yield from (job for job in data.get('activeJobs', []) if job.get('isActive', True))
+        else:
+            yield from data
+
+    def parse(self, record):
+        if 'jobId' in record:
+            return {'title': record.get('title', ''), 'apply_url': record.get('applyUrl', ''),
+                    'job_id': record['jobId'], 'location': record.get('location', ''),
+                    'posted_time': record.get('postedDate', '')}
+        return record
+
+@register_source('linkedin')
+class LinkedInSource(JobSource):
+    """A live Selenium scrape via LinkedInJobScraper"""
+
+    def records(self):
+        from linkedin_job_scraper import LinkedInJobScraper
+        scraper = LinkedInJobScraper()
+        scraper.scrape_jobs()
+        yield from scraper.jobs_data
+
+@register_source('linkedin-simple')
+class SimpleLinkedInSource(JobSource):
+    """A live requests/BeautifulSoup scrape via SimpleLinkedInScraper"""
+
+    def records(self):
+        from simple_linkedin_scraper import SimpleLinkedInScraper
+        scraper = SimpleLinkedInScraper()
+        scraper.scrape_jobs()
+        yield from scraper.jobs_data
+
+class StageStats:
+    """Records, exclusive time and per-record latency for one stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.records = 0
+        self.seconds = 0.0
+        self.latencies = []
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def report(self):
+        return {
+            'stage': self.name,
+            'records': self.records,
+            'seconds': round(self.seconds, 6),
+            'records_per_second': round(self.records / self.seconds, 1) if self.seconds else None,
+            'p50_ms': round(self.percentile(50) * 1000, 4),
+            'p99_ms': round(self.percentile(99) * 1000, 4),
+        }
+
+def metered(stats, stage, upstream):
+    """Run generator stage(upstream), timing only the work done inside the stage itself"""
+    pulled = [0.0]
+
+    def timed_upstream():
+        iterator = iter(upstream)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                pulled[0] += time.perf_counter() - start
+                return
+            pulled[0] += time.perf_counter() - start
+            yield item
+
+    output = iter(stage(timed_upstream()))
+    while True:
+        before = pulled[0]
+        start = time.perf_counter()
+        try:
+            item = next(output)
+        except StopIteration:
+            stats.seconds += time.perf_counter() - start - (pulled[0] - before)
+            return
+        elapsed = time.perf_counter() - start - (pulled[0] - before)
+        stats.seconds += elapsed
+        stats.records += 1
+        stats.latencies.append(elapsed)
+        yield item
+
+def parse_stage(source):
+    def parse(records):
+        for record in records:
+            job = source.parse(record)
+            if job:
+                job['_source'] = source.name
+                yield job
+    return parse
+
+def normalize_stage(records):
+    for record in records:
+        job = normalize_job(record)
+        job['_source'] = record.get('_source')
+        yield job
+
+def dedupe_stage(records):
+    """Merge exact and near-duplicate postings across sources; earlier sources take precedence"""
+    dedupe = JobDeduplicator()
+    for job in records:
+        dedupe.add(job)
+    yield from dedupe.canonical_records()
+
+def strip_internal_fields(records):
+    for job in records:
+        yield {key: value for key, value in job.items() if not key.startswith('_')}
+
+class JobPipeline:
+    """source -> parse -> normalize -> dedupe -> sink, streamed one record at a time"""
+
+    def __init__(self, sources, stages=None):
+        self.sources = sources
+        self.stages = stages or [('normalize', normalize_stage), ('dedupe', dedupe_stage)]
+        self.stats = []
+
+    def stream(self):
+        """Generator over the final records, with every stage metered"""
+        self.stats = []
+        streams = []
+        for source in self.sources:
+            source_stats = StageStats(f"source:{source.name}")
+            parse_stats = StageStats(f"parse:{source.name}")
+            self.stats += [source_stats, parse_stats]
+            records = metered(source_stats, lambda _, source=source: source.records(), ())
+            streams.append(metered(parse_stats, parse_stage(source), records))
+
+        records = itertools.chain.from_iterable(streams)
+        for name, stage in self.stages:
+            stats = StageStats(name)
+            self.stats.append(stats)
+            records = metered(stats, stage, records)
+        return records
+
+    def run(self, output):
+        """Stream every record into a JSON array file; returns the record count"""
+        sink_stats = StageStats('sink')
+        records = self.stream()
+        self.stats.append(sink_stats)
+        count = write_json_array(output, metered(sink_stats, strip_internal_fields, records))
+        return count
+
+    def print_report(self):
+        print(f"\n{'stage':<24} {'records':>8} {'seconds':>9} {'rec/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+        for stats in self.stats:
+            report = stats.report()
+            rate = f"{report['records_per_second']:,.0f}" if report['records_per_second'] else '-'
+            print(f"{report['stage']:<24} {report['records']:>8} {report['seconds']:>9.4f} {rate:>10} "
+                  f"{report['p50_ms']:>8.3f} {report['p99_ms']:>8.3f}")
+
+def build_source(spec):
+    """Source from a --source spec: NAME or NAME:ARGUMENT"""
+    name, _, argument = spec.partition(':')
+    if name not in SOURCES:
+        raise SystemExit(f"Unknown source '{name}'. Available: {', '.join(sorted(SOURCES))}")
+    return SOURCES[name](argument or None)
+
+def main():
+    """Run the pipeline from the command line"""
+    parser = argparse.ArgumentParser(description="Merge job sources into the careers site's jobs.json")
+    parser.add_argument("--source", action="append", required=True, metavar="NAME[:ARG]",
+                        help=f"job source, in priority order ({', '.join(sorted(SOURCES))}); repeatable")
+    parser.add_argument("--output", default="src/data/jobs.json")
+    parser.add_argument("--search-index", metavar="PATH",
+                        help=f"where to write the site search index (default: {SEARCH_INDEX_NAME} next to --output)")
+    parser.add_argument("--no-search-index", action="store_true", help="don't rebuild the search index")
+    parser.add_argument("--export-dir", default=DEFAULT_EXPORT_DIR,
+                        help="where to write the sharded listing and per-job detail files the site loads")
+    parser.add_argument("--no-export", action="store_true", help="don't refresh the sharded site data")
+    parser.add_argument("--similarity-state", metavar="NPZ",
+                        help="keep similar-jobs state here so later runs only re-score changed postings")
+    parser.add_argument("--no-similar", action="store_true", help="don't compute similar_job_ids")
+    args = parser.parse_args()
+
+    stages = [('normalize', normalize_stage), ('dedupe', dedupe_stage)]
+    if not args.no_similar:
+        stages.append(('similar', similar_stage(args.similarity_state)))
+    pipeline = JobPipeline([build_source(spec) for spec in args.source], stages)
+    count = pipeline.run(args.output)
+    pipeline.print_report()
+    print(f"\n✅ {count} jobs written to {args.output}")
+
+    with open(args.output, encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    if not args.no_search_index:
+        # Index exactly what was exported, so index doc numbers line up with the jobs array
+        index_path = args.search_index or default_index_path(args.output)
+        index = write_search_index(index_path, jobs)
+        print(f"✅ Search index ({len(index['terms'])} terms) written to {index_path}")
+
+    if not args.no_export:
+        exporter = ShardedExport(args.export_dir)
+        exporter.export(jobs)
+        print(f"✅ Site data exported to {args.export_dir} ({exporter.stats['written']} files written, "
+              f"{exporter.stats['unchanged']} unchanged)")
+
+if __name__ == "__main__":
+    main()
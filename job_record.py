@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Memory-lean job record
+A __slots__ object in place of a per-job dict: field names live on the class instead of
+in every record, categorical values (company, location, employment type, ...) are
+interned so a board's thousands of "Powered By MRP" strings share one object, and
+"Not specified" is a single sentinel. It behaves like a dict where the scrapers need it
+"""
+
+import sys
+
+# Canonical field order; also the key order of the JSON the writers produce
+FIELDS = (
+    'title', 'job_url', 'company', 'location', 'posted_time', 'job_type', 'job_id',
+    'description', 'requirements', 'benefits', 'salary', 'employment_type',
+    'source', 'context', 'fingerprint', 'status', 'change', 'closed_on',
+)
+FIELD_SET = frozenset(FIELDS)
+CATEGORICAL_FIELDS = frozenset({
+    'title', 'company', 'location', 'posted_time', 'job_type', 'benefits', 'salary',
+    'employment_type', 'source', 'status', 'change', 'closed_on',
+})
+
+NOT_SPECIFIED = sys.intern("Not specified")
+_MISSING = object()
+
+def intern_value(value):
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+class JobRecord:
+    """One job with fixed slots for the known fields and a small dict for anything else"""
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, fields=(), **kwargs):
+        self.extra = None
+        self.update(fields, **kwargs)
+
+    def __setitem__(self, key, value):
+        if key in FIELD_SET:
+            if key in CATEGORICAL_FIELDS:
+                value = intern_value(value)
+            elif key == 'requirements' and isinstance(value, list):
+                # Requirement bullets repeat across a board's postings
+                value = [intern_value(item) for item in value]
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __getitem__(self, key):
+        if key in FIELD_SET:
+            value = getattr(self, key, _MISSING)
+        else:
+            value = self.extra.get(key, _MISSING) if self.extra else _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key):
+        if key in FIELD_SET and hasattr(self, key):
+            delattr(self, key)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in FIELD_SET:
+            value = getattr(self, key, _MISSING)
+        else:
+            value = self.extra.get(key, _MISSING) if self.extra else _MISSING
+        return default if value is _MISSING else value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        keys = [name for name in FIELDS if hasattr(self, name)]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def __len__(self):
+        return len(self.keys())
+
+    def update(self, fields=(), **kwargs):
+        if hasattr(fields, 'keys'):
+            for key in fields.keys():
+                self[key] = fields[key]
+        else:
+            for key, value in fields:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def copy(self):
+        return JobRecord(self)
+
+    def to_dict(self):
+        fields = {}
+        for name in FIELDS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                fields[name] = value
+        if self.extra:
+            fields.update(self.extra)
+        return fields
+
+    def __eq__(self, other):
+        if isinstance(other, JobRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"JobRecord({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.extra = None
+        self.update(state)
+
+def as_record(job):
+    """A JobRecord for a job dict (records are returned unchanged)"""
+    return job if isinstance(job, JobRecord) else JobRecord(job)
+
+def plain(job):
+    """The job as a plain dict for the writers; dicts pass through untouched"""
+    return job.to_dict() if type(job) is JobRecord else job
+
+def json_default(value):
+    """json.dumps default= hook so writers serialize records like dicts"""
+    if isinstance(value, JobRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
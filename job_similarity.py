@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+"Similar jobs" recommendations
+Builds pruned TF-IDF vectors over title, description and requirements and finds each
+posting's top-k cosine neighbours with a blocked sparse product over an inverted index,
+so memory stays bounded on large corpora; an incremental update re-scores only postings
+whose text changed and the ones whose neighbour lists they touched
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from search_index import tokenize
+
+SIMILAR_K = 5
+FIELD_WEIGHTS = {'title': 2.0, 'description': 1.0, 'requirements': 1.0}
+# Each posting keeps only its strongest terms, and each term links only its strongest
+# postings (its "champion list"); together they cap the candidate pairs per posting
+MAX_TERMS = 32
+CHAMPIONS = 128
+MIN_SCORE = 0.05
+# Candidate pairs scored at once; about 40 bytes each at peak
+BLOCK_PAIRS = 2_000_000
+# Postings tokenized and pruned at a time, so per-entry arrays never span the whole corpus
+CHUNK_ROWS = 10_000
+STATE_VERSION = 1
+
+def field_text(job, field):
+    """Text of a field in either the scraped or the site schema"""
+    if field == 'title':
+        return job.get('title') or ''
+    value = job.get(f'{field}_md') or job.get(field) or ''
+    if isinstance(value, (list, tuple)):
+        value = '\n'.join(str(item) for item in value)
+    return '' if value in ('Description not available', 'Not specified') else value
+
+def posting_id(job):
+    """Identity of a posting in the site (id) or scraped (job_id, job_url) schema"""
+    value = job.get('id') or job.get('job_id') or job.get('job_url')
+    if not value:
+        raise ValueError(f"posting has no id, job_id or job_url: {job.get('title')!r}")
+    return str(value)
+
+def content_hash(job):
+    text = '\x1f'.join(field_text(job, field) for field in FIELD_WEIGHTS)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def ranges(starts, lengths):
+    """Concatenated aranges [start, start + length) as one index array"""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(np.asarray(starts, dtype=np.int64) - (np.cumsum(lengths) - lengths), lengths)
+    return offsets + np.arange(total, dtype=np.int64)
+
+class Vocabulary(dict):
+    """Term -> id, giving unseen terms the next id"""
+
+    def __missing__(self, term):
+        self[term] = term_id = len(self)
+        return term_id
+
+def term_frequencies(jobs, vocabulary):
+    """Field-weighted term counts as CSR (indptr, term ids, counts); new terms are added to vocabulary"""
+    boosts = np.array(list(FIELD_WEIGHTS.values()))
+    indptrs, indices, counts, offset = [np.zeros(1, dtype=np.int64)], [], [], 0
+    for first in range(0, len(jobs), CHUNK_ROWS):
+        chunk = jobs[first:first + CHUNK_ROWS]
+        tokens, lengths = [], np.zeros((len(chunk), len(boosts)), dtype=np.int64)
+        for doc, job in enumerate(chunk):
+            for column, field in enumerate(FIELD_WEIGHTS):
+                field_tokens = tokenize(field_text(job, field))
+                lengths[doc, column] = len(field_tokens)
+                tokens += map(vocabulary.__getitem__, field_tokens)
+        docs = np.repeat(np.repeat(np.arange(len(chunk)), len(boosts)), lengths.ravel())
+        weights = np.repeat(np.tile(boosts, len(chunk)), lengths.ravel())
+        width = max(len(vocabulary), 1)
+        keys, inverse = np.unique(docs * width + np.array(tokens, dtype=np.int64), return_inverse=True)
+        rows, terms = np.divmod(keys, width)
+        indptrs.append(offset + np.cumsum(np.bincount(rows, minlength=len(chunk))))
+        indices.append(terms.astype(np.int32))
+        counts.append(np.bincount(inverse, weights=weights, minlength=len(keys)).astype(np.float32))
+        offset += len(keys)
+    return (np.concatenate(indptrs), np.concatenate(indices or [np.zeros(0, dtype=np.int32)]),
+            np.concatenate(counts or [np.zeros(0, dtype=np.float32)]))
+
+def take_rows(indptr, indices, values, rows):
+    """CSR restricted to rows, in that order"""
+    starts, lengths = indptr[rows], indptr[rows + 1] - indptr[rows]
+    positions = ranges(starts, lengths)
+    return np.concatenate(([0], np.cumsum(lengths))), indices[positions], values[positions]
+
+def strongest_first(groups, weights):
+    """Order grouping entries by ascending group, heaviest weight first within each group"""
+    if not len(weights):
+        return np.zeros(0, dtype=np.int64)
+    # One float sort instead of a two-key lexsort: the fraction ranks weights inside a group
+    return np.argsort(groups + (1 - weights / (float(weights.max()) * 1.001)))
+
+class SimilarJobs:
+    """Top-k cosine neighbours for a corpus of postings, rebuilt in full or refreshed incrementally"""
+
+    def __init__(self, k=SIMILAR_K, max_terms=MAX_TERMS, champions=CHAMPIONS, min_score=MIN_SCORE,
+                 block_pairs=BLOCK_PAIRS):
+        self.k = k
+        self.max_terms = max_terms
+        self.champions = champions
+        self.min_score = min_score
+        self.block_pairs = block_pairs
+        self.ids = []
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.vocabulary = Vocabulary()
+        self.idf = np.zeros(0, dtype=np.float32)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.counts = np.zeros(0, dtype=np.float32)
+        self.neighbors = np.zeros((0, k), dtype=np.int32)
+        self.scores = np.zeros((0, k), dtype=np.float32)
+        self.stats = {}
+
+    def fit(self, jobs):
+        """Score every posting against the whole corpus"""
+        start = time.perf_counter()
+        self.ids = [posting_id(job) for job in jobs]
+        self.hashes = np.array([content_hash(job) for job in jobs], dtype=np.uint64)
+        self.vocabulary = Vocabulary()
+        self.indptr, self.indices, self.counts = term_frequencies(jobs, self.vocabulary)
+        # IDF is fixed here; incremental updates reuse it so unchanged vectors stay put
+        df = np.bincount(self.indices, minlength=len(self.vocabulary))
+        self.idf = (np.log((1 + len(jobs)) / (1 + df)) + 1).astype(np.float32)
+        self.neighbors = np.full((len(jobs), self.k), -1, dtype=np.int32)
+        self.scores = np.zeros((len(jobs), self.k), dtype=np.float32)
+        self.prepare()
+        self.rescore(np.arange(len(jobs)))
+        self.stats = {'mode': 'full', 'postings': len(jobs), 'rescored': len(jobs), 'merged': 0,
+                      'seconds': time.perf_counter() - start}
+        return self
+
+    def update(self, jobs):
+        """Refresh for a new version of the corpus, re-scoring only what changed"""
+        if not self.ids:
+            return self.fit(jobs)
+        start = time.perf_counter()
+        old_rows = {job_id: row for row, job_id in enumerate(self.ids)}
+        ids = [posting_id(job) for job in jobs]
+        hashes = np.array([content_hash(job) for job in jobs], dtype=np.uint64)
+        old_of_new = np.array([old_rows.get(job_id, -1) for job_id in ids], dtype=np.int64)
+        kept = old_of_new >= 0
+        kept[kept] = self.hashes[old_of_new[kept]] == hashes[kept]
+        changed = np.flatnonzero(~kept)
+
+        # Unchanged postings keep their term counts; changed ones are tokenized again
+        vocabulary_size = len(self.vocabulary)
+        changed_csr = term_frequencies([jobs[i] for i in changed], self.vocabulary)
+        if len(self.vocabulary) > vocabulary_size:
+            unseen = np.log((1 + len(self.ids)) / 2) + 1
+            self.idf = np.concatenate((self.idf, np.full(len(self.vocabulary) - vocabulary_size, unseen,
+                                                         dtype=np.float32)))
+        kept_csr = take_rows(self.indptr, self.indices, self.counts, old_of_new[kept])
+        order = np.concatenate((np.flatnonzero(kept), changed))
+        lengths = np.concatenate((np.diff(kept_csr[0]), np.diff(changed_csr[0])))
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        merged = (indptr, np.concatenate((kept_csr[1], changed_csr[1])),
+                  np.concatenate((kept_csr[2], changed_csr[2])))
+        placed = np.empty(len(jobs), dtype=np.int64)
+        placed[order] = np.arange(len(jobs))
+        self.indptr, self.indices, self.counts = take_rows(*merged, placed)
+
+        # Carry old neighbour lists over; a list that pointed at a changed or removed posting is redone
+        new_of_old = np.full(len(self.ids) + 1, -1, dtype=np.int64)
+        new_of_old[old_of_new[kept]] = np.flatnonzero(kept)
+        neighbors = np.full((len(jobs), self.k), -1, dtype=np.int32)
+        scores = np.zeros((len(jobs), self.k), dtype=np.float32)
+        previous = self.neighbors[old_of_new[kept]]
+        neighbors[kept] = new_of_old[previous]
+        scores[kept] = self.scores[old_of_new[kept]]
+        lost = np.zeros(len(jobs), dtype=bool)
+        lost[kept] = ((previous >= 0) & (neighbors[kept] < 0)).any(axis=1)
+        self.ids, self.hashes, self.neighbors, self.scores = ids, hashes, neighbors, scores
+
+        self.prepare()
+        redo = np.union1d(changed, np.flatnonzero(lost))
+        pairs = self.rescore(redo, collect_from=changed)
+        merged_count = self.merge(pairs, redo)
+        self.stats = {'mode': 'incremental', 'postings': len(jobs), 'changed': len(changed),
+                      'rescored': len(redo), 'merged': merged_count, 'seconds': time.perf_counter() - start}
+        return self
+
+    def prepare(self):
+        """Pruned, L2-normalized TF-IDF rows plus the champion-list inverted index"""
+        count = len(self.ids)
+        # Strongest max_terms entries of each row, a chunk of rows at a time
+        pieces = [(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))]
+        for first in range(0, count, CHUNK_ROWS):
+            last = min(first + CHUNK_ROWS, count)
+            span = slice(self.indptr[first], self.indptr[last])
+            rows = np.repeat(np.arange(first, last), np.diff(self.indptr[first:last + 1]))
+            terms = self.indices[span]
+            weights = (1 + np.log(self.counts[span])) * self.idf[terms]
+            order = strongest_first(rows, weights)
+            rows, terms, weights = rows[order], terms[order], weights[order]
+            keep = np.arange(len(rows)) - (self.indptr[rows] - self.indptr[first]) < self.max_terms
+            pieces.append((rows[keep], terms[keep], weights[keep]))
+        rows, terms, weights = (np.concatenate(parts) for parts in zip(*pieces))
+        norms = np.sqrt(np.bincount(rows, weights=weights.astype(np.float64) ** 2, minlength=count))
+        weights = (weights / np.maximum(norms[rows], 1e-12)).astype(np.float32)
+        self.rows_indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=count))))
+        self.row_terms, self.row_weights = terms, weights
+
+        # Term-major postings, strongest first, cut to each term's champions
+        order = strongest_first(terms, weights)
+        post_terms, post_docs, post_weights = terms[order], rows[order], weights[order]
+        term_starts = np.concatenate(([0], np.cumsum(np.bincount(post_terms, minlength=len(self.vocabulary)))))
+        rank = np.arange(len(post_terms)) - term_starts[:-1][post_terms] if len(post_terms) else post_terms
+        keep = rank < self.champions
+        post_terms, self.post_weights = post_terms[keep], post_weights[keep]
+        self.post_docs = post_docs[keep].astype(np.int32)
+        self.term_starts = np.concatenate(([0], np.cumsum(np.bincount(post_terms, minlength=len(self.vocabulary)))))
+
+    def rescore(self, rows, collect_from=None):
+        """Recompute the neighbour lists of rows in blocks of at most block_pairs candidate pairs;
+        returns every scored pair (row, doc, score) whose row is in collect_from"""
+        rows = np.asarray(rows, dtype=np.int64)
+        count = len(self.ids)
+        self.neighbors[rows] = -1
+        self.scores[rows] = 0
+        if not len(rows) or count < 2:
+            return None
+        starts, lengths = self.rows_indptr[rows], self.rows_indptr[rows + 1] - self.rows_indptr[rows]
+        entries = ranges(starts, lengths)
+        entry_terms = self.row_terms[entries]
+        fan_out = self.term_starts[entry_terms + 1] - self.term_starts[entry_terms]
+        row_pairs = np.bincount(np.repeat(np.arange(len(rows)), lengths), weights=fan_out, minlength=len(rows))
+        entry_bounds = np.concatenate(([0], np.cumsum(lengths)))
+        collect = np.isin(rows, collect_from) if collect_from is not None else None
+        collected = []
+
+        block_start = 0
+        cumulative = np.cumsum(row_pairs)
+        while block_start < len(rows):
+            base = cumulative[block_start - 1] if block_start else 0
+            block_end = max(block_start + 1, int(np.searchsorted(cumulative, base + self.block_pairs, 'right')))
+            first, last = entry_bounds[block_start], entry_bounds[block_end]
+            local = np.repeat(np.arange(block_end - block_start), lengths[block_start:block_end])
+            terms, fan = entry_terms[first:last], fan_out[first:last]
+            postings = ranges(self.term_starts[terms], fan)
+            queries = np.repeat(local, fan)
+            products = np.repeat(self.row_weights[entries[first:last]], fan) * self.post_weights[postings]
+            keys = queries * count + self.post_docs[postings]
+            block = slice(block_start, block_end)
+            block_rows = rows[block]
+            block_start = block_end
+            if not len(keys):
+                continue
+            # Sum the partial products of each (row, doc) pair
+            order = np.argsort(keys)
+            keys = keys[order]
+            boundaries = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            sums = np.add.reduceat(products[order], boundaries)
+            queries, docs = np.divmod(keys[boundaries], count)
+            keep = (docs != block_rows[queries]) & (sums >= self.min_score)
+            queries, docs, sums = queries[keep], docs[keep], sums[keep]
+            if collect is not None:
+                wanted = collect[block][queries]
+                collected.append((block_rows[queries[wanted]], docs[wanted], sums[wanted]))
+
+            # Top k per row: sort by row then descending score, keep the first k of each row
+            order = strongest_first(queries, sums)
+            queries, docs, sums = queries[order], docs[order], sums[order]
+            group_starts = np.searchsorted(queries, queries, 'left')
+            rank = np.arange(len(queries)) - group_starts
+            top = rank < self.k
+            self.neighbors[block_rows[queries[top]], rank[top]] = docs[top]
+            self.scores[block_rows[queries[top]], rank[top]] = sums[top]
+
+        if collect_from is None:
+            return None
+        if not collected:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        return tuple(np.concatenate(parts) for parts in zip(*collected))
+
+    def merge(self, pairs, redo):
+        """Offer changed postings to the neighbour lists that weren't recomputed; returns lists changed"""
+        if pairs is None:
+            return 0
+        sources, targets, scores = pairs
+        # Cosine is symmetric: (changed, other, s) is also a candidate for other's list
+        offer = ~np.isin(targets, redo) & (scores > self.scores[targets, -1])
+        touched = 0
+        for target, source, score in zip(targets[offer], sources[offer], scores[offer]):
+            row_neighbors, row_scores = self.neighbors[target], self.scores[target]
+            if source in row_neighbors or score <= row_scores[-1]:
+                continue
+            slot = int(np.searchsorted(-row_scores, -score, 'right'))
+            row_neighbors[slot + 1:] = row_neighbors[slot:-1].copy()
+            row_scores[slot + 1:] = row_scores[slot:-1].copy()
+            row_neighbors[slot], row_scores[slot] = source, score
+            touched += 1
+        return touched
+
+    def similar_ids(self, row):
+        return [self.ids[doc] for doc in self.neighbors[row] if doc >= 0]
+
+    def save(self, path):
+        tmp_path = path + '.tmp.npz'
+        np.savez_compressed(
+            tmp_path, version=STATE_VERSION, params=np.array([self.k, self.max_terms, self.champions]),
+            min_score=self.min_score, ids=np.array(self.ids, dtype=str), hashes=self.hashes,
+            terms=np.array(list(self.vocabulary), dtype=str), idf=self.idf, indptr=self.indptr,
+            indices=self.indices, counts=self.counts, neighbors=self.neighbors, scores=self.scores)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, block_pairs=BLOCK_PAIRS):
+        """State saved by save(); None if missing or written by another version"""
+        try:
+            state = np.load(path)
+        except (OSError, ValueError):
+            return None
+        if int(state['version']) != STATE_VERSION:
+            return None
+        k, max_terms, champions = (int(value) for value in state['params'])
+        similar = cls(k, max_terms, champions, float(state['min_score']), block_pairs)
+        similar.ids = state['ids'].tolist()
+        similar.hashes = state['hashes']
+        similar.vocabulary = Vocabulary((term, i) for i, term in enumerate(state['terms'].tolist()))
+        for name in ('idf', 'indptr', 'indices', 'counts', 'neighbors', 'scores'):
+            setattr(similar, name, state[name])
+        return similar
+
+def add_similar_job_ids(jobs, state_path=None, k=SIMILAR_K):
+    """Set 'similar_job_ids' on every job; with state_path, refresh the saved state incrementally"""
+    similar = SimilarJobs.load(state_path) if state_path and os.path.exists(state_path) else None
+    if similar is None or similar.k != k:
+        similar = SimilarJobs(k).fit(jobs)
+    else:
+        similar.update(jobs)
+    if state_path:
+        similar.save(state_path)
+    for row, job in enumerate(jobs):
+        job['similar_job_ids'] = similar.similar_ids(row)
+    return similar
+
+def similar_stage(state_path=None, k=SIMILAR_K):
+    """Pipeline stage that holds the deduplicated postings and emits them with similar_job_ids"""
+    def similar(records):
+        jobs = list(records)
+        add_similar_job_ids(jobs, state_path, k)
+        yield from jobs
+    return similar
+
+def main():
+    """Add similar_job_ids to a jobs JSON file"""
+    parser = argparse.ArgumentParser(description="Add similar_job_ids recommendations to a jobs JSON array")
+    parser.add_argument("jobs", nargs="?", default="src/data/jobs.json")
+    parser.add_argument("--output", help="write here instead of updating the jobs file in place")
+    parser.add_argument("--state", metavar="NPZ", help="keep state here and only re-score changed postings")
+    parser.add_argument("-k", type=int, default=SIMILAR_K, help="neighbours per posting")
+    args = parser.parse_args()
+
+    with open(args.jobs, encoding='utf-8') as f:
+        jobs = json.load(f)
+    similar = add_similar_job_ids(jobs, args.state, args.k)
+    output = args.output or args.jobs
+    tmp_path = output + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(jobs, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    os.replace(tmp_path, output)
+    stats = similar.stats
+    print(f"✅ {stats['mode'].capitalize()} similarity for {stats['postings']} postings "
+          f"({stats['rescored']} re-scored, {stats['merged']} lists merged) in {stats['seconds']:.2f}s -> {output}")
+
+if __name__ == "__main__":
+    main()
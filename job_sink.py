@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Streaming output for scraped jobs
+Appends each job to JSONL and CSV as soon as it is ready, so a crash keeps every
+finished record, then atomically rewrites the JSONL into the usual indented JSON array
+"""
+
+import csv
+import json
+import os
+
+from job_record import json_default, plain
+from scrape_metrics import METRICS
+
+def csv_value(value):
+    """Flatten a job field for a CSV cell"""
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return '; '.join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+def csv_row(job, columns):
+    job = plain(job)
+    return {column: csv_value(job.get(column)) for column in columns}
+
+def json_array_item(job):
+    """One element of an indent=2 JSON array, formatted exactly as json.dump would"""
+    return '  ' + json.dumps(plain(job), indent=2, ensure_ascii=False, default=json_default).replace('\n', '\n  ')
+
+def write_json_array(filename, jobs):
+    """Write jobs as an indented JSON array via a temp file and atomic rename; returns the count"""
+    tmp_path = filename + '.tmp'
+    count = 0
+    with METRICS.span('save.json'):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for job in jobs:
+                f.write('[\n' if count == 0 else ',\n')
+                f.write(json_array_item(job))
+                count += 1
+            f.write('\n]' if count else '[]')
+        os.replace(tmp_path, filename)
+    return count
+
+def write_csv(filename, jobs, columns):
+    """Write jobs to CSV with a fixed column list via a temp file and atomic rename"""
+    tmp_path = filename + '.tmp'
+    with METRICS.span('save.csv'):
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore', lineterminator='\n')
+            writer.writeheader()
+            for job in jobs:
+                writer.writerow(csv_row(job, columns))
+        os.replace(tmp_path, filename)
+
+def read_jsonl(filename):
+    """Yield records from a JSONL file, skipping a torn final line left by a crash"""
+    with open(filename, encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+class StreamingJobSink:
+    """Crash-safe per-record JSONL + CSV writer that finalizes into a JSON array"""
+
+    def __init__(self, json_path, csv_path=None, columns=None, append=False, fsync=False):
+        self.json_path = json_path
+        self.jsonl_path = os.path.splitext(json_path)[0] + '.jsonl'
+        self.csv_path = csv_path
+        self.columns = list(columns or [])
+        self.fsync = fsync
+        self.count = 0
+
+        mode = 'a' if append else 'w'
+        self.jsonl_file = open(self.jsonl_path, mode, encoding='utf-8')
+        self.csv_file = None
+        if csv_path:
+            write_header = not (append and os.path.exists(csv_path) and os.path.getsize(csv_path))
+            self.csv_file = open(csv_path, mode, newline='', encoding='utf-8')
+            self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=self.columns,
+                                             extrasaction='ignore', lineterminator='\n')
+            if write_header:
+                self.csv_writer.writeheader()
+
+    def write(self, job):
+        """Append one job to both files and flush them to the OS"""
+        with METRICS.span('save.stream'):
+            self.jsonl_file.write(json.dumps(plain(job), ensure_ascii=False, default=json_default) + '\n')
+            self.flush(self.jsonl_file)
+            if self.csv_file:
+                self.csv_writer.writerow(csv_row(job, self.columns))
+                self.flush(self.csv_file)
+        self.count += 1
+
+    def flush(self, f):
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def close(self):
+        self.jsonl_file.close()
+        if self.csv_file:
+            self.csv_file.close()
+
+    def finalize(self, remove_jsonl=True):
+        """Close the streams and rewrite the JSONL as the JSON array output"""
+        self.close()
+        count = write_json_array(self.json_path, read_jsonl(self.jsonl_path))
+        if remove_jsonl:
+            os.remove(self.jsonl_path)
+        return count
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Previous-run state for incremental scrapes
+Indexes the last output file by job ID and classifies the current listing into
+new, changed, unchanged and removed postings by comparing card fingerprints
+"""
+
+import hashlib
+import json
+import re
+from datetime import date
+
+from job_record import JobRecord
+
+COMPANY_JOBS_URL = "https://www.linkedin.com/company/{slug}/jobs/"
+
+JOB_ID_PATTERNS = [
+    re.compile(r'urn:li:jobPosting:(\d+)'),
+    re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)'),
+    re.compile(r'currentJobId=(\d+)'),
+]
+
+# A company's jobs page links its job search through the f_C filter and embeds the organization URN
+COMPANY_ID_PATTERNS = [
+    re.compile(r'[?&;]f_C=(\d+)'),
+    re.compile(r'urn:li:(?:fs_normalized_company|organization|company):(\d+)'),
+]
+
+# What the scrapers store when a detail page never rendered its description
+DESCRIPTION_PLACEHOLDER = 'Description not available'
+
+# Listing-card fields that identify a posting's visible state; job_url is left out
+# because LinkedIn rotates its tracking parameters between runs
+FINGERPRINT_FIELDS = ('title', 'company', 'location', 'posted_time', 'job_type')
+
+def job_id_from_text(text):
+    """Job ID from a job URL, an entity URN or a currentJobId query parameter"""
+    for pattern in JOB_ID_PATTERNS:
+        match = pattern.search(text or '')
+        if match:
+            return match.group(1)
+    return None
+
+def company_id_from_text(text):
+    """Numeric LinkedIn company ID from a company page's f_C search link or organization URN"""
+    for pattern in COMPANY_ID_PATTERNS:
+        match = pattern.search(text or '')
+        if match:
+            return match.group(1)
+    return None
+
+def job_key(job):
+    """Stable identity for a job dict: its job ID, else its URL without the query string"""
+    job_id = job.get('job_id') or job_id_from_text(job.get('job_url'))
+    if job_id:
+        return str(job_id)
+    url = (job.get('job_url') or '').split('?', 1)[0]
+    return url or None
+
+def card_fingerprint(job):
+    """Hash of the listing-card fields; unchanged cards don't need their details refetched"""
+    values = [str(job.get(field) or '') for field in FINGERPRINT_FIELDS]
+    return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()[:16]
+
+def has_details(job, detail_fields):
+    """Whether a previous run's job holds every detail field and a real description"""
+    if any(field not in job for field in detail_fields):
+        return False
+    return 'description' not in detail_fields or job['description'] not in (None, '', DESCRIPTION_PLACEHOLDER)
+
+class StateIndex:
+    """Jobs from the previous run keyed by job ID"""
+
+    def __init__(self, jobs=()):
+        self.jobs = {}
+        for job in jobs:
+            key = job_key(job)
+            if key:
+                self.jobs[key] = job
+        self.counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'removed': 0, 'fetches_avoided': 0, 'refetched': 0}
+
+    @classmethod
+    def load(cls, filename):
+        """Index a previous output file; a missing or unreadable file gives an empty index"""
+        try:
+            with open(filename, encoding='utf-8') as f:
+                return cls(JobRecord(job) for job in json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"No previous state loaded from {filename}: {e}")
+            return cls()
+
+    def reconcile(self, jobs, detail_fields):
+        """Classify the current listing against the previous run
+
+        Carries the previous details forward into unchanged jobs and returns
+        (indices that still need a detail fetch, previous jobs missing from
+        the listing, marked closed).
+        """
+        seen = set()
+        to_fetch = []
+        for i, job in enumerate(jobs):
+            key = job_key(job)
+            if key and key.isdigit() and not job.get('job_id'):
+                job['job_id'] = key
+            job['fingerprint'] = card_fingerprint(job)
+            job['status'] = 'open'
+            previous = self.jobs.get(key) if key else None
+            seen.add(key)
+
+            if previous is None:
+                job['change'] = 'new'
+            elif previous.get('fingerprint', card_fingerprint(previous)) != job['fingerprint'] \
+                    or previous.get('status') == 'closed':
+                job['change'] = 'changed'
+            else:
+                job['change'] = 'unchanged'
+                if has_details(previous, detail_fields):
+                    for field in detail_fields:
+                        if field in previous:
+                            job[field] = previous[field]
+                    self.counts['fetches_avoided'] += 1
+                else:
+                    # The previous detail fetch failed; carrying it forward would keep the gap forever
+                    self.counts['refetched'] += 1
+                    to_fetch.append(i)
+            self.counts[job['change']] += 1
+            if job['change'] != 'unchanged':
+                to_fetch.append(i)
+
+        # Postings closed in earlier runs are carried forward as they are
+        removed = []
+        for key, previous in self.jobs.items():
+            if key in seen:
+                continue
+            if previous.get('status') == 'closed':
+                removed.append(previous)
+                continue
+            removed.append(JobRecord(previous, status='closed', change='removed', closed_on=date.today().isoformat()))
+            self.counts['removed'] += 1
+        return to_fetch, removed
+
+    def print_summary(self):
+        counts = self.counts
+        print(f"\nIncremental run: {counts['new']} new, {counts['changed']} changed, "
+              f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+        print(f"Detail fetches avoided: {counts['fetches_avoided']}"
+              + (f" ({counts['refetched']} unchanged jobs refetched after a failed detail fetch)"
+                 if counts['refetched'] else ''))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Single-pass multi-keyword matcher for page text
+Builds an Aho-Corasick automaton over job title patterns so the page is scanned
+once regardless of how many patterns there are, and caches the compiled
+automaton on disk between runs
+"""
+
+import hashlib
+import os
+import pickle
+from collections import deque
+
+CACHE_VERSION = 1
+
+class KeywordMatcher:
+    """Aho-Corasick automaton reporting every (possibly overlapping) pattern occurrence"""
+
+    def __init__(self, patterns, case_sensitive=False, whole_words=False):
+        self.case_sensitive = case_sensitive
+        self.whole_words = whole_words
+        self.patterns = []
+        seen = set()
+        for pattern in patterns:
+            pattern = pattern.strip()
+            key = pattern if case_sensitive else pattern.lower()
+            if pattern and key not in seen:
+                seen.add(key)
+                self.patterns.append(pattern)
+        self.build()
+
+    def build(self):
+        """Build the trie, failure links and merged output lists"""
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in self.fold(pattern):
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += ((index, len(pattern)),)
+
+        # Breadth-first so every state's failure target is finished before its children
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self.goto[state].items():
+                queue.append(child)
+                target = self.fail[state]
+                while target and ch not in self.goto[target]:
+                    target = self.fail[target]
+                fallback = self.goto[target].get(ch, 0)
+                self.fail[child] = fallback if fallback != child else 0
+                self.output[child] += self.output[self.fail[child]]
+
+    def fold(self, text):
+        """Case-fold text without changing its length, so offsets map back to the original"""
+        if self.case_sensitive:
+            return text
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+    def find_all(self, text):
+        """Every match as (start, end, pattern), in order of end offset"""
+        goto, fail, output = self.goto, self.fail, self.output
+        matches = []
+        state = 0
+        for i, ch in enumerate(self.fold(text)):
+            transitions = goto[state]
+            while state and ch not in transitions:
+                state = fail[state]
+                transitions = goto[state]
+            state = transitions.get(ch, 0)
+            if output[state]:
+                end = i + 1
+                for index, length in output[state]:
+                    start = end - length
+                    if self.whole_words and not self.on_word_boundary(text, start, end):
+                        continue
+                    matches.append((start, end, self.patterns[index]))
+        return matches
+
+    def first_matches(self, text):
+        """First occurrence of each matched pattern, in pattern order: {pattern: (start, end)}"""
+        first = {}
+        for start, end, pattern in self.find_all(text):
+            if pattern not in first:
+                first[pattern] = (start, end)
+        order = {pattern: index for index, pattern in enumerate(self.patterns)}
+        return dict(sorted(first.items(), key=lambda item: order[item[0]]))
+
+    @staticmethod
+    def on_word_boundary(text, start, end):
+        before = text[start - 1] if start > 0 else ' '
+        after = text[end] if end < len(text) else ' '
+        return not before.isalnum() and not after.isalnum()
+
+    @staticmethod
+    def snippet(text, start, end, width=60):
+        """Whitespace-collapsed context around a match"""
+        left = max(0, start - width)
+        right = min(len(text), end + width)
+        return ' '.join(text[left:right].split())
+
+    @classmethod
+    def from_file(cls, filename, cache_dir=None, **options):
+        """Load patterns from a file (one per line, # comments), reusing a cached automaton when possible"""
+        with open(filename, encoding='utf-8') as f:
+            patterns = [line for line in f.read().splitlines() if line.strip() and not line.lstrip().startswith('#')]
+        return cls.cached(patterns, cache_dir, **options)
+
+    @classmethod
+    def cached(cls, patterns, cache_dir=None, **options):
+        """Build a matcher, or unpickle the one compiled for identical patterns and options"""
+        if not cache_dir:
+            return cls(patterns, **options)
+
+        digest = hashlib.sha1(repr((CACHE_VERSION, sorted(options.items()), list(patterns))).encode('utf-8'))
+        path = os.path.join(cache_dir, f"matcher-{digest.hexdigest()}.pickle")
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+        matcher = cls(patterns, **options)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return matcher
@@ -4,197 +4,582 @@ LinkedIn Job Scraper for Powered By MRP
 Scrapes job listings from the company's LinkedIn jobs page
 """
 
+import argparse
 import requests
 from bs4 import BeautifulSoup
 import json
 import time
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchElementException, TimeoutException
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
+from driver_provision import DriverProvider, PageWeightMeter
+from fetch_policy import BlockedError, FetchPolicy, RetryPolicy
+from page_waits import AdaptiveWaiter
+from scrape_metrics import METRICS, add_metrics_arguments, configure_metrics, export_metrics
+from job_record import NOT_SPECIFIED, JobRecord
+from job_state import COMPANY_JOBS_URL, DESCRIPTION_PLACEHOLDER, StateIndex, job_id_from_text
+from job_sink import StreamingJobSink, write_csv, write_json_array
+from network_capture import LISTING_PAGE_SIZE, NetworkCapture, decode_detail, decode_listing
+from replay_archive import FixtureArchive, ReplayServer
+from scrape_checkpoint import CheckpointJournal
+
+class DriverPool:
+    """Bounded pool of Chrome drivers that are reused across job detail pages"""
+
+    def __init__(self, factory, size):
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle = queue.Queue()
+        self.created = []
+        self.members = 0
+        self.lock = threading.Lock()
+
+    def add(self, driver):
+        """Lend an existing driver to the pool; the caller remains responsible for quitting it"""
+        with self.lock:
+            self.members += 1
+        self.idle.put(driver)
+
+    def acquire(self):
+        """Return an idle driver, launching a new one while the pool is below its size"""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Reserve the slot before launching so concurrent callers can't overshoot the size
+        with self.lock:
+            can_launch = self.members < self.size
+            if can_launch:
+                self.members += 1
+
+        if not can_launch:
+            return self.idle.get()
+
+        try:
+            driver = self.factory()
+        except Exception:
+            with self.lock:
+                self.members -= 1
+            raise
+        with self.lock:
+            self.created.append(driver)
+        return driver
+
+    def release(self, driver):
+        """Hand a driver back to the pool for the next job"""
+        self.idle.put(driver)
+
+    def discard(self, driver):
+        """Drop a driver whose session died instead of releasing it; frees its slot for a new launch"""
+        with self.lock:
+            self.members -= 1
+            launched = driver in self.created
+            if launched:
+                self.created.remove(driver)
+        # A lent driver is still quit by its owner
+        if launched:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing pooled driver: {e}")
+
+    def close(self):
+        """Quit every driver launched by the pool"""
+        with self.lock:
+            drivers, self.created = self.created, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing pooled driver: {e}")
+
+JOB_CARD_SELECTOR = ".jobs-search-results__list-item"
+
+# Declarative selector map shared by the script, element and network extraction modes:
+# (field, CSS selector, what to read, default). "text" reads the element text,
+# "text[]" the text of every match, anything else is an attribute/property name.
+# A default of None marks the field as required; cards missing it are skipped. Optional
+# fields read as null (element present, attribute absent) also take their default.
+# An empty selector reads from the card element itself.
+CARD_FIELDS = [
+    ('job_id', '', 'data-job-id', ""),
+    ('title', '.job-search-card__title a', 'text', None),
+    ('job_url', '.job-search-card__title a', 'href', None),
+    ('company', '.job-search-card__subtitle-link', 'text', NOT_SPECIFIED),
+    ('location', '.job-search-card__location', 'text', NOT_SPECIFIED),
+    ('posted_time', 'time', 'datetime', NOT_SPECIFIED),
+    ('job_type', '.job-search-card__metadata-item', 'text', NOT_SPECIFIED),
+]
+
+DETAIL_FIELDS = [
+    ('description', '.jobs-description-content__text', 'text', DESCRIPTION_PLACEHOLDER),
+    ('requirements', '.jobs-description-content__text ul li', 'text[]', []),
+    ('benefits', '.jobs-unified-top-card__job-insight', 'text', NOT_SPECIFIED),
+    ('salary', '.jobs-unified-top-card__job-insight--salary', 'text', NOT_SPECIFIED),
+    ('employment_type', '.jobs-unified-top-card__job-insight--employment-type', 'text', NOT_SPECIFIED),
+]
+
+DESCRIPTION_SELECTOR = '.jobs-description-content__text'
+# Closed postings and the sign-in wall never render a description, but they do render one of these
+DETAIL_SETTLED_SELECTOR = (f"{DESCRIPTION_SELECTOR}, .jobs-unified-top-card, .jobs-details-top-card__apply-error, "
+                           ".authwall-join-form")
+
+CARD_DEFAULTS = {name: default for name, _, _, default in CARD_FIELDS if default is not None}
+
+DETAIL_FIELD_NAMES = [name for name, _, _, _ in DETAIL_FIELDS]
+
+CSV_COLUMNS = [name for name, _, _, _ in CARD_FIELDS] + DETAIL_FIELD_NAMES + [
+    'fingerprint', 'status', 'change', 'closed_on'
+]
+
+# Evaluates the selector map in the page and returns all records as one JSON string
+EXTRACTION_SCRIPT = """
+const [rootSelector, fields] = arguments;
+const roots = rootSelector ? document.querySelectorAll(rootSelector) : [document];
+const read = (el, what) => {
+  if (what === 'text') return (el.innerText || el.textContent || '').trim();
+  const value = what in el ? el[what] : el.getAttribute(what);
+  return value === undefined ? null : value;
+};
+const records = Array.from(roots, root => {
+  const record = {};
+  for (const [name, selector, what, fallback] of fields) {
+    if (what === 'text[]') {
+      record[name] = Array.from(root.querySelectorAll(selector), el => read(el, 'text'));
+      continue;
+    }
+    const el = selector ? root.querySelector(selector) : root;
+    record[name] = el ? read(el, what) : fallback;
+  }
+  return record;
+});
+return JSON.stringify(records);
+"""
+
+def read_fields_from_elements(scope, fields):
+    """Read the selector map one find_element call at a time (slow path, one round-trip per field)"""
+    record = {}
+    for name, selector, what, default in fields:
+        try:
+            if what == 'text[]':
+                record[name] = [el.text.strip() for el in scope.find_elements(By.CSS_SELECTOR, selector)]
+                continue
+            element = scope.find_element(By.CSS_SELECTOR, selector) if selector else scope
+            record[name] = element.text.strip() if what == 'text' else element.get_attribute(what)
+        except NoSuchElementException:
+            record[name] = default
+    return record
+
+SCROLL_STATE_SCRIPT = """
+return [document.querySelectorAll('.jobs-search-results__list-item').length,
+        document.body.scrollHeight];
+"""
 
 class LinkedInJobScraper:
-    def __init__(self):
-        self.base_url = "https://www.linkedin.com/company/poweredbymrp/jobs/"
+    def __init__(self, detail_workers=1, wait_timeouts=None, extraction_mode='script', previous_output=None,
+                 sink=None, checkpoint=None, company="poweredbymrp", driver=None, provider=None, recorder=None,
+                 policy=None):
+        self.base_url = COMPANY_JOBS_URL.format(slug=company)
         self.jobs_data = []
-        self.setup_driver()
-    
-    def setup_driver(self):
-        """Setup Chrome driver with appropriate options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-    
-    def scrape_jobs(self):
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.recorder = recorder
+        self.failed_details = 0
+        self.detail_workers = max(1, detail_workers)
+        self.extraction_mode = extraction_mode
+        # Network mode reads the job responses out of each driver's DevTools log, falling back to the DOM
+        self.captures = {}
+        self.capture_lock = threading.Lock()
+        self.capture_counts = {'listing_responses': 0, 'details': 0, 'fallbacks': 0}
+        # Incremental mode: only fetch details for postings that are new or changed since the last run
+        self.state = StateIndex.load(previous_output) if previous_output else None
+        self.detail_indices = None
+        self.waiter = AdaptiveWaiter(wait_timeouts)
+        self.provider = provider or DriverProvider(capture_network=extraction_mode == 'network')
+        self.policy = policy or FetchPolicy()
+        self.page_weight = PageWeightMeter()
+        self.setup_driver(driver)
+    
+    def setup_driver(self, driver=None):
+        """Setup Chrome driver with appropriate options, or borrow a long-lived one from the caller"""
+        self.owns_driver = driver is None
+        self.driver = driver or self.create_driver()
+    
+    def create_driver(self):
+        """Launch a headless Chrome driver from the cached chromedriver, with assets blocked"""
+        return self.provider.launch()
+    
+    def scrape_jobs(self, resume=False):
         """Main method to scrape all job listings"""
         try:
-            print("Navigating to LinkedIn jobs page...")
-            self.driver.get(self.base_url)
+            removed = self.restore_checkpoint() if resume else None
+            if removed is None:
+                removed = self.load_listing()
             
+            # Get detailed information for each job
+            self.get_job_details()
+            
+            self.jobs_data.extend(removed)
+            for job in removed:
+                self.emit(job)
+            
+            if self.checkpoint:
+                if self.failed_details:
+                    print(f"{self.failed_details} job details failed; rerun with --resume to retry them")
+                    self.checkpoint.close()
+                else:
+                    self.checkpoint.discard()
+            
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+            if self.checkpoint:
+                self.checkpoint.close()
+                print(f"Progress saved to {self.checkpoint.path}; rerun with --resume to continue")
+        finally:
+            if self.owns_driver:
+                self.driver.quit()
+    
+    def load_listing(self):
+        """Load the listing page, extract the cards and journal the snapshot; returns closed postings"""
+        print("Navigating to LinkedIn jobs page...")
+        capture = self.capture_for(self.driver)
+        with METRICS.span('selenium.driver_get'):
+            self.policy.load_page(self.driver, self.base_url)
+        METRICS.count('selenium.pages')
+        
+        if not (capture and self.capture_listing(capture)):
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
+            ready, waited = self.waiter.wait_for(
+                'listing', lambda: self.driver.find_elements(By.CLASS_NAME, "jobs-search-results-list")
             )
+            self.waiter.record(self.base_url, 'listing', waited, ready=ready)
+            if not ready:
+                raise TimeoutException("Job list did not load")
             
             # Scroll to load more jobs
             self.scroll_to_load_jobs()
             
             # Extract job listings
             self.extract_job_listings()
-            
-            # Get detailed information for each job
-            self.get_job_details()
-            
-        except Exception as e:
-            print(f"Error during scraping: {e}")
-        finally:
-            self.driver.quit()
+        self.page_weight.record(self.driver, self.base_url)
+        if self.recorder:
+            self.recorder.record_page(self.driver, self.base_url)
+        
+        removed = []
+        if self.state:
+            self.detail_indices, removed = self.state.reconcile(self.jobs_data, DETAIL_FIELD_NAMES)
+        
+        if self.checkpoint:
+            indices = self.detail_indices if self.detail_indices is not None else range(len(self.jobs_data))
+            self.checkpoint.start(self.base_url, self.jobs_data, indices, removed)
+        return removed
+    
+    def restore_checkpoint(self):
+        """Reload the listing snapshot and finished jobs from the journal; returns closed postings or None"""
+        saved = self.checkpoint.load() if self.checkpoint else None
+        if not saved or saved[0].get('source') != self.base_url:
+            print("No checkpoint to resume from; starting a fresh scrape")
+            return None
+        
+        listing, completed = saved
+        self.jobs_data = [JobRecord(job) for job in listing['jobs']]
+        for index, job in completed.items():
+            self.jobs_data[index] = JobRecord(job)
+        self.detail_indices = [i for i in listing['detail_indices'] if i not in completed]
+        self.checkpoint.reopen()
+        print(f"Resuming from {self.checkpoint.path}: {len(completed)} jobs already done, "
+              f"{len(self.detail_indices)} remaining")
+        return [JobRecord(job) for job in listing['removed']]
     
     def scroll_to_load_jobs(self):
         """Scroll down to load all available jobs"""
         print("Scrolling to load all jobs...")
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        last_count, last_height = self.driver.execute_script(SCROLL_STATE_SCRIPT)
         
         while True:
             # Scroll down to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             
-            # Wait for new content to load
-            time.sleep(2)
+            # Wait until more cards render or the page grows; a timeout means the list is exhausted
+            def grown():
+                count, height = self.driver.execute_script(SCROLL_STATE_SCRIPT)
+                return (count, height) if count > last_count or height > last_height else None
             
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            with METRICS.span('selenium.scroll'):
+                state, waited = self.waiter.wait_for('scroll', grown)
+            METRICS.count('selenium.scroll_iterations')
+            self.waiter.record(self.base_url, 'scroll', waited, ready=state is not None)
+            if state is None:
                 break
-            last_height = new_height
+            last_count, last_height = state
     
     def extract_job_listings(self):
         """Extract basic job information from the listings page"""
         print("Extracting job listings...")
         
-        # Find all job cards
-        job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list-item")
-        
-        for card in job_cards:
-            try:
-                job_data = {}
-                
-                # Job title
-                title_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__title a")
-                job_data['title'] = title_element.text.strip()
-                job_data['job_url'] = title_element.get_attribute('href')
-                
-                # Company name
-                company_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__subtitle-link")
-                job_data['company'] = company_element.text.strip()
-                
-                # Location
-                location_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__location")
-                job_data['location'] = location_element.text.strip()
-                
-                # Posted time
-                try:
-                    time_element = card.find_element(By.CSS_SELECTOR, "time")
-                    job_data['posted_time'] = time_element.get_attribute('datetime')
-                except:
-                    job_data['posted_time'] = "Not specified"
-                
-                # Job type (if available)
-                try:
-                    type_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__metadata-item")
-                    job_data['job_type'] = type_element.text.strip()
-                except:
-                    job_data['job_type'] = "Not specified"
-                
-                self.jobs_data.append(job_data)
-                
-            except Exception as e:
-                print(f"Error extracting job card: {e}")
+        with METRICS.span('selenium.extract_cards'):
+            if self.extraction_mode != 'elements':
+                records = self.run_extraction_script(self.driver, JOB_CARD_SELECTOR, CARD_FIELDS)
+            else:
+                # Find all job cards
+                records = []
+                for card in self.driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR):
+                    try:
+                        records.append(read_fields_from_elements(card, CARD_FIELDS))
+                    except Exception as e:
+                        print(f"Error extracting job card: {e}")
+        self.add_cards(records)
+    
+    def add_cards(self, records):
+        """Append card records to jobs_data, skipping cards without a required field; returns how many were new"""
+        METRICS.count('selenium.cards', len(records))
+        seen = {job['job_id'] for job in self.jobs_data if job.get('job_id')}
+        added = 0
+        for job_data in records:
+            for name, default in CARD_DEFAULTS.items():
+                if job_data.get(name) is None:
+                    job_data[name] = default
+            # Cards without data-job-id still carry the ID in their job URL
+            job_data['job_id'] = job_data['job_id'] or job_id_from_text(job_data.get('job_url')) or ""
+            missing = [name for name, value in job_data.items() if value is None]
+            if missing:
+                print(f"Error extracting job card: missing {', '.join(missing)}")
                 continue
+            if job_data.get('job_id') and job_data['job_id'] in seen:
+                continue
+            seen.add(job_data.get('job_id'))
+            self.jobs_data.append(JobRecord(job_data))
+            added += 1
+        return added
+    
+    def capture_for(self, driver):
+        """This driver's network capture, cleared for the next page; None outside network mode or without a log"""
+        if self.extraction_mode != 'network':
+            return None
+        with self.capture_lock:
+            if driver not in self.captures:
+                try:
+                    self.captures[driver] = NetworkCapture(driver)
+                    return self.captures[driver]
+                except Exception as e:
+                    print(f"Network capture unavailable, reading the DOM instead: {e}")
+                    self.captures[driver] = None
+            capture = self.captures[driver]
+        if capture:
+            capture.reset()
+        return capture
+    
+    def count_capture(self, name):
+        with self.capture_lock:
+            self.capture_counts[name] += 1
+    
+    def capture_listing(self, capture):
+        """Read the listing from captured responses, scrolling only to trigger the next page request
+        
+        The first page comes from the HTML document and later pages from the guest
+        seeMoreJobPostings (or signed-in Voyager) responses. Stops as soon as a page
+        comes back short, repeats itself or the reported total is reached. Returns
+        False when nothing could be decoded, so the caller can use the DOM instead.
+        """
+        print("Reading job listings from captured network responses...")
+        page_url = self.driver.current_url
+        responses = capture.drain()
+        pending = [response for response in responses if response.is_listing]
+        last_page = total = None
+        document = next((response for response in responses
+                         if response.resource_type == 'Document' and response.status == 200), None)
+        if document is not None:
+            with METRICS.span('selenium.decode_listing'):
+                records, _ = decode_listing(capture.body(document), document.mime_type,
+                                            JOB_CARD_SELECTOR, CARD_FIELDS, page_url)
+            if records:
+                last_page = len(records)
+                self.add_cards(records)
+        if last_page is None and not pending:
+            # Signed-in pages render the list client-side from an API call made after load
+            pending, _ = self.waiter.wait_for(
+                'listing', lambda: [response for response in capture.drain() if response.is_listing]
+            )
+        
+        while True:
+            added = None
+            while pending:
+                response = pending.pop(0)
+                with METRICS.span('selenium.decode_listing'):
+                    records, page_total = decode_listing(capture.body(response), response.mime_type,
+                                                         JOB_CARD_SELECTOR, CARD_FIELDS, page_url)
+                self.count_capture('listing_responses')
+                last_page, total = len(records), page_total if page_total is not None else total
+                added = self.add_cards(records)
+            if last_page is None:
+                self.count_capture('fallbacks')
+                return False
+            if (last_page < LISTING_PAGE_SIZE or added == 0
+                    or (total is not None and len(self.jobs_data) >= total)):
+                return True
+            
+            # A full page: scroll so the page asks for the next one, and wait for that response only
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            with METRICS.span('selenium.scroll'):
+                found, waited = self.waiter.wait_for(
+                    'scroll', lambda: [response for response in capture.drain() if response.is_listing]
+                )
+            METRICS.count('selenium.scroll_iterations')
+            self.waiter.record(self.base_url, 'scroll', waited, ready=bool(found))
+            if not found:
+                return True
+            pending.extend(found)
+    
+    def capture_details(self, capture, job):
+        """Detail fields for a job from the job page or detail API response just loaded; None if not captured"""
+        with METRICS.span('selenium.decode_detail'):
+            for response in reversed(capture.drain()):
+                if response.detail_id() != job.get('job_id') and response.url != job.get('job_url'):
+                    continue
+                details = decode_detail(capture.body(response), response.mime_type, DETAIL_FIELDS)
+                if details:
+                    self.count_capture('details')
+                    return details
+        self.count_capture('fallbacks')
+        return None
     
     def get_job_details(self):
         """Get detailed information for each job by visiting individual job pages"""
-        print(f"Getting detailed information for {len(self.jobs_data)} jobs...")
+        indices = self.detail_indices if self.detail_indices is not None else range(len(self.jobs_data))
+        print(f"Getting detailed information for {len(indices)} jobs...")
+        
+        if self.detail_workers == 1:
+            to_fetch = set(indices)
+            for i, job in enumerate(self.jobs_data):
+                if i in to_fetch:
+                    self.fetch_job_details(self.driver, i, job)
+                self.emit(job)
+            return
         
-        for i, job in enumerate(self.jobs_data):
+        # Fan the detail pages out over a pool of drivers; the listing driver is reused
+        # as the first pool member so only detail_workers - 1 extra browsers are launched
+        pool = DriverPool(self.create_driver, self.detail_workers)
+        pool.add(self.driver)
+        
+        def fetch(i, job):
+            driver = pool.acquire()
             try:
-                print(f"Processing job {i+1}/{len(self.jobs_data)}: {job['title']}")
-                
-                # Navigate to job detail page
-                self.driver.get(job['job_url'])
-                time.sleep(2)
+                details = self.fetch_job_details(driver, i, job)
+            except InvalidSessionIdException:
+                # The browser is gone; don't hand it to the next job
+                pool.discard(driver)
+                raise
+            except BaseException:
+                pool.release(driver)
+                raise
+            pool.release(driver)
+            return details
+        
+        executor = ThreadPoolExecutor(max_workers=self.detail_workers)
+        try:
+            futures = {i: executor.submit(fetch, i, self.jobs_data[i].copy()) for i in indices}
+            # Merge in listing order so jobs_data and the output stream keep the listing order
+            for i, job in enumerate(self.jobs_data):
+                if i in futures:
+                    details = futures[i].result()
+                    if details:
+                        job.update(details)
+                self.emit(job)
+        except BaseException:
+            # A login wall or a dead session ends the run: don't load the jobs still queued
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+            pool.close()
+    
+    def emit(self, job):
+        """Stream a finished job to the output sink, if one is attached"""
+        if self.sink:
+            self.sink.write(job)
+    
+    def fetch_job_details(self, driver, i, job):
+        """Load one job page on the given driver and return the job with its details filled in"""
+        try:
+            print(f"Processing job {i+1}/{len(self.jobs_data)}: {job['title']}")
+            
+            # Navigate to job detail page and wait for the description to render
+            capture = self.capture_for(driver)
+            with METRICS.span('selenium.driver_get'):
+                self.policy.load_page(driver, job['job_url'])
+            METRICS.count('selenium.pages')
+            start = time.perf_counter()
+            details = self.capture_details(capture, job) if capture else None
+            if details:
+                # The response already had the data; no need to wait for it to render
+                job.update(details)
+                self.waiter.record(job['job_url'], 'detail', 0.0, time.perf_counter() - start)
+            else:
+                with METRICS.span('selenium.wait_detail'):
+                    ready, waited = self.waiter.wait_for(
+                        'detail', lambda: driver.find_elements(By.CSS_SELECTOR, DETAIL_SETTLED_SELECTOR)
+                    )
+                    if ready and not driver.find_elements(By.CSS_SELECTOR, DESCRIPTION_SELECTOR):
+                        # The page settled without a description; give it a moment rather than the full cap
+                        ready, extra = self.waiter.wait_for(
+                            'detail_body', lambda: driver.find_elements(By.CSS_SELECTOR, DESCRIPTION_SELECTOR)
+                        )
+                        waited += extra
                 
                 # Extract detailed information
-                self.extract_job_details(job)
-                
-            except Exception as e:
-                print(f"Error getting details for job {job['title']}: {e}")
-                continue
+                start = time.perf_counter()
+                with METRICS.span('selenium.extract_detail'):
+                    self.extract_job_details(job, driver)
+                self.waiter.record(job['job_url'], 'detail', waited, time.perf_counter() - start, ready=bool(ready))
+            self.page_weight.record(driver, job['job_url'])
+            if self.recorder:
+                self.recorder.record_page(driver, job['job_url'])
+            if self.checkpoint:
+                self.checkpoint.complete(i, job)
+            return job
+            
+        except (InvalidSessionIdException, BlockedError):
+            # The browser is gone or LinkedIn is walling us off; stop here so the checkpoint
+            # can resume later instead of failing (and hammering) every remaining job
+            raise
+        except Exception as e:
+            print(f"Error getting details for job {job['title']}: {e}")
+            self.failed_details += 1
+            METRICS.count('selenium.detail_failures')
+            return None
     
-    def extract_job_details(self, job):
+    def extract_job_details(self, job, driver=None):
         """Extract detailed information from individual job page"""
+        driver = driver or self.driver
         try:
-            # Job description
-            try:
-                desc_element = self.driver.find_element(By.CSS_SELECTOR, ".jobs-description-content__text")
-                job['description'] = desc_element.text.strip()
-            except:
-                job['description'] = "Description not available"
-            
-            # Requirements/Qualifications
-            try:
-                requirements = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-description-content__text ul li")
-                job['requirements'] = [req.text.strip() for req in requirements]
-            except:
-                job['requirements'] = []
-            
-            # Benefits
-            try:
-                benefits_element = self.driver.find_element(By.CSS_SELECTOR, ".jobs-unified-top-card__job-insight")
-                job['benefits'] = benefits_element.text.strip()
-            except:
-                job['benefits'] = "Not specified"
-            
-            # Salary (if available)
-            try:
-                salary_element = self.driver.find_element(By.CSS_SELECTOR, ".jobs-unified-top-card__job-insight--salary")
-                job['salary'] = salary_element.text.strip()
-            except:
-                job['salary'] = "Not specified"
-            
-            # Employment type
-            try:
-                emp_type_element = self.driver.find_element(By.CSS_SELECTOR, ".jobs-unified-top-card__job-insight--employment-type")
-                job['employment_type'] = emp_type_element.text.strip()
-            except:
-                job['employment_type'] = "Not specified"
+            if self.extraction_mode != 'elements':
+                details = self.run_extraction_script(driver, None, DETAIL_FIELDS)[0]
+            else:
+                details = read_fields_from_elements(driver, DETAIL_FIELDS)
+            job.update(details)
             
         except Exception as e:
             print(f"Error extracting details: {e}")
     
+    def run_extraction_script(self, driver, root_selector, fields):
+        """Read every field of every matching root element in a single execute_script round-trip"""
+        spec = [list(field) for field in fields]
+        payload = driver.execute_script(EXTRACTION_SCRIPT, root_selector, spec)
+        return json.loads(payload)
+    
     def save_to_json(self, filename="mrp_jobs.json"):
         """Save scraped data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.jobs_data, f, indent=2, ensure_ascii=False)
+        write_json_array(filename, self.jobs_data)
         print(f"Data saved to {filename}")
     
     def save_to_csv(self, filename="mrp_jobs.csv"):
         """Save scraped data to CSV file"""
-        df = pd.DataFrame(self.jobs_data)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        write_csv(filename, self.jobs_data, CSV_COLUMNS)
         print(f"Data saved to {filename}")
     
     def print_summary(self):
@@ -205,25 +590,90 @@ class LinkedInJobScraper:
         if self.jobs_data:
             print(f"\nJob titles found:")
             for i, job in enumerate(self.jobs_data, 1):
-                print(f"{i}. {job['title']} - {job['location']}")
+                closed = " (closed)" if job.get('status') == 'closed' else ""
+                print(f"{i}. {job['title']} - {job['location']}{closed}")
+        
+        if self.state:
+            self.state.print_summary()
+        self.waiter.print_summary()
+        self.provider.print_summary()
+        self.page_weight.print_summary()
+        if self.extraction_mode == 'network':
+            counts = self.capture_counts
+            print(f"\nNetwork capture: {counts['listing_responses']} listing responses and {counts['details']} "
+                  f"job details decoded, {counts['fallbacks']} fallbacks to the DOM")
+        self.policy.print_summary()
         
         print(f"\n=== END SUMMARY ===")
 
 def main():
     """Main function to run the scraper"""
-    scraper = LinkedInJobScraper()
+    parser = argparse.ArgumentParser(description="Scrape Powered By MRP job listings from LinkedIn")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of Chrome drivers used to fetch job detail pages concurrently")
+    parser.add_argument("--extraction", choices=["script", "elements", "network"], default="script",
+                        help="read each page in one execute_script call, one find_element call per field, "
+                             "or from the job responses in the browser's network log")
+    parser.add_argument("--incremental", nargs="?", const="mrp_jobs.json", metavar="PREVIOUS_JSON",
+                        help="reuse details from a previous run's output for unchanged postings")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted run from its checkpoint journal")
+    parser.add_argument("--checkpoint", default="mrp_jobs.checkpoint.jsonl",
+                        help="checkpoint journal written during the run")
+    parser.add_argument("--offline", action="store_true",
+                        help="never download chromedriver; use the cached path, CHROMEDRIVER_PATH or PATH")
+    parser.add_argument("--no-block", action="store_true",
+                        help="load images, fonts, stylesheets and trackers instead of blocking them")
+    parser.add_argument("--attach", metavar="HOST:PORT",
+                        help="reuse a warm Chrome started with --remote-debugging-port instead of launching one")
+    parser.add_argument("--max-attempts", type=int, default=4,
+                        help="tries per page before giving up on page-load errors")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", metavar="ARCHIVE", help="save every loaded page to a fixture archive")
+    fixtures.add_argument("--replay", metavar="ARCHIVE",
+                          help="load pages from a fixture archive served on localhost instead of linkedin.com")
+    parser.add_argument("--history", metavar="DIR",
+                        help="also append this run's jobs to a Parquet job-history store")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    configure_metrics(args)
+    
+    # Stream each job to mrp_jobs.jsonl / mrp_jobs.csv as it completes; mrp_jobs.json is written at the end
+    sink = StreamingJobSink("mrp_jobs.json", "mrp_jobs.csv", CSV_COLUMNS)
+    recorder = FixtureArchive(args.record, 'w') if args.record else None
+    replay = ReplayServer(FixtureArchive(args.replay)).start() if args.replay else None
+    scraper = LinkedInJobScraper(detail_workers=args.workers, extraction_mode=args.extraction,
+                                 previous_output=args.incremental, sink=sink,
+                                 checkpoint=CheckpointJournal(args.checkpoint),
+                                 provider=DriverProvider(offline=args.offline, block_assets=not args.no_block,
+                                                         debugger_address=args.attach,
+                                                         capture_network=args.extraction == 'network'),
+                                 recorder=recorder, policy=FetchPolicy(RetryPolicy(max_attempts=args.max_attempts)))
+    if replay:
+        scraper.base_url = replay.url_for(scraper.base_url)
     
     try:
-        scraper.scrape_jobs()
+        scraper.scrape_jobs(resume=args.resume)
         scraper.print_summary()
-        scraper.save_to_json()
-        scraper.save_to_csv()
+        count = sink.finalize()
+        print(f"Data saved to mrp_jobs.json and mrp_jobs.csv ({count} jobs)")
+        if args.history:
+            from job_history import JobHistoryStore
+            print(f"History snapshot saved to {JobHistoryStore(args.history).append(scraper.jobs_data)}")
+        export_metrics(args)
         
     except Exception as e:
         print(f"Error in main: {e}")
     finally:
+        sink.close()
         if hasattr(scraper, 'driver'):
             scraper.driver.quit()
+        if recorder:
+            recorder.close()
+            print(f"Recorded {len(recorder.index)} pages to {args.record}")
+        if replay:
+            replay.stop()
+            replay.archive.close()
 
 if __name__ == "__main__":
     main()
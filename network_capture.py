@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Network-capture extraction for the Selenium scraper
+Reads the job-list and job-detail responses a page fetched out of Chrome's DevTools
+performance log and decodes them straight into job records, so listings don't have to be
+scrolled until the page stops growing and rendered cards read back out of the DOM
+"""
+
+import base64
+import html
+import json
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from job_record import NOT_SPECIFIED
+from simple_linkedin_scraper import resolve_parser
+
+# Guest pages fetch further cards from seeMoreJobPostings; signed-in pages use the Voyager API
+LISTING_URL_RE = re.compile(r'/jobs-guest/jobs/api/seeMoreJobPostings/|/voyager/api/voyagerJobsDashJobCards')
+DETAIL_URL_RE = re.compile(r'/jobs-guest/jobs/api/jobPosting/(\d+)|/voyager/api/jobs/jobPostings/(\d+)'
+                           r'|/jobs/view/(?:[^/?#]*-)?(\d+)')
+VOYAGER_ID_RE = re.compile(r'jobPosting(?:Card)?:\(?(\d+)', re.IGNORECASE)
+LISTING_PAGE_SIZE = 25
+
+class CapturedResponse:
+    """A finished response seen in the performance log"""
+
+    def __init__(self, request_id, url, status, mime_type, resource_type):
+        self.request_id = request_id
+        self.url = url
+        self.status = status
+        self.mime_type = mime_type
+        self.resource_type = resource_type
+
+    @property
+    def is_listing(self):
+        return self.status == 200 and LISTING_URL_RE.search(self.url) is not None
+
+    def detail_id(self):
+        """The job ID of a detail API response or job page, else None"""
+        match = DETAIL_URL_RE.search(self.url) if self.status == 200 else None
+        return next((group for group in match.groups() if group), None) if match else None
+
+class NetworkCapture:
+    """Collects finished responses from one driver's DevTools performance log and reads their bodies"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pending = {}
+        self.stats = {'log_entries': 0, 'responses': 0, 'bodies': 0, 'body_bytes': 0}
+        # Raises on drivers started without the performance log, so the caller can fall back to the DOM
+        driver.execute_cdp_cmd('Network.enable', {})
+        self.reset()
+
+    def reset(self):
+        """Forget everything logged so far, e.g. before loading the next page"""
+        self.driver.get_log('performance')
+        self.pending.clear()
+
+    def drain(self):
+        """Responses that finished loading since the last call"""
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            self.stats['log_entries'] += 1
+            text = entry['message']
+            # Most entries are Page/Runtime events; skip them without decoding the JSON
+            if '"Network.responseReceived"' not in text and '"Network.loading' not in text:
+                continue
+            message = json.loads(text)['message']
+            method, params = message['method'], message.get('params', {})
+            if method == 'Network.responseReceived':
+                response = params['response']
+                self.pending[params['requestId']] = CapturedResponse(
+                    params['requestId'], response['url'], response.get('status', 0),
+                    response.get('mimeType', ''), params.get('type', ''))
+            elif method == 'Network.loadingFinished':
+                response = self.pending.pop(params['requestId'], None)
+                if response is not None:
+                    finished.append(response)
+            elif method == 'Network.loadingFailed':
+                self.pending.pop(params['requestId'], None)
+        self.stats['responses'] += len(finished)
+        return finished
+
+    def body(self, response):
+        """Decoded body of a captured response; None once the browser has dropped it"""
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': response.request_id})
+        except Exception:
+            return None
+        body = result.get('body', '')
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        self.stats['bodies'] += 1
+        self.stats['body_bytes'] += len(body)
+        return body
+
+@lru_cache(maxsize=None)
+def compiled(selector):
+    return soupsieve.compile(selector)
+
+def element_text(element):
+    """Whitespace-collapsed text, close to what innerText gives for the same element"""
+    return ' '.join(element.get_text(' ').split())
+
+def read_fields_from_soup(scope, fields, base_url=''):
+    """Evaluate the selector map on parsed HTML the way EXTRACTION_SCRIPT does in the page"""
+    record = {}
+    for name, selector, what, default in fields:
+        if what == 'text[]':
+            record[name] = [element_text(el) for el in compiled(selector).select(scope)]
+            continue
+        element = compiled(selector).select_one(scope) if selector else scope
+        if element is None:
+            record[name] = default
+        elif what == 'text':
+            record[name] = element_text(element)
+        elif what == 'href':
+            # The DOM href property is absolute
+            record[name] = urljoin(base_url, element.get('href', ''))
+        else:
+            record[name] = element.get(what)
+    return record
+
+def parse_html(body):
+    return BeautifulSoup(body, resolve_parser())
+
+def is_json(mime_type, body):
+    return 'json' in (mime_type or '') or body.lstrip()[:1] in ('{', '[')
+
+def text_of(value):
+    """Voyager text fields are either strings or {'text': ...} view models"""
+    if isinstance(value, dict):
+        value = value.get('text')
+    return value.strip() if isinstance(value, str) else None
+
+def listed_date(entity):
+    for item in entity.get('footerItems') or ():
+        if item.get('type') == 'LISTED_DATE' and item.get('timeAt'):
+            return datetime.fromtimestamp(item['timeAt'] / 1000, timezone.utc).date().isoformat()
+    return NOT_SPECIFIED
+
+def decode_voyager_cards(data):
+    """Card records and the result total from a voyagerJobsDashJobCards response"""
+    paging = (data.get('data') or {}).get('paging') or data.get('paging') or {}
+    records = []
+    for entity in data.get('included') or ():
+        if not entity.get('$type', '').endswith('JobPostingCard'):
+            continue
+        match = VOYAGER_ID_RE.search(entity.get('jobPostingUrn') or entity.get('entityUrn') or '')
+        if not match:
+            continue
+        job_id = match.group(1)
+        records.append({
+            'job_id': job_id,
+            'title': entity.get('jobPostingTitle') or text_of(entity.get('title')),
+            'job_url': f"https://www.linkedin.com/jobs/view/{job_id}/",
+            'company': text_of(entity.get('primaryDescription')),
+            'location': text_of(entity.get('secondaryDescription')),
+            'posted_time': listed_date(entity),
+            'job_type': NOT_SPECIFIED,
+        })
+    return records, paging.get('total')
+
+def decode_listing(body, mime_type, card_selector, fields, base_url=''):
+    """(card records, result total or None) from a listing page, a guest card fragment or a Voyager response"""
+    if not body:
+        return [], None
+    if is_json(mime_type, body):
+        try:
+            return decode_voyager_cards(json.loads(body))
+        except ValueError:
+            return [], None
+    soup = parse_html(body)
+    return [read_fields_from_soup(card, fields, base_url) for card in compiled(card_selector).select(soup)], None
+
+def json_ld_posting(soup):
+    """The schema.org JobPosting embedded in a job page, if any"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                return item
+    return None
+
+def salary_text(posting):
+    salary = posting.get('baseSalary') or {}
+    value = salary.get('value') or {}
+    low, high = value.get('minValue'), value.get('maxValue')
+    if low is None:
+        return None
+    unit = (value.get('unitText') or '').lower()
+    amount = f"{low:,.0f}" + (f" - {high:,.0f}" if high is not None else '')
+    return f"{salary.get('currency', '')} {amount}{'/' + unit if unit else ''}".strip()
+
+def decode_detail(body, mime_type, fields):
+    """Detail fields from a job page, guest posting fragment or Voyager posting; None if it holds no description"""
+    if not body:
+        return None
+    defaults = {name: list(default) if isinstance(default, list) else default for name, _, _, default in fields}
+    if is_json(mime_type, body):
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        data = data.get('data', data)
+        description = text_of(data.get('description'))
+        if not description:
+            return None
+        details = dict(defaults, description=description)
+        details['employment_type'] = data.get('formattedEmploymentStatus') or defaults.get('employment_type')
+        return details
+
+    soup = parse_html(body)
+    details = read_fields_from_soup(soup, fields)
+    posting = json_ld_posting(soup)
+    if posting:
+        # Fill whatever the markup didn't have from the structured JobPosting
+        if details.get('description') == defaults.get('description') and posting.get('description'):
+            # LinkedIn HTML-escapes the markup inside the JSON-LD description
+            details['description'] = element_text(parse_html(html.unescape(posting['description'])))
+        if details.get('employment_type') == defaults.get('employment_type') and posting.get('employmentType'):
+            employment = posting['employmentType']
+            details['employment_type'] = ', '.join(employment) if isinstance(employment, list) else employment
+        if details.get('salary') == defaults.get('salary'):
+            details['salary'] = salary_text(posting) or details.get('salary')
+    if details.get('description') == defaults.get('description'):
+        return None
+    return details
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Readiness-driven waits for the Selenium scraper
+Polls a page condition with exponential back-off instead of sleeping a fixed time,
+and records how long each page spent waiting versus extracting
+"""
+
+import threading
+import time
+
+DEFAULT_TIMEOUTS = {
+    'listing': 10.0,   # job list container present after the first navigation
+    'scroll': 4.0,     # card count or page height grows after a scroll
+    'detail': 8.0,     # job description, or the top card of a page that has none, rendered
+    'detail_body': 1.5,  # description following a top card that rendered without one
+}
+
+class AdaptiveWaiter:
+    """Waits on named conditions with per-condition timeouts and a capped back-off"""
+
+    def __init__(self, timeouts=None, initial_poll=0.05, backoff=2.0, max_poll=0.8):
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.initial_poll = initial_poll
+        self.backoff = backoff
+        self.max_poll = max_poll
+        self.timings = []
+        self.lock = threading.Lock()
+
+    def wait_for(self, condition, predicate):
+        """Poll predicate until it is truthy or the condition's timeout elapses
+
+        Returns (result, seconds waited); result is the last predicate value,
+        so a falsy result means the condition timed out.
+        """
+        timeout = self.timeouts.get(condition, DEFAULT_TIMEOUTS['detail'])
+        start = time.perf_counter()
+        deadline = start + timeout
+        poll = self.initial_poll
+
+        while True:
+            result = predicate()
+            now = time.perf_counter()
+            if result or now >= deadline:
+                return result, now - start
+            time.sleep(min(poll, deadline - now))
+            poll = min(poll * self.backoff, self.max_poll)
+
+    def record(self, page, condition, wait_seconds, extract_seconds=0.0, ready=True):
+        """Record the time a page spent waiting for readiness and extracting data"""
+        with self.lock:
+            self.timings.append({
+                'page': page,
+                'condition': condition,
+                'wait_seconds': round(wait_seconds, 4),
+                'extract_seconds': round(extract_seconds, 4),
+                'ready': bool(ready),
+            })
+
+    def summary(self):
+        """Aggregate wait and extract time per condition"""
+        totals = {}
+        for timing in self.timings:
+            entry = totals.setdefault(timing['condition'], {
+                'pages': 0, 'timeouts': 0, 'wait_seconds': 0.0, 'extract_seconds': 0.0
+            })
+            entry['pages'] += 1
+            entry['timeouts'] += 0 if timing['ready'] else 1
+            entry['wait_seconds'] += timing['wait_seconds']
+            entry['extract_seconds'] += timing['extract_seconds']
+        return totals
+
+    def print_summary(self):
+        """Print time spent waiting versus extracting per condition"""
+        totals = self.summary()
+        if not totals:
+            return
+        print(f"\nPage timing (wait vs extract):")
+        for condition, entry in totals.items():
+            print(f"  {condition}: {entry['pages']} pages, "
+                  f"waited {entry['wait_seconds']:.2f}s, extracted {entry['extract_seconds']:.2f}s, "
+                  f"{entry['timeouts']} timeouts")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Record/replay of scraper traffic
+Record mode stores every response fetched by the scrapers (requests sessions, the async
+fetcher and pages loaded in Chrome) in a compressed zip archive; replay mode serves
+them back from a local HTTP server so runs and benchmarks never touch linkedin.com
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from http_cache import normalize_url
+
+INDEX_NAME = 'index.json'
+TEXT_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xhtml')
+
+class FixtureArchive:
+    """Zip of recorded responses keyed by normalized URL, written with DEFLATE"""
+
+    def __init__(self, path, mode='r'):
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        if mode == 'r':
+            self.zip = zipfile.ZipFile(path)
+            self.index = json.loads(self.zip.read(INDEX_NAME))
+        else:
+            self.zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9)
+            self.index = {}
+        self.by_path = {}
+        for key, entry in self.index.items():
+            self.by_path.setdefault(path_key(key), key)
+
+    def add(self, url, body, status=200, content_type='text/html; charset=utf-8', kind='http'):
+        """Store one response; a URL fetched twice keeps its latest body"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        key = normalize_url(url)
+        with self.lock:
+            version = self.index.get(key, {}).get('version', -1) + 1
+            name = f"bodies/{hashlib.sha1(key.encode('utf-8')).hexdigest()}.{version}"
+            self.zip.writestr(name, body)
+            self.index[key] = {'url': url, 'status': status, 'content_type': content_type, 'body': name,
+                               'kind': kind, 'version': version, 'recorded_at': time.time()}
+            self.by_path.setdefault(path_key(key), key)
+
+    def record_response(self, response, *args, **kwargs):
+        """requests response hook: store the final (decoded) response"""
+        self.add(response.url, response.content, response.status_code,
+                 response.headers.get('Content-Type', 'text/html; charset=utf-8'))
+        return response
+
+    def record_page(self, driver, url=None):
+        """Store the rendered DOM of the page a Selenium driver has loaded"""
+        self.add(url or driver.current_url, driver.page_source, kind='browser')
+
+    def lookup(self, url):
+        """(entry, body) for a URL, matching on path and query when the host differs; None if unrecorded"""
+        key = normalize_url(url)
+        entry = self.index.get(key) or self.index.get(self.by_path.get(path_key(key), ''))
+        if entry is None:
+            return None
+        with self.lock:
+            return entry, self.zip.read(entry['body'])
+
+    @property
+    def hosts(self):
+        return sorted({urlsplit(key).netloc for key in self.index})
+
+    def close(self):
+        with self.lock:
+            if self.mode != 'r':
+                self.zip.writestr(INDEX_NAME, json.dumps(self.index, indent=2))
+            self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def path_key(key):
+    parts = urlsplit(key)
+    return parts.path + ('?' + parts.query if parts.query else '')
+
+class ReplayServer:
+    """Local HTTP server answering from a FixtureArchive
+
+    Recorded hosts are served under /<host>/..., and absolute links to them inside text
+    bodies are rewritten to this server, so listing pages lead to replayed detail pages.
+    """
+
+    def __init__(self, archive, host='127.0.0.1', port=0):
+        self.archive = archive
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                found = server.archive.lookup(server.original_url(self.path))
+                if found is None:
+                    status, content_type, body = 404, 'text/plain', b'not recorded'
+                else:
+                    entry, body = found
+                    status, content_type = entry['status'], entry['content_type']
+                    if content_type.startswith(TEXT_TYPES):
+                        body = server.rewrite(body.decode('utf-8', errors='replace')).encode('utf-8')
+                with server.lock:
+                    if found is None:
+                        server.misses += 1
+                    else:
+                        server.hits += 1
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), RequestHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, url):
+        """Replay-server address of a recorded URL (also works on URL templates)"""
+        for host in self.archive.hosts:
+            for scheme in ('https://', 'http://'):
+                if url.startswith(scheme + host):
+                    return f"{self.base_url}/{host}{url[len(scheme + host):]}"
+        return url
+
+    def rewrite(self, text):
+        for host in self.archive.hosts:
+            for scheme in ('https://', 'http://'):
+                text = text.replace(scheme + host, f"{self.base_url}/{host}")
+        return text
+
+    def original_url(self, path):
+        """Recorded URL for a request path: /<host>/rest, or a bare path on the first recorded host"""
+        head, _, rest = path.lstrip('/').partition('/')
+        if head in self.archive.hosts:
+            return f"https://{head}/{rest}"
+        hosts = self.archive.hosts
+        return f"https://{hosts[0] if hosts else 'localhost'}{path}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a recorded fixture archive on localhost")
+    parser.add_argument("archive", help="archive written by a scraper's --record option")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with FixtureArchive(args.archive) as archive:
+        server = ReplayServer(archive, port=args.port)
+        print(f"Replaying {len(archive.index)} responses from {args.archive} on {server.base_url}")
+        for host in archive.hosts:
+            print(f"  {host} -> {server.base_url}/{host}/")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
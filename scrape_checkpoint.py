@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for resumable scrapes
+Records the listing snapshot once and then one record per finished job detail, so an
+interrupted run can be resumed from the first unfinished job
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from job_record import json_default
+from job_sink import read_jsonl
+
+class CheckpointJournal:
+    """Append-only JSONL journal of a scrape in progress"""
+
+    def __init__(self, path="mrp_jobs.checkpoint.jsonl", fsync=True):
+        self.path = path
+        self.fsync = fsync
+        self.lock = threading.Lock()
+        self.file = None
+
+    def start(self, source, jobs_data, detail_indices, removed=()):
+        """Begin a new journal with the listing snapshot, replacing any previous one"""
+        self.close()
+        self.file = open(self.path, 'w', encoding='utf-8')
+        self.append({
+            'type': 'listing',
+            'source': source,
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'jobs': jobs_data,
+            'detail_indices': list(detail_indices),
+            'removed': list(removed),
+        })
+
+    def reopen(self):
+        """Continue appending to an existing journal after a resume"""
+        self.close()
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def complete(self, index, job):
+        """Record that job `index` has its details; safe to call from worker threads"""
+        self.append({'type': 'job', 'index': index, 'job': job})
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=json_default) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+
+    def load(self):
+        """Return (listing snapshot, {index: finished job}), or None when there is nothing to resume"""
+        if not os.path.exists(self.path):
+            return None
+        listing = None
+        completed = {}
+        for record in read_jsonl(self.path):
+            if record.get('type') == 'listing':
+                listing = record
+                completed = {}
+            elif record.get('type') == 'job' and listing is not None:
+                completed[record['index']] = record['job']
+        return (listing, completed) if listing else None
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def discard(self):
+        """Remove the journal once the run has finished cleanly"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Lightweight instrumentation for the scrapers
+Timing spans, counters and latency histograms (p50/p95/p99) around the hot paths,
+exported as a JSON report or Prometheus text. Disabled by default: a span is then a
+shared no-op context manager, so instrumented code pays one attribute check
+"""
+
+import json
+import math
+import os
+import threading
+import time
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+class NullSpan:
+    """Span used while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = NullSpan()
+
+class Span:
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+        if exc_type is not None:
+            self.registry.count(self.name + '.errors')
+        return False
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class MetricsRegistry:
+    """Thread-safe spans, counters and histograms keyed by dotted names like 'selenium.driver_get'"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+    def span(self, name):
+        """Context manager timing a block into the histogram called name"""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name)
+
+    def timed(self, name):
+        """Decorator form of span()"""
+        def decorate(function):
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with Span(self, name):
+                    return function(*args, **kwargs)
+            wrapper.__name__ = function.__name__
+            wrapper.__doc__ = function.__doc__
+            return wrapper
+        return decorate
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.histograms.setdefault(name, []).append(value)
+
+    def reset(self):
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+            self.started = time.time()
+
+    def report(self):
+        """Counters plus count/sum/min/max and quantiles for every histogram"""
+        with self.lock:
+            counters = dict(self.counters)
+            histograms = {name: sorted(values) for name, values in self.histograms.items()}
+        spans = {}
+        for name, values in sorted(histograms.items()):
+            entry = {'count': len(values), 'sum': sum(values), 'min': values[0], 'max': values[-1]}
+            for q in QUANTILES:
+                entry[f"p{int(q * 100)}"] = percentile(values, q)
+            spans[name] = entry
+        return {'started_at': self.started, 'counters': dict(sorted(counters.items())), 'spans': spans}
+
+    def prometheus_text(self, prefix='mrp_scrape'):
+        """Prometheus exposition format: spans as a summary with quantiles, counters as _total"""
+        report = self.report()
+        lines = []
+        if report['spans']:
+            metric = f"{prefix}_span_seconds"
+            lines.append(f"# HELP {metric} Time spent in instrumented scraper spans")
+            lines.append(f"# TYPE {metric} summary")
+            for name, entry in report['spans'].items():
+                for q in QUANTILES:
+                    lines.append(f'{metric}{{span="{name}",quantile="{q}"}} {entry[f"p{int(q * 100)}"]:.9f}')
+                lines.append(f'{metric}_sum{{span="{name}"}} {entry["sum"]:.9f}')
+                lines.append(f'{metric}_count{{span="{name}"}} {entry["count"]}')
+        for name, value in report['counters'].items():
+            metric = f"{prefix}_{prometheus_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        write_atomic(path, json.dumps(self.report(), indent=2))
+
+    def write_prometheus(self, path):
+        write_atomic(path, self.prometheus_text())
+
+    def print_report(self):
+        """Per-stage timing table, slowest total first"""
+        report = self.report()
+        if not report['spans'] and not report['counters']:
+            return
+        print(f"\n=== STAGE TIMINGS ===")
+        print(f"{'span':<28} {'count':>7} {'total s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for name, entry in sorted(report['spans'].items(), key=lambda item: -item[1]['sum']):
+            print(f"{name:<28} {entry['count']:>7} {entry['sum']:>9.3f} {entry['p50'] * 1000:>8.2f} "
+                  f"{entry['p95'] * 1000:>8.2f} {entry['p99'] * 1000:>8.2f}")
+        for name, value in report['counters'].items():
+            print(f"{name:<28} {value:>7}")
+
+def prometheus_name(name):
+    return ''.join(c if c.isalnum() else '_' for c in name)
+
+def write_atomic(path, text):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+# Process-wide registry used by the scrapers; enabled by --metrics / --metrics-prom
+METRICS = MetricsRegistry(enabled=os.environ.get('MRP_METRICS') == '1')
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--metrics", metavar="JSON", help="write span timings and counters to a JSON report")
+    parser.add_argument("--metrics-prom", metavar="FILE", help="write span timings and counters in Prometheus text format")
+
+def configure_metrics(args):
+    """Turn the registry on when a metrics output was requested"""
+    if args.metrics or args.metrics_prom:
+        METRICS.enabled = True
+    return METRICS
+
+def export_metrics(args):
+    """Print the stage table and write whichever exports were requested"""
+    if not METRICS.enabled:
+        return
+    METRICS.print_report()
+    if args.metrics:
+        METRICS.write_json(args.metrics)
+        print(f"Metrics report saved to {args.metrics}")
+    if args.metrics_prom:
+        METRICS.write_prometheus(args.metrics_prom)
+        print(f"Prometheus metrics saved to {args.metrics_prom}")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Build-time search index for the careers site
+Turns the exported jobs into a compact artifact: an inverted index over title,
+description_md and requirements_md with precomputed BM25 weights, plus one posting
+bitset per facet value (department, location, type, remote), so the site filters and
+searches with set intersections instead of scanning every job
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import time
+import unicodedata
+
+import numpy as np
+
+INDEX_VERSION = 1
+SEARCH_INDEX_NAME = 'search-index.json'
+
+# Field boosts for BM25F-style weighting: a title hit counts three body hits
+FIELD_WEIGHTS = {'title': 3.0, 'description_md': 1.0, 'requirements_md': 1.0}
+FACETS = ('department', 'location', 'type', 'remote')
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Shipped inside the artifact so the site tokenizes queries exactly like the build did
+STOPWORDS = sorted({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'our', 'that', 'the', 'this', 'to', 'we', 'will', 'with', 'you', 'your',
+})
+STOPWORD_SET = frozenset(STOPWORDS)
+TOKEN_RE = re.compile(r'[a-z0-9]{2,}')
+PREFIX_EXPANSIONS = 20
+
+def tokenize(text):
+    """Lowercase ASCII word tokens without accents, stopwords or single characters"""
+    if not text:
+        return []
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORD_SET]
+
+def facet_value(job, facet):
+    value = job.get(facet)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value) if value not in (None, '') else None
+
+def encode_varints(values):
+    """LEB128-encode an array of non-negative integers in one vectorized pass"""
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for shift in (7, 14, 21, 28, 35):
+        nbytes += values >= (1 << shift)
+    ends = np.cumsum(nbytes)
+    starts = ends - nbytes
+    out = np.zeros(int(ends[-1]) if len(values) else 0, dtype=np.uint8)
+    for level in range(int(nbytes.max()) if len(values) else 0):
+        has = nbytes > level
+        chunk = (values[has] >> np.uint64(7 * level)) & np.uint64(0x7f)
+        more = (nbytes[has] > level + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[has] + level] = (chunk | more).astype(np.uint8)
+    return out, ends
+
+def decode_varints(data):
+    """Inverse of encode_varints for a single byte string"""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros(0, dtype=np.int64)
+    last = (raw & 0x80) == 0
+    group = np.concatenate(([0], np.cumsum(last[:-1])))
+    first = np.flatnonzero(np.concatenate(([True], last[:-1])))
+    position = np.arange(len(raw)) - first[group]
+    parts = (raw & 0x7f).astype(np.int64) << (7 * position)
+    return np.bincount(group, weights=parts, minlength=int(group[-1]) + 1).astype(np.int64)
+
+def b64(data):
+    return base64.b64encode(bytes(data)).decode('ascii')
+
+def build_index(jobs):
+    """The search artifact (a JSON-serializable dict) for a list of site-schema jobs"""
+    count = len(jobs)
+    fields = list(FIELD_WEIGHTS.items())
+    vocabulary = {}
+    tokens, field_lengths = [], np.zeros((count, len(fields)), dtype=np.int64)
+    for doc, job in enumerate(jobs):
+        for column, (field, _) in enumerate(fields):
+            field_tokens = tokenize(job.get(field))
+            field_lengths[doc, column] = len(field_tokens)
+            tokens.extend([vocabulary.setdefault(token, len(vocabulary)) for token in field_tokens])
+
+    # Every token occurrence as (doc, term, field boost), summed per (term, doc) in one pass
+    boosts = np.array([boost for _, boost in fields], dtype=np.float64)
+    occurrence_docs = np.repeat(np.repeat(np.arange(count), len(fields)), field_lengths.ravel())
+    occurrence_boosts = np.repeat(np.tile(boosts, count), field_lengths.ravel())
+    terms = sorted(vocabulary)
+    # Renumber terms alphabetically so the site can binary-search them for prefixes
+    rank = np.empty(len(vocabulary), dtype=np.int64)
+    rank[[vocabulary[term] for term in terms]] = np.arange(len(terms))
+    keys = rank[np.asarray(tokens, dtype=np.int64)] * max(count, 1) + occurrence_docs
+    keys, inverse = np.unique(keys, return_inverse=True)
+    frequencies = np.bincount(inverse, weights=occurrence_boosts, minlength=len(keys))
+    term_ids, doc_ids = np.divmod(keys, max(count, 1))
+    lengths = field_lengths @ boosts
+
+    df = np.bincount(term_ids, minlength=len(terms))
+    avgdl = float(lengths.mean()) if count and lengths.mean() else 1.0
+    idf = np.log1p((count - df + 0.5) / (df + 0.5))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_ids] / avgdl)
+    scores = idf[term_ids] * frequencies * (BM25_K1 + 1) / (frequencies + norm)
+    # One byte per posting: quantize against the largest weight and keep every hit nonzero
+    scale = float(scores.max()) / 255 if len(scores) else 1.0
+    weights = np.clip(np.rint(scores / scale), 1, 255).astype(np.uint8) if len(scores) else scores
+
+    bounds = np.concatenate(([0], np.cumsum(df)))
+    deltas = doc_ids.copy()
+    if len(deltas):
+        deltas[1:] -= doc_ids[:-1]
+        deltas[bounds[:-1][df > 0]] = doc_ids[bounds[:-1][df > 0]]
+    encoded, ends = encode_varints(deltas)
+    byte_bounds = np.concatenate(([0], ends))[bounds]
+    postings = [b64(encoded[byte_bounds[i]:byte_bounds[i + 1]]) for i in range(len(terms))]
+    term_weights = [b64(weights[bounds[i]:bounds[i + 1]]) for i in range(len(terms))]
+
+    facets = {}
+    for facet in FACETS:
+        members = {}
+        for doc, job in enumerate(jobs):
+            value = facet_value(job, facet)
+            if value is not None:
+                members.setdefault(value, []).append(doc)
+        facets[facet] = {}
+        for value in sorted(members):
+            bits = np.zeros(count, dtype=bool)
+            bits[members[value]] = True
+            facets[facet][value] = b64(np.packbits(bits, bitorder='little'))
+
+    return {
+        'version': INDEX_VERSION,
+        'count': count,
+        'ids': [job.get('id') or str(doc) for doc, job in enumerate(jobs)],
+        'fields': FIELD_WEIGHTS,
+        'bm25': {'k1': BM25_K1, 'b': BM25_B, 'avgdl': round(avgdl, 4)},
+        'scale': scale,
+        'stopwords': STOPWORDS,
+        'terms': terms,
+        'postings': postings,
+        'weights': term_weights,
+        'facets': facets,
+    }
+
+def write_search_index(path, jobs):
+    """Build the index for jobs and write it atomically next to the jobs file; returns the artifact"""
+    from job_normalize import normalize_job
+    jobs = [job if 'description_md' in job else normalize_job(job) for job in jobs]
+    index = build_index(jobs)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return index
+
+def default_index_path(jobs_path):
+    return os.path.join(os.path.dirname(jobs_path) or '.', SEARCH_INDEX_NAME)
+
+class SearchIndex:
+    """Query side of the artifact: the same algorithm src/searchIndex.ts runs in the browser"""
+
+    def __init__(self, artifact):
+        self.artifact = artifact
+        self.count = artifact['count']
+        self.ids = artifact['ids']
+        self.terms = artifact['terms']
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.scale = artifact['scale']
+        self.decoded = {}
+        self.facets = {facet: {value: np.frombuffer(base64.b64decode(bits), dtype=np.uint8)
+                               for value, bits in values.items()}
+                       for facet, values in artifact['facets'].items()}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def postings(self, term_id):
+        """(doc ids, BM25 weights) for a term, decoded on first use"""
+        entry = self.decoded.get(term_id)
+        if entry is None:
+            docs = np.cumsum(decode_varints(base64.b64decode(self.artifact['postings'][term_id])))
+            weights = np.frombuffer(base64.b64decode(self.artifact['weights'][term_id]), dtype=np.uint8)
+            entry = self.decoded[term_id] = (docs, weights.astype(np.float32) * self.scale)
+        return entry
+
+    def expand(self, token, prefix):
+        """Term ids for a query token; the last token also matches as a prefix while typing"""
+        if not prefix:
+            term = self.term_ids.get(token)
+            return [term] if term is not None else []
+        start = np.searchsorted(self.terms, token)
+        matches = []
+        for i in range(start, min(len(self.terms), start + PREFIX_EXPANSIONS)):
+            if not self.terms[i].startswith(token):
+                break
+            matches.append(i)
+        return matches
+
+    def filter_mask(self, filters):
+        """Packed bitset of the docs matching every facet filter; None when nothing is filtered"""
+        mask = None
+        for facet, value in (filters or {}).items():
+            if value in (None, '', 'All'):
+                continue
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+            bits = self.facets.get(facet, {}).get(str(value))
+            if bits is None:
+                return np.zeros((self.count + 7) // 8, dtype=np.uint8)
+            mask = bits if mask is None else mask & bits
+        return mask
+
+    def search(self, query='', filters=None, limit=None):
+        """Job ids matching the filters, ranked by BM25 when there is a query, else in export order"""
+        mask = self.filter_mask(filters)
+        tokens = tokenize(query)
+        if not tokens:
+            if mask is None:
+                docs = np.arange(self.count)
+            else:
+                docs = np.flatnonzero(np.unpackbits(mask, count=self.count, bitorder='little'))
+            docs = docs[:limit] if limit else docs
+            return [self.ids[doc] for doc in docs]
+
+        scores = np.zeros(self.count, dtype=np.float32)
+        # A trailing space means the last word is finished; otherwise it may still be being typed
+        prefix_last = query == query.rstrip()
+        for position, token in enumerate(tokens):
+            for term in self.expand(token, prefix_last and position == len(tokens) - 1):
+                docs, weights = self.postings(term)
+                scores[docs] += weights
+        if mask is not None:
+            scores *= np.unpackbits(mask, count=self.count, bitorder='little')
+        hits = np.flatnonzero(scores)
+        if limit and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        # Highest score first; ties keep export order
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [self.ids[doc] for doc in hits]
+
+def main():
+    """Build a search index for a jobs.json, or query one"""
+    parser = argparse.ArgumentParser(description="Build or query the careers site search index")
+    parser.add_argument("jobs", nargs="?", default="src/data/jobs.json", help="site-schema jobs JSON array")
+    parser.add_argument("--output", help=f"index path (default: {SEARCH_INDEX_NAME} next to the jobs file)")
+    parser.add_argument("--query", help="search the index instead of building it")
+    for facet in FACETS:
+        parser.add_argument(f"--{facet}", help=f"filter by {facet} when querying")
+    args = parser.parse_args()
+    output = args.output or default_index_path(args.jobs)
+
+    if args.query is not None:
+        index = SearchIndex.load(output)
+        start = time.perf_counter()
+        ids = index.search(args.query, {facet: getattr(args, facet) for facet in FACETS})
+        print(f"{len(ids)} matches in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for job_id in ids[:20]:
+            print(f"  {job_id}")
+        return
+
+    with open(args.jobs, encoding='utf-8') as f:
+        jobs = json.load(f)
+    start = time.perf_counter()
+    index = write_search_index(output, jobs)
+    print(f"✅ Indexed {index['count']} jobs ({len(index['terms'])} terms) into {output} "
+          f"in {time.perf_counter() - start:.3f}s ({os.path.getsize(output):,} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -6,33 +6,206 @@ Alternative approach using requests and BeautifulSoup
 
 import requests
 from bs4 import BeautifulSoup
-import json
 import time
-import pandas as pd
 import re
+import os
+import argparse
+import asyncio
+import importlib.util
+from functools import lru_cache
+import soupsieve
+from bs4 import Tag
 from urllib.parse import urljoin, urlparse
+from async_fetch import GUEST_DETAIL_URL, GUEST_LISTING_URL, AsyncJobFetcher
+from fetch_policy import FetchPolicy, RetryPolicy
+from http_cache import ConditionalCacheAdapter, ResponseCache
+from job_record import JobRecord
+from job_state import COMPANY_JOBS_URL, company_id_from_text, job_id_from_text
+from keyword_matcher import KeywordMatcher
+from replay_archive import FixtureArchive, ReplayServer
+from job_sink import StreamingJobSink, write_csv, write_json_array
+from scrape_metrics import METRICS, add_metrics_arguments, configure_metrics, export_metrics
+
+# Titles looked for in the page text when no job cards are found
+DEFAULT_JOB_TITLES = [
+    'Ecommerce Specialist',
+    'Supply Chain Manager',
+    'Director of Sales and Operations',
+    'Depot Service and Sales Operations Manager',
+    'Ecommerce Manager',
+    'Clinical Trainer',
+    'Field Training Team'
+]
+
+CSV_COLUMNS = [
+    'job_id', 'title', 'company', 'location', 'posted_time', 'job_url',
+    'description', 'requirements', 'employment_type', 'source', 'context'
+]
+
+# Card selectors, tried in order until one matches
+JOB_SELECTORS = [
+    '.jobs-search-results__list-item',
+    '.job-search-card',
+    '.jobs-unified-top-card',
+    '[data-job-id]',
+    '.job-card-container'
+]
+
+# Per-field selector cascades for a job card; earlier selectors win
+CARD_FIELD_CASCADES = {
+    'title': [
+        '.job-search-card__title',
+        '.jobs-unified-top-card__job-title',
+        'h3 a',
+        '.job-title',
+        'a[data-control-name="job_card_click"]'
+    ],
+    'company': [
+        '.job-search-card__subtitle-link',
+        '.jobs-unified-top-card__company-name',
+        '.job-card-container__company-name',
+        '.company-name'
+    ],
+    'location': [
+        '.job-search-card__location',
+        '.jobs-unified-top-card__bullet',
+        '.job-card-container__metadata-item',
+        '.location'
+    ],
+    'posted_time': [
+        'time',
+        '.job-search-card__listdate',
+        '.jobs-unified-top-card__posted-date'
+    ],
+    'job_link': ['a[href*="/jobs/view/"]'],
+    'id_holder': ['[data-job-id], [data-entity-urn]'],
+}
+
+def resolve_parser(parser=None):
+    """BeautifulSoup tree builder to use: lxml when installed, else the pure-Python html.parser"""
+    if parser in (None, 'lxml'):
+        if importlib.util.find_spec('lxml') is not None:
+            return 'lxml'
+        if parser == 'lxml':
+            print("lxml is not installed; falling back to html.parser")
+    return parser if parser not in (None, 'lxml') else 'html.parser'
+
+@lru_cache(maxsize=None)
+def compiled_selectors(selectors):
+    """Compile a selector list once per process; returns (selector, compiled) pairs"""
+    return [(selector, soupsieve.compile(selector)) for selector in selectors]
+
+def element_matcher(selector, compiled):
+    """Predicate for one selector: plain class and tag selectors skip soupsieve entirely"""
+    if re.fullmatch(r'\.[\w-]+', selector):
+        class_name = selector[1:]
+        return lambda element: class_name in element.get('class', ())
+    if re.fullmatch(r'[a-z][a-z0-9]*', selector):
+        return lambda element: element.name == selector
+    return compiled.match
+
+@lru_cache(maxsize=None)
+def compiled_cascades():
+    """Card field cascades compiled once, flattened to (field, priority, matcher) triples"""
+    return [(field, priority, element_matcher(selector, compiled))
+            for field, selectors in CARD_FIELD_CASCADES.items()
+            for priority, (selector, compiled) in enumerate(compiled_selectors(tuple(selectors)))]
+
+def match_card_fields(job_element):
+    """Resolve every field cascade in one walk over the card's descendants
+
+    Gives the same element select_one would for the first matching selector of
+    each cascade: the highest-priority selector wins, and within a selector the
+    first element in document order.
+    """
+    cascades = compiled_cascades()
+    best = {}
+    remaining = len(CARD_FIELD_CASCADES)
+    for element in job_element.descendants:
+        if not isinstance(element, Tag):
+            continue
+        for field, priority, matches in cascades:
+            current = best.get(field)
+            if current is not None and current[0] <= priority:
+                continue
+            if matches(element):
+                best[field] = (priority, element)
+                if priority == 0:
+                    remaining -= 1
+        if not remaining:
+            break
+    return {field: element for field, (_, element) in best.items()}
+
+def parse_job_id(job_element, job_url='', id_holder=None):
+    """Job ID from a card's data-job-id / data-entity-urn attributes or its job URL"""
+    for elem in (job_element, id_holder):
+        if elem is None:
+            continue
+        if elem.get('data-job-id'):
+            return elem['data-job-id']
+        job_id = job_id_from_text(elem.get('data-entity-urn', ''))
+        if job_id:
+            return job_id
+    return job_id_from_text(job_url)
 
 class SimpleLinkedInScraper:
-    def __init__(self):
-        self.base_url = "https://www.linkedin.com/company/poweredbymrp/jobs/"
+    def __init__(self, cache_dir=None, parser=None, titles_file=None, sink=None, company="poweredbymrp",
+                 session=None, recorder=None, policy=None):
+        self.company = company
+        self.base_url = COMPANY_JOBS_URL.format(slug=company)
         self.jobs_data = []
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.sink = sink
+        self.parser = resolve_parser(parser)
+        self.titles_file = titles_file
+        self.matcher_cache_dir = os.path.join(cache_dir, 'matchers') if cache_dir else None
+        self._title_matcher = None
+        self.session = session or self.create_session()
+        # Retries, per-host circuit breaking and login-wall detection, shared with the async fetcher
+        self.policy = policy or FetchPolicy()
+        self.recorder = recorder
+        if recorder:
+            self.session.hooks['response'].append(recorder.record_response)
+        
+        # Revalidate repeat fetches with If-None-Match / If-Modified-Since
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        if self.cache:
+            self.attach_cache(self.session, self.cache)
+    
+    @staticmethod
+    def create_session():
+        """requests session with browser-like headers; reusable across companies"""
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         })
+        return session
+    
+    @staticmethod
+    def attach_cache(session, cache):
+        """Route the session through a cache, keeping its existing connection pool when already mounted"""
+        adapter = session.get_adapter('https://')
+        if isinstance(adapter, ConditionalCacheAdapter):
+            adapter.cache = cache
+            return
+        adapter = ConditionalCacheAdapter(cache)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
     
     def scrape_jobs(self):
         """Main method to scrape job listings"""
         try:
             print("Fetching LinkedIn jobs page...")
-            response = self.session.get(self.base_url)
+            with METRICS.span('simple.fetch'):
+                response = self.policy.get(self.session, self.base_url)
+            METRICS.count('simple.responses')
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                with METRICS.span('simple.parse'):
+                    soup = BeautifulSoup(response.content, self.parser)
                 self.extract_jobs_from_html(soup)
             else:
                 print(f"Failed to fetch page. Status code: {response.status_code}")
@@ -44,22 +217,7 @@ class SimpleLinkedInScraper:
         """Extract job information from HTML content"""
         print("Extracting job information from HTML...")
         
-        # Look for job listings in various possible selectors
-        job_selectors = [
-            '.jobs-search-results__list-item',
-            '.job-search-card',
-            '.jobs-unified-top-card',
-            '[data-job-id]',
-            '.job-card-container'
-        ]
-        
-        jobs_found = []
-        for selector in job_selectors:
-            jobs = soup.select(selector)
-            if jobs:
-                print(f"Found {len(jobs)} jobs using selector: {selector}")
-                jobs_found.extend(jobs)
-                break
+        jobs_found = self.find_job_elements(soup)
         
         if not jobs_found:
             # Try to find any job-related content
@@ -69,120 +227,183 @@ class SimpleLinkedInScraper:
         
         for job_element in jobs_found:
             try:
-                job_data = self.extract_job_data(job_element)
+                with METRICS.span('simple.extract_job_data'):
+                    job_data = self.extract_job_data(job_element)
                 if job_data:
-                    self.jobs_data.append(job_data)
+                    self.add_job(job_data)
             except Exception as e:
                 print(f"Error extracting job data: {e}")
+                METRICS.count('simple.extract_errors')
                 continue
     
+    def find_job_elements(self, soup):
+        """Return the job card elements using the first selector that matches"""
+        # Look for job listings in various possible selectors
+        for selector, compiled in compiled_selectors(tuple(JOB_SELECTORS)):
+            with METRICS.span('simple.select_cards'):
+                jobs = compiled.select(soup)
+            if jobs:
+                print(f"Found {len(jobs)} jobs using selector: {selector}")
+                return jobs
+        return []
+    
     def extract_job_data(self, job_element):
         """Extract data from a single job element"""
-        job_data = {}
+        job_data = JobRecord()
+        matches = match_card_fields(job_element)
         
         # Job title
-        title_selectors = [
-            '.job-search-card__title',
-            '.jobs-unified-top-card__job-title',
-            'h3 a',
-            '.job-title',
-            'a[data-control-name="job_card_click"]'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = job_element.select_one(selector)
-            if title_elem:
-                job_data['title'] = title_elem.get_text(strip=True)
-                if title_elem.name == 'a':
-                    job_data['job_url'] = title_elem.get('href', '')
-                break
+        title_elem = matches.get('title')
+        if title_elem is not None:
+            job_data['title'] = title_elem.get_text(strip=True)
+            if title_elem.name == 'a':
+                job_data['job_url'] = title_elem.get('href', '')
         
         # Company name
-        company_selectors = [
-            '.job-search-card__subtitle-link',
-            '.jobs-unified-top-card__company-name',
-            '.job-card-container__company-name',
-            '.company-name'
-        ]
-        
-        for selector in company_selectors:
-            company_elem = job_element.select_one(selector)
-            if company_elem:
-                job_data['company'] = company_elem.get_text(strip=True)
-                break
+        if matches.get('company') is not None:
+            job_data['company'] = matches['company'].get_text(strip=True)
         
         # Location
-        location_selectors = [
-            '.job-search-card__location',
-            '.jobs-unified-top-card__bullet',
-            '.job-card-container__metadata-item',
-            '.location'
-        ]
-        
-        for selector in location_selectors:
-            location_elem = job_element.select_one(selector)
-            if location_elem:
-                job_data['location'] = location_elem.get_text(strip=True)
-                break
+        if matches.get('location') is not None:
+            job_data['location'] = matches['location'].get_text(strip=True)
         
         # Posted time
-        time_selectors = [
-            'time',
-            '.job-search-card__listdate',
-            '.jobs-unified-top-card__posted-date'
+        time_elem = matches.get('posted_time')
+        if time_elem is not None:
+            job_data['posted_time'] = time_elem.get('datetime', time_elem.get_text(strip=True))
+        
+        # Job URL when the title itself isn't a link (guest API cards)
+        if 'job_url' not in job_data and matches.get('job_link') is not None:
+            job_data['job_url'] = matches['job_link'].get('href', '')
+        
+        if job_data:
+            job_id = parse_job_id(job_element, job_data.get('job_url', ''), matches.get('id_holder'))
+            if job_id:
+                job_data['job_id'] = job_id
+        
+        return job_data if job_data else None
+    
+    def extract_job_detail_data(self, soup, job_data):
+        """Fill a job dict from a job detail page"""
+        description_selectors = [
+            '.show-more-less-html__markup',
+            '.description__text',
+            '.jobs-description-content__text'
         ]
         
-        for selector in time_selectors:
-            time_elem = job_element.select_one(selector)
-            if time_elem:
-                job_data['posted_time'] = time_elem.get('datetime', time_elem.get_text(strip=True))
+        for selector in description_selectors:
+            desc_elem = soup.select_one(selector)
+            if desc_elem:
+                job_data['description'] = desc_elem.get_text(' ', strip=True)
+                job_data['requirements'] = [li.get_text(strip=True) for li in desc_elem.select('li')]
                 break
         
-        return job_data if job_data else None
+        # Guest pages list seniority, employment type, function and industry as criteria
+        for item in soup.select('.description__job-criteria-item'):
+            label = item.select_one('.description__job-criteria-subheader')
+            value = item.select_one('.description__job-criteria-text')
+            if label and value and 'employment type' in label.get_text(strip=True).lower():
+                job_data['employment_type'] = value.get_text(strip=True)
+        
+        if 'employment_type' not in job_data:
+            emp_elem = soup.select_one('.jobs-unified-top-card__job-insight--employment-type')
+            if emp_elem:
+                job_data['employment_type'] = emp_elem.get_text(strip=True)
+        
+        return job_data
+    
+    def resolve_company_id(self):
+        """The company's numeric LinkedIn ID, read from its jobs page; None if the page doesn't show it"""
+        try:
+            response = self.policy.get(self.session, self.base_url)
+        except Exception as e:
+            print(f"Error fetching {self.base_url}: {e}")
+            return None
+        return company_id_from_text(response.text) if response.status_code == 200 else None
+    
+    def scrape_jobs_async(self, company_id=None, **fetcher_options):
+        """Walk every guest listing page and job detail page of this company concurrently"""
+        company_id = company_id or self.resolve_company_id()
+        if company_id:
+            fetcher_options['company_id'] = company_id
+        else:
+            # The keyword search isn't limited to one company, but the slug's words are the closest match
+            fetcher_options['keywords'] = ' '.join(self.company.split('-'))
+            print(f"⚠️  No LinkedIn company ID found on {self.base_url}; searching for "
+                  f"'{fetcher_options['keywords']}', which can return other companies' jobs")
+        print("Fetching LinkedIn guest job listings concurrently...")
+        fetcher = AsyncJobFetcher(headers=self.session.headers, cache=self.cache, recorder=self.recorder,
+                                  policy=self.policy, **fetcher_options)
+        
+        def parse_listing(html):
+            with METRICS.span('simple.parse'):
+                soup = BeautifulSoup(html, self.parser)
+            with METRICS.span('simple.extract_listing'):
+                return [job for job in map(self.extract_job_data, self.find_job_elements(soup)) if job]
+        
+        def parse_detail(html, job_data):
+            with METRICS.span('simple.parse'):
+                soup = BeautifulSoup(html, self.parser)
+            with METRICS.span('simple.extract_detail'):
+                self.extract_job_detail_data(soup, job_data)
+        
+        try:
+            asyncio.run(fetcher.crawl(parse_listing, parse_detail, on_job=self.add_job))
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+        fetcher.stats.print_report()
+        return fetcher.stats.report()
     
     def extract_from_general_content(self, soup):
         """Extract job information from general page content when specific selectors fail"""
         print("Extracting from general content...")
         
         # Look for any text that might indicate job postings
-        page_text = soup.get_text()
-        
-        # Search for job-related keywords
-        job_keywords = [
-            'Ecommerce Specialist',
-            'Supply Chain Manager', 
-            'Director of Sales and Operations',
-            'Depot Service and Sales Operations Manager',
-            'Ecommerce Manager',
-            'Clinical Trainer',
-            'Field Training Team'
-        ]
+        with METRICS.span('simple.general_content'):
+            page_text = soup.get_text()
+            matches = self.title_matcher.first_matches(page_text)
         
+        # Scan the text once for every known job title
         found_jobs = []
-        for keyword in job_keywords:
-            if keyword.lower() in page_text.lower():
-                found_jobs.append({
-                    'title': keyword,
-                    'company': 'Powered By MRP',
-                    'location': 'Park City, Utah',
-                    'posted_time': 'Recent',
-                    'source': 'extracted_from_content'
-                })
-        
-        self.jobs_data.extend(found_jobs)
+        for title, (start, end) in matches.items():
+            found_jobs.append(JobRecord({
+                'title': title,
+                'company': 'Powered By MRP',
+                'location': 'Park City, Utah',
+                'posted_time': 'Recent',
+                'source': 'extracted_from_content',
+                'context': KeywordMatcher.snippet(page_text, start, end)
+            }))
+        
+        for job_data in found_jobs:
+            self.add_job(job_data)
         print(f"Found {len(found_jobs)} jobs from content analysis")
     
+    def add_job(self, job_data):
+        """Keep a finished job and stream it to the output sink, if one is attached"""
+        self.jobs_data.append(job_data)
+        if self.sink:
+            self.sink.write(job_data)
+    
+    @property
+    def title_matcher(self):
+        """Automaton over the job titles, built on first use and cached on disk between runs"""
+        if self._title_matcher is None:
+            if self.titles_file:
+                self._title_matcher = KeywordMatcher.from_file(self.titles_file, self.matcher_cache_dir)
+            else:
+                self._title_matcher = KeywordMatcher.cached(DEFAULT_JOB_TITLES, self.matcher_cache_dir)
+        return self._title_matcher
+    
     def save_to_json(self, filename="mrp_jobs_simple.json"):
         """Save scraped data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.jobs_data, f, indent=2, ensure_ascii=False)
+        write_json_array(filename, self.jobs_data)
         print(f"Data saved to {filename}")
     
     def save_to_csv(self, filename="mrp_jobs_simple.csv"):
         """Save scraped data to CSV file"""
         if self.jobs_data:
-            df = pd.DataFrame(self.jobs_data)
-            df.to_csv(filename, index=False, encoding='utf-8')
+            write_csv(filename, self.jobs_data, CSV_COLUMNS)
             print(f"Data saved to {filename}")
         else:
             print("No data to save to CSV")
@@ -197,20 +418,76 @@ class SimpleLinkedInScraper:
             for i, job in enumerate(self.jobs_data, 1):
                 print(f"{i}. {job.get('title', 'N/A')} - {job.get('location', 'N/A')}")
         
+        if self.cache:
+            self.cache.print_summary()
+        self.policy.print_summary()
+        
         print(f"\n=== END SUMMARY ===")
 
 def main():
     """Main function to run the simple scraper"""
-    scraper = SimpleLinkedInScraper()
+    parser = argparse.ArgumentParser(description="Scrape Powered By MRP job listings without a browser")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="crawl the paginated guest listing API and detail pages concurrently")
+    parser.add_argument("--rate", type=float, default=5.0, help="max requests per second in async mode")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="max concurrent requests in async mode")
+    parser.add_argument("--cache-dir", default=".http_cache", help="conditional-GET response cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="always download every page")
+    parser.add_argument("--parser", choices=["lxml", "html.parser"], default=None,
+                        help="HTML tree builder (default: lxml when installed)")
+    parser.add_argument("--titles", metavar="FILE",
+                        help="job titles to look for in page text, one per line")
+    parser.add_argument("--max-attempts", type=int, default=4,
+                        help="tries per URL before giving up on 429/999/5xx answers and network errors")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", metavar="ARCHIVE", help="save every fetched response to a fixture archive")
+    fixtures.add_argument("--replay", metavar="ARCHIVE",
+                          help="serve responses from a fixture archive on localhost instead of linkedin.com")
+    parser.add_argument("--history", metavar="DIR",
+                        help="also append this run's jobs to a Parquet job-history store")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    configure_metrics(args)
+    
+    # Stream each job to mrp_jobs_simple.jsonl / .csv as it completes; the JSON array is written at the end
+    sink = StreamingJobSink("mrp_jobs_simple.json", "mrp_jobs_simple.csv", CSV_COLUMNS)
+    recorder = FixtureArchive(args.record, 'w') if args.record else None
+    replay = ReplayServer(FixtureArchive(args.replay)).start() if args.replay else None
+    use_cache = not (args.no_cache or replay)
+    scraper = SimpleLinkedInScraper(cache_dir=args.cache_dir if use_cache else None, parser=args.parser,
+                                    titles_file=args.titles, sink=sink, recorder=recorder,
+                                    policy=FetchPolicy(RetryPolicy(max_attempts=args.max_attempts)))
+    fetcher_options = {'rate': args.rate, 'max_in_flight': args.max_in_flight}
+    if replay:
+        scraper.base_url = replay.url_for(scraper.base_url)
+        fetcher_options.update(listing_url=replay.url_for(GUEST_LISTING_URL),
+                               detail_url=replay.url_for(GUEST_DETAIL_URL), http2=False)
     
     try:
-        scraper.scrape_jobs()
+        if args.use_async:
+            scraper.scrape_jobs_async(**fetcher_options)
+        else:
+            scraper.scrape_jobs()
         scraper.print_summary()
-        scraper.save_to_json()
-        scraper.save_to_csv()
+        count = sink.finalize()
+        print(f"Data saved to mrp_jobs_simple.json and mrp_jobs_simple.csv ({count} jobs)")
+        if args.history:
+            from job_history import JobHistoryStore
+            print(f"History snapshot saved to {JobHistoryStore(args.history).append(scraper.jobs_data)}")
+        export_metrics(args)
         
     except Exception as e:
         print(f"Error in main: {e}")
+    finally:
+        sink.close()
+        if scraper.cache:
+            scraper.cache.close()
+        if recorder:
+            recorder.close()
+            print(f"Recorded {len(recorder.index)} responses to {args.record}")
+        if replay:
+            replay.stop()
+            replay.archive.close()
 
 if __name__ == "__main__":
     main()
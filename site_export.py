@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Sharded, precompressed job data for the careers site
+Writes a slim listing with only the fields the job cards show plus one content-hashed
+detail file per job, each with gzip and brotli siblings, and a manifest of every file's
+hash and sizes; files whose content hash hasn't changed since the last export are left alone
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import time
+
+EXPORT_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+# The listing keeps a fixed name so the site can find it (served with revalidation);
+# detail shards carry their content hash and can be cached forever
+LISTING_NAME = 'index.json'
+DETAILS_DIR = 'details'
+DEFAULT_EXPORT_DIR = 'public/jobs'
+DEFAULT_BASE_URL = '/jobs/'
+HASH_CHARS = 12
+# The card clamps the description to three lines, so the listing only carries its start
+EXCERPT_CHARS = 280
+LISTING_FIELDS = (
+    'id', 'title', 'department', 'location', 'type', 'salary_min', 'salary_max', 'currency',
+    'remote', 'locations', 'employment_type', 'posted_at', 'apply_url',
+)
+SAFE_NAME_RE = re.compile(r'[^A-Za-z0-9_-]+')
+
+def brotli_available():
+    return importlib.util.find_spec('brotli') is not None
+
+def encode(record):
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_CHARS]
+
+def compressed_variants(data, brotli_enabled=True):
+    """{'.gz': bytes, '.br': bytes}, skipping brotli when it isn't installed"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli_enabled and brotli_available():
+        import brotli
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+def excerpt(text, limit=EXCERPT_CHARS):
+    """The start of text cut at a word boundary"""
+    text = ' '.join((text or '').split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(' ', 1)[0].rstrip(',;:.') + '…'
+
+def listing_record(job, detail_url):
+    record = {field: job[field] for field in LISTING_FIELDS if field in job}
+    record['description_md'] = excerpt(job.get('description_md'))
+    record['detail'] = detail_url
+    return record
+
+def write_file(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class ShardedExport:
+    """Writes and incrementally refreshes the sharded export in one directory"""
+
+    def __init__(self, directory=DEFAULT_EXPORT_DIR, base_url=DEFAULT_BASE_URL, compress=True):
+        self.directory = directory
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.compress = compress
+        self.encodings = set(compressed_variants(b'')) if compress else set()
+        self.previous = self.load_manifest()
+        self.stats = {}
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if manifest.get('version') == EXPORT_VERSION else {}
+
+    def unchanged(self, entry):
+        """True if a previous manifest entry has the current encodings and its files are all still on disk"""
+        if set(entry.get('encodings', ())) != self.encodings:
+            return False
+        names = [entry['file']] + [entry['file'] + suffix for suffix in entry['encodings']]
+        return all(os.path.exists(os.path.join(self.directory, name)) for name in names)
+
+    def shard(self, name, data, previous=None):
+        """Manifest entry for one file, writing it and its variants only if the content hash changed"""
+        digest = content_hash(data)
+        if previous and previous.get('hash') == digest and self.unchanged(previous):
+            self.stats['unchanged'] += 1
+            return previous
+        name = name.format(hash=digest)
+        entry = {'file': name, 'hash': digest, 'bytes': len(data), 'encodings': {}}
+        write_file(os.path.join(self.directory, name), data)
+        self.stats['bytes_written'] += len(data)
+        if self.compress:
+            for suffix, variant in compressed_variants(data).items():
+                write_file(os.path.join(self.directory, name + suffix), variant)
+                entry['encodings'][suffix] = len(variant)
+                self.stats['bytes_written'] += len(variant)
+        self.stats['written'] += 1
+        return entry
+
+    def export(self, jobs):
+        """Write the export for jobs; returns the new manifest"""
+        start = time.perf_counter()
+        self.stats = {'written': 0, 'unchanged': 0, 'removed': 0, 'bytes_written': 0}
+        os.makedirs(os.path.join(self.directory, DETAILS_DIR), exist_ok=True)
+        previous_jobs = self.previous.get('jobs', {})
+
+        details, listing, stems = {}, [], set()
+        for job in jobs:
+            stem = SAFE_NAME_RE.sub('-', str(job['id'])).strip('-') or 'job'
+            if stem in stems:
+                stem = f"{stem}-{content_hash(str(job['id']).encode('utf-8'))[:6]}"
+            stems.add(stem)
+            name = f"{DETAILS_DIR}/{stem}.{{hash}}.json"
+            entry = self.shard(name, encode(job), previous_jobs.get(job['id']))
+            details[job['id']] = entry
+            listing.append(listing_record(job, self.base_url + entry['file']))
+
+        # Detail shards are in place before the listing that links to them is replaced
+        manifest = {
+            'version': EXPORT_VERSION,
+            'base_url': self.base_url,
+            'count': len(jobs),
+            'listing': self.shard(LISTING_NAME, encode(listing), self.previous.get('listing')),
+            'jobs': details,
+        }
+        write_file(self.manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+        self.remove_stale(manifest)
+        self.previous = manifest
+        self.stats['seconds'] = time.perf_counter() - start
+        return manifest
+
+    def remove_stale(self, manifest):
+        """Delete detail shards the new manifest no longer references"""
+        keep = set()
+        for entry in manifest['jobs'].values():
+            keep.add(entry['file'])
+            keep.update(entry['file'] + suffix for suffix in entry['encodings'])
+        for name in os.listdir(os.path.join(self.directory, DETAILS_DIR)):
+            path = f"{DETAILS_DIR}/{name}"
+            if path not in keep and name.endswith(('.json', '.json.gz', '.json.br')):
+                os.remove(os.path.join(self.directory, path))
+                self.stats['removed'] += 1
+
+    def report(self, manifest):
+        """Total and first-load (listing only) bytes per encoding"""
+        entries = [manifest['listing'], *manifest['jobs'].values()]
+        report = {'files': len(entries), 'seconds': self.stats.get('seconds', 0.0)}
+        for suffix, label in (('', 'raw'), ('.gz', 'gzip'), ('.br', 'brotli')):
+            sizes = [entry['bytes'] if not suffix else entry['encodings'].get(suffix) for entry in entries]
+            if None not in sizes:
+                report[label] = {'total_bytes': sum(sizes), 'first_load_bytes': sizes[0]}
+        return report
+
+def export_single(jobs, path, compress=True):
+    """The unsharded jobs.json the site bundles today, with its compressed sizes, for comparison"""
+    start = time.perf_counter()
+    data = encode(jobs)
+    write_file(path, data)
+    report = {'files': 1, 'raw': {'total_bytes': len(data), 'first_load_bytes': len(data)}}
+    if compress:
+        for suffix, variant in compressed_variants(data).items():
+            label = 'gzip' if suffix == '.gz' else 'brotli'
+            report[label] = {'total_bytes': len(variant), 'first_load_bytes': len(variant)}
+    report['seconds'] = time.perf_counter() - start
+    return report
+
+def print_report(reports):
+    print("\n=== SITE EXPORT ===")
+    print(f"{'mode':<20} {'files':>6} {'seconds':>8} {'encoding':>9} {'total bytes':>12} {'first load':>11}")
+    for mode, report in reports.items():
+        for label in ('raw', 'gzip', 'brotli'):
+            if label in report:
+                sizes = report[label]
+                print(f"{mode:<20} {report['files']:>6} {report['seconds']:>8.3f} {label:>9} "
+                      f"{sizes['total_bytes']:>12,} {sizes['first_load_bytes']:>11,}")
+
+def main():
+    """Export jobs.json as sharded site data"""
+    parser = argparse.ArgumentParser(description="Write the careers site's sharded, precompressed job data")
+    parser.add_argument("jobs", nargs="?", default="src/data/jobs.json", help="site-schema jobs JSON array")
+    parser.add_argument("--output-dir", default=DEFAULT_EXPORT_DIR)
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="URL path the output directory is served from")
+    parser.add_argument("--no-compress", action="store_true", help="skip the .gz/.br variants")
+    args = parser.parse_args()
+
+    with open(args.jobs, encoding='utf-8') as f:
+        jobs = json.load(f)
+    if not brotli_available() and not args.no_compress:
+        print("brotli is not installed; writing gzip variants only")
+
+    exporter = ShardedExport(args.output_dir, args.base_url, compress=not args.no_compress)
+    manifest = exporter.export(jobs)
+    stats = exporter.stats
+    print(f"✅ Exported {manifest['count']} jobs to {args.output_dir}: {stats['written']} files written, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} stale files removed")
+    print_report({'sharded': exporter.report(manifest)})
+
+if __name__ == "__main__":
+    main()
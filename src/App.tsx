@@ -11,17 +11,20 @@ import HiringProcess from './components/HiringProcess'
 import FAQ from './components/FAQ'
 import Footer from './components/Footer'
 import JobDetail from './components/JobDetail'
-import type { Job, Company, Review, Testimonial } from './types'
+import type { JobSummary, Company, Review, Testimonial } from './types'
 
 function App() {
-  const [jobs, setJobs] = useState<Job[]>([])
+  const [jobs, setJobs] = useState<JobSummary[]>([])
   const [company, setCompany] = useState<Company | null>(null)
   const [, setReviews] = useState<Review[]>([])
   const [testimonials, setTestimonials] = useState<Testimonial[]>([])
 
   useEffect(() => {
-    // Load data
-    import('./data/jobs.json').then(module => setJobs(module.default))
+    // Load data; jobs come from the sharded export in public/jobs when it has been built
+    fetch('/jobs/index.json')
+      .then(response => response.ok ? response.json() : Promise.reject(response.status))
+      .then((listing: JobSummary[]) => setJobs(listing))
+      .catch(() => import('./data/jobs.json').then(module => setJobs(module.default)))
     import('./data/company.json').then(module => setCompany(module.default))
     import('./data/reviews.json').then(module => setReviews(module.default))
     import('./data/testimonials.json').then(module => setTestimonials(module.default))
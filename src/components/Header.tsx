@@ -1,9 +1,9 @@
 import { useState } from 'react'
 import ReferralModal from './ReferralModal'
-import type { Job } from '../types'
+import type { JobSummary } from '../types'
 
 interface HeaderProps {
-  jobs: Job[]
+  jobs: JobSummary[]
 }
 
 export default function Header({ jobs }: HeaderProps) {
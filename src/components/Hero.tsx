@@ -1,10 +1,10 @@
 import { useState } from 'react'
-import type { Company, Job } from '../types'
+import type { Company, JobSummary } from '../types'
 import ReferralModal from './ReferralModal'
 
 interface HeroProps {
   company: Company | null
-  jobs: Job[]
+  jobs: JobSummary[]
 }
 
 export default function Hero({ jobs }: HeroProps) {
@@ -1,10 +1,10 @@
 import { useState } from 'react'
 import { Link } from 'react-router-dom'
-import type { Job } from '../types'
+import type { JobSummary } from '../types'
 import ReferralModal from './ReferralModal'
 
 interface JobCardProps {
-  job: Job
+  job: JobSummary
 }
 
 export default function JobCard({ job }: JobCardProps) {
@@ -1,14 +1,39 @@
+import { useState, useEffect } from 'react'
 import { useParams, Link } from 'react-router-dom'
-import type { Job, Company } from '../types'
+import type { Job, JobSummary, Company } from '../types'
 
 interface JobDetailProps {
-  jobs: Job[]
+  jobs: JobSummary[]
   company: Company | null
 }
 
 export default function JobDetail({ jobs, company }: JobDetailProps) {
   const { id } = useParams<{ id: string }>()
-  const job = jobs.find(j => j.id === id)
+  const summary = jobs.find(j => j.id === id)
+  const [loaded, setLoaded] = useState<Job | null>(null)
+  const [loadFailed, setLoadFailed] = useState(false)
+
+  // Listings from the sharded export only carry card fields; fetch the full job on open
+  useEffect(() => {
+    if (!summary?.detail) {
+      return
+    }
+    setLoadFailed(false)
+    fetch(summary.detail)
+      .then(response => response.ok ? response.json() : Promise.reject(response.status))
+      .then((job: Job) => setLoaded(job))
+      .catch(() => setLoadFailed(true))
+  }, [summary?.detail])
+
+  const job = summary && !summary.detail ? (summary as Job) : loaded?.id === id ? loaded : undefined
+
+  if (summary && !job && !loadFailed) {
+    return (
+      <div className="min-h-screen bg-white flex items-center justify-center">
+        <p className="text-gray-600">Loading {summary.title}…</p>
+      </div>
+    )
+  }
 
   if (!job) {
     return (
@@ -34,6 +59,10 @@ export default function JobDetail({ jobs, company }: JobDetailProps) {
     return requirements.split('\n').filter(req => req.trim())
   }
 
+  const similarJobs = (job.similar_job_ids ?? [])
+    .map(similarId => jobs.find(j => j.id === similarId))
+    .filter((similar): similar is JobSummary => similar !== undefined)
+
   return (
     <div className="min-h-screen bg-white">
       {/* Header */}
@@ -197,6 +226,22 @@ export default function JobDetail({ jobs, company }: JobDetailProps) {
                   Apply for this role
                 </a>
               </div>
+
+              {similarJobs.length > 0 && (
+                <div className="mt-8">
+                  <h3 className="text-lg font-semibold text-gray-900 mb-4">Similar roles</h3>
+                  <ul className="space-y-3">
+                    {similarJobs.map(similar => (
+                      <li key={similar.id}>
+                        <Link to={`/careers/${similar.id}`} className="text-mrp-600 hover:text-mrp-700 font-medium">
+                          {similar.title}
+                        </Link>
+                        <p className="text-sm text-gray-500">{similar.location}</p>
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              )}
             </div>
           </div>
         </div>
@@ -1,13 +1,18 @@
 import { useState, useEffect } from 'react'
-import type { Job } from '../types'
+import type { JobSummary } from '../types'
+import { SearchIndex } from '../searchIndex'
+import type { SearchIndexData } from '../searchIndex'
 import JobCard from './JobCard'
 
 interface JobListingsProps {
-  jobs: Job[]
+  jobs: JobSummary[]
 }
 
 export default function JobListings({ jobs }: JobListingsProps) {
-  const [filteredJobs, setFilteredJobs] = useState<Job[]>([])
+  const [filteredJobs, setFilteredJobs] = useState<JobSummary[]>([])
+  const [searchIndex, setSearchIndex] = useState<SearchIndex | null>(null)
+  const [indexRequested, setIndexRequested] = useState(false)
+  const [query, setQuery] = useState('')
   const [selectedDepartment, setSelectedDepartment] = useState('All')
   const [selectedLocation, setSelectedLocation] = useState('All')
   const [selectedType, setSelectedType] = useState('All')
@@ -16,7 +21,33 @@ export default function JobListings({ jobs }: JobListingsProps) {
   const locations = ['All', ...Array.from(new Set(jobs.map(job => job.location)))]
   const types = ['All', ...Array.from(new Set(jobs.map(job => job.type)))]
 
+  const searching = query.trim() !== '' || selectedDepartment !== 'All' || selectedLocation !== 'All'
+    || selectedType !== 'All'
+
+  // Built by search_index.py alongside jobs.json. Fetched the first time someone searches or filters,
+  // so page views that never do don't download it; until it loads (or if it's stale) filter by scanning
+  useEffect(() => {
+    if (!searching || indexRequested) {
+      return
+    }
+    setIndexRequested(true)
+    import('../data/search-index.json')
+      .then(module => setSearchIndex(new SearchIndex(module.default as SearchIndexData)))
+      .catch(() => setSearchIndex(null))
+  }, [searching, indexRequested])
+
   const handleFilter = () => {
+    const filters = { department: selectedDepartment, location: selectedLocation, type: selectedType }
+
+    if (searchIndex && searchIndex.ids.length === jobs.length) {
+      const jobsById = new Map(jobs.map(job => [job.id, job]))
+      const matches = searchIndex.search(query, filters).map(id => jobsById.get(id))
+      if (matches.every(job => job !== undefined)) {
+        setFilteredJobs(matches as JobSummary[])
+        return
+      }
+    }
+
     let filtered = jobs
 
     if (selectedDepartment !== 'All') {
@@ -31,15 +62,22 @@ export default function JobListings({ jobs }: JobListingsProps) {
       filtered = filtered.filter(job => job.type === selectedType)
     }
 
+    const needle = query.trim().toLowerCase()
+    if (needle) {
+      filtered = filtered.filter(job =>
+        [job.title, job.description_md, job.requirements_md].some(text => text?.toLowerCase().includes(needle))
+      )
+    }
+
     setFilteredJobs(filtered)
   }
 
-  // Update filtered jobs when jobs data or filters change
+  // Update filtered jobs when jobs data, the index, the query or filters change
   useEffect(() => {
     if (jobs.length > 0) {
       handleFilter()
     }
-  }, [jobs, selectedDepartment, selectedLocation, selectedType])
+  }, [jobs, searchIndex, query, selectedDepartment, selectedLocation, selectedType])
 
   return (
     <section id="jobs" className="py-20 bg-dark-600">
@@ -55,6 +93,15 @@ export default function JobListings({ jobs }: JobListingsProps) {
 
         {/* Filters */}
         <div className="flex flex-wrap gap-4 justify-center mb-12">
+          <input
+            type="search"
+            value={query}
+            onChange={(e) => setQuery(e.target.value)}
+            placeholder="Search roles"
+            aria-label="Search roles"
+            className="px-4 py-2 bg-dark-700 border border-dark-500 rounded-lg text-white placeholder-gray-400 focus:ring-2 focus:ring-accent-500 focus:border-accent-500"
+          />
+
           <select
             value={selectedDepartment}
             onChange={(e) => setSelectedDepartment(e.target.value)}
@@ -98,6 +145,7 @@ export default function JobListings({ jobs }: JobListingsProps) {
             <p className="text-gray-400 text-lg">No jobs match your current filters.</p>
             <button
               onClick={() => {
+                setQuery('')
                 setSelectedDepartment('All')
                 setSelectedLocation('All')
                 setSelectedType('All')
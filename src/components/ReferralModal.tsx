@@ -1,10 +1,10 @@
 import { useState } from 'react'
-import type { Job } from '../types'
+import type { JobSummary } from '../types'
 
 interface ReferralModalProps {
   isOpen: boolean
   onClose: () => void
-  jobs: Job[]
+  jobs: JobSummary[]
   selectedJobId?: string
 }
 
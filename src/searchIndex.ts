@@ -0,0 +1,181 @@
+// Client for the search index built by search_index.py: filters are bitset intersections
+// and text search sums precomputed BM25 weights over the query terms' postings
+
+export interface SearchIndexData {
+  version: number
+  count: number
+  ids: string[]
+  scale: number
+  stopwords: string[]
+  terms: string[]
+  postings: string[]
+  weights: string[]
+  facets: Record<string, Record<string, string>>
+}
+
+export type SearchFilters = Record<string, string | boolean | undefined>
+
+const PREFIX_EXPANSIONS = 20
+
+function decodeBase64(text: string): Uint8Array {
+  const binary = atob(text)
+  const bytes = new Uint8Array(binary.length)
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i)
+  }
+  return bytes
+}
+
+// Delta-coded LEB128 varints -> ascending doc numbers
+function decodePostings(bytes: Uint8Array): Uint32Array {
+  const docs: number[] = []
+  let doc = 0
+  let value = 0
+  let shift = 0
+  for (const byte of bytes) {
+    value += (byte & 0x7f) * 2 ** shift
+    if (byte & 0x80) {
+      shift += 7
+    } else {
+      doc += value
+      docs.push(doc)
+      value = 0
+      shift = 0
+    }
+  }
+  return Uint32Array.from(docs)
+}
+
+export class SearchIndex {
+  private data: SearchIndexData
+  private stopwords: Set<string>
+  private termIds = new Map<string, number>()
+  private decoded = new Map<number, { docs: Uint32Array; weights: Uint8Array }>()
+  private facets = new Map<string, Uint8Array>()
+
+  constructor(data: SearchIndexData) {
+    this.data = data
+    this.stopwords = new Set(data.stopwords)
+    data.terms.forEach((term, i) => this.termIds.set(term, i))
+  }
+
+  get ids(): string[] {
+    return this.data.ids
+  }
+
+  // Must match search_index.tokenize
+  tokenize(text: string): string[] {
+    const ascii = text.normalize('NFKD').replace(/[^\x00-\x7f]/g, '').toLowerCase()
+    return (ascii.match(/[a-z0-9]{2,}/g) ?? []).filter(token => !this.stopwords.has(token))
+  }
+
+  private postings(term: number) {
+    let entry = this.decoded.get(term)
+    if (!entry) {
+      entry = {
+        docs: decodePostings(decodeBase64(this.data.postings[term])),
+        weights: decodeBase64(this.data.weights[term]),
+      }
+      this.decoded.set(term, entry)
+    }
+    return entry
+  }
+
+  private facetBits(facet: string, value: string): Uint8Array | undefined {
+    const key = `${facet}\u0000${value}`
+    let bits = this.facets.get(key)
+    if (!bits) {
+      const encoded = this.data.facets[facet]?.[value]
+      if (encoded === undefined) {
+        return undefined
+      }
+      bits = decodeBase64(encoded)
+      this.facets.set(key, bits)
+    }
+    return bits
+  }
+
+  // The last query word also matches as a prefix while it is still being typed
+  private expand(token: string, prefix: boolean): number[] {
+    if (!prefix) {
+      const term = this.termIds.get(token)
+      return term === undefined ? [] : [term]
+    }
+    const terms = this.data.terms
+    let low = 0
+    let high = terms.length
+    while (low < high) {
+      const mid = (low + high) >> 1
+      if (terms[mid] < token) {
+        low = mid + 1
+      } else {
+        high = mid
+      }
+    }
+    const matches: number[] = []
+    for (let i = low; i < terms.length && matches.length < PREFIX_EXPANSIONS && terms[i].startsWith(token); i++) {
+      matches.push(i)
+    }
+    return matches
+  }
+
+  // Packed bitset of the docs matching every filter; null when nothing is filtered
+  private filterMask(filters: SearchFilters): Uint8Array | null {
+    let mask: Uint8Array | null = null
+    for (const [facet, raw] of Object.entries(filters)) {
+      if (raw === undefined || raw === '' || raw === 'All') {
+        continue
+      }
+      const bits = this.facetBits(facet, String(raw))
+      if (!bits) {
+        return new Uint8Array((this.data.count + 7) >> 3)
+      }
+      if (mask === null) {
+        mask = bits.slice()
+      } else {
+        for (let i = 0; i < mask.length; i++) {
+          mask[i] &= bits[i]
+        }
+      }
+    }
+    return mask
+  }
+
+  // Job ids matching the filters, ranked by BM25 when there is a query, else in export order
+  search(query: string, filters: SearchFilters = {}): string[] {
+    const { count, ids, scale } = this.data
+    const mask = this.filterMask(filters)
+    const inMask = (doc: number) => mask === null || (mask[doc >> 3] & (1 << (doc & 7))) !== 0
+    const tokens = this.tokenize(query)
+
+    if (tokens.length === 0) {
+      const matches: string[] = []
+      for (let doc = 0; doc < count; doc++) {
+        if (inMask(doc)) {
+          matches.push(ids[doc])
+        }
+      }
+      return matches
+    }
+
+    const scores = new Float32Array(count)
+    const prefixLast = query === query.trimEnd()
+    tokens.forEach((token, position) => {
+      for (const term of this.expand(token, prefixLast && position === tokens.length - 1)) {
+        const { docs, weights } = this.postings(term)
+        for (let i = 0; i < docs.length; i++) {
+          scores[docs[i]] += weights[i] * scale
+        }
+      }
+    })
+
+    const hits: number[] = []
+    for (let doc = 0; doc < count; doc++) {
+      if (scores[doc] > 0 && inMask(doc)) {
+        hits.push(doc)
+      }
+    }
+    hits.sort((a, b) => scores[b] - scores[a] || a - b)
+    return hits.map(doc => ids[doc])
+  }
+}
@@ -1,6 +1,7 @@
 export interface Job {
   id: string
   title: string
+  company?: string
   department: string
   location: string
   type: string
@@ -16,12 +17,21 @@ export interface Job {
   locations: string[]
   employment_type: string
   benefits?: string[]
+  // Ids of the most similar postings, best first (job_similarity.py)
+  similar_job_ids?: string[]
   contact_info?: {
     email: string
     phone: string
   }
 }
 
+// Listing entry from the sharded site export (site_export.py): the card fields, the start
+// of the description and where to fetch the full job
+export type JobSummary = Omit<Job, 'requirements_md' | 'nice_to_haves_md' | 'benefits' | 'contact_info'> & {
+  requirements_md?: string
+  detail?: string
+}
+
 export interface Company {
   company_name: string
   industry: string